@@ -1,15 +1,26 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Optional
 
-class AuthDTO(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AuthDTO:
     uid: str
     email: str
 
-class LoginDTO(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class LoginDTO:
     uid: str
     email: str
     id_token: str
     refresh_token: str
 
-class TokenDTO(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TokenDTO:
     id_token: str
-    refresh_token: str
\ No newline at end of file
+    refresh_token: str
+
+@dataclass(slots=True, kw_only=True)
+class VerifiedTokenDTO:
+    uid: str
+    email: Optional[str] = None
+    expires_at: int
+    claims: dict
@@ -1,36 +1,128 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from app.domain.entities.user import User
 from app.shared.enums import PianoLevel
 
 
-class CreateUserDTO(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class CreateUserDTO:
     """DTO for creating user"""
-    uid: str = Field(..., min_length=1, description="Firebase UID")
-    email: str = Field(..., min_length=5, description="Email del usuario")
-    name: str = Field(..., min_length=2, max_length=100, description="Nombre del usuario")
-    piano_level: PianoLevel = Field(..., description="Nivel de piano")
-    
-    @validator('email')
-    def validate_email(cls, v):
-        if '@' not in v:
+    uid: str
+    email: str
+    name: str
+    piano_level: PianoLevel
+
+    def __post_init__(self):
+        self.email = self.email.lower().strip()
+        self.name = self.name.strip()
+        if '@' not in self.email:
             raise ValueError('Email must contain @')
-        return v.lower().strip()
-    
-    @validator('name')
-    def validate_name(cls, v):
-        return v.strip()
 
-class UserResponseDTO(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UserResponseDTO:
     """DTO for user response"""
     uid: str
     email: str
     name: str
     piano_level: str
-    
-    class Config:
-        from_attributes = True
 
+    @classmethod
+    def from_entity(cls, user: User) -> "UserResponseDTO":
+        return cls(uid=user.uid, email=user.email, name=user.name, piano_level=user.piano_level.value)
+
+    def to_dict(self) -> dict:
+        return {"uid": self.uid, "email": self.email, "name": self.name, "piano_level": self.piano_level}
+
+
+@dataclass(slots=True, kw_only=True)
+class UserPageDTO:
+    """DTO for a page of users"""
+    items: List[UserResponseDTO]
+    next_cursor: Optional[str] = None
 
-class UpdateUserDTO(BaseModel):
+    def to_dict(self) -> dict:
+        return {"items": [item.to_dict() for item in self.items], "next_cursor": self.next_cursor}
+
+
+@dataclass(slots=True, kw_only=True)
+class UsersByUidDTO:
+    """DTO for a batch lookup of users"""
+    users: Dict[str, UserResponseDTO]
+    missing: List[str]
+
+    def to_dict(self) -> dict:
+        return {"users": {uid: user.to_dict() for uid, user in self.users.items()}, "missing": self.missing}
+
+
+@dataclass(slots=True, kw_only=True)
+class UpdateUserDTO:
     """DTO for updating user"""
-    piano_level: Optional[PianoLevel] = Field(None, description="Nivel de piano")
\ No newline at end of file
+    piano_level: Optional[PianoLevel] = None
+
+@dataclass(slots=True, kw_only=True)
+class BulkStudentDTO:
+    """DTO for one student of a bulk onboarding"""
+    email: str
+    password: str
+    name: str
+    piano_level: PianoLevel
+
+
+@dataclass(slots=True, kw_only=True)
+class BulkRowResultDTO:
+    """DTO for the outcome of one row of a bulk onboarding"""
+    index: int
+    email: str
+    uid: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "email": self.email,
+            "uid": self.uid,
+            "success": self.success,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class BulkRegisterResultDTO:
+    """DTO for the outcome of a bulk onboarding"""
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    results: List[BulkRowResultDTO]
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "elapsed_seconds": self.elapsed_seconds,
+            "rows_per_second": self.rows_per_second,
+            "results": [result.to_dict() for result in self.results],
+        }
+
+
+@dataclass(slots=True, kw_only=True)
+class IngestRowDTO:
+    """DTO for one line of a streaming ingest: a parsed user or the reason it was rejected"""
+    line: int
+    user: Optional[CreateUserDTO] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True, kw_only=True)
+class IngestLineResultDTO:
+    """DTO for the outcome of one line of a streaming ingest"""
+    line: int
+    uid: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {"line": self.line, "uid": self.uid, "success": self.success, "error": self.error}
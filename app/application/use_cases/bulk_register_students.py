@@ -0,0 +1,122 @@
+import time
+import logging
+from typing import List, Optional
+from app.application.dto.user_dto import BulkRegisterResultDTO, BulkRowResultDTO, BulkStudentDTO
+from app.core.config import settings
+from app.core.exceptions import UserServiceException
+from app.domain.entities.bulk_import import AccountCredentials
+from app.domain.entities.user import User
+from app.domain.services.auth_service import AuthService
+from app.domain.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+
+class BulkRegisterStudentsUseCase:
+    """Use case for onboarding a batch of students (Firebase account + Student row)"""
+
+    def __init__(self, auth_service: AuthService, user_service: UserService):
+        self.auth_service = auth_service
+        self.user_service = user_service
+
+    async def execute(self, students: List[BulkStudentDTO]) -> BulkRegisterResultDTO:
+        started_at = time.perf_counter()
+        logger.info("Bulk onboarding %s students", len(students))
+
+        results: List[Optional[BulkRowResultDTO]] = [None] * len(students)
+        pending = []
+        seen_emails = set()
+        for index, student in enumerate(students):
+            email = student.email.lower().strip()
+            if email in seen_emails:
+                results[index] = self._failed(index, email, "Duplicate email in batch")
+                continue
+            seen_emails.add(email)
+            pending.append(index)
+
+        chunk_size = settings.BULK_IMPORT_CHUNK_SIZE
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            try:
+                await self._onboard_chunk(students, chunk, results)
+            except UserServiceException as e:
+                logger.warning("Bulk onboarding chunk of %s students failed: %s", len(chunk), e.message)
+                for index in chunk:
+                    results[index] = self._failed(index, students[index].email, e.message)
+            except Exception as e:
+                logger.error("Unexpected error onboarding a chunk of %s students: %s", len(chunk), e)
+                for index in chunk:
+                    if results[index] is None:
+                        results[index] = self._failed(index, students[index].email, "Unexpected error")
+
+        elapsed = time.perf_counter() - started_at
+        succeeded = sum(1 for result in results if result.success)
+        logger.info("Bulk onboarding finished: %s/%s students in %.2fs", succeeded, len(students), elapsed)
+
+        return BulkRegisterResultDTO(
+            total=len(students),
+            succeeded=succeeded,
+            failed=len(students) - succeeded,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(len(students) / elapsed, 1) if elapsed > 0 else 0.0,
+            results=results,
+        )
+
+    async def _onboard_chunk(self, students: List[BulkStudentDTO], chunk: List[int], results: list):
+        accounts = []
+        for index in chunk:
+            student = students[index]
+            accounts.append(AccountCredentials(
+                email=student.email.lower().strip(),
+                password=student.password,
+                display_name=student.name,
+            ))
+
+        imported = await self.auth_service.import_users(accounts)
+
+        try:
+            users = []
+            for index, outcome in zip(chunk, imported):
+                if not outcome.success:
+                    results[index] = self._failed(index, outcome.email, outcome.error)
+                    continue
+                student = students[index]
+                users.append((index, User(
+                    uid=outcome.uid,
+                    email=outcome.email,
+                    name=student.name,
+                    piano_level=student.piano_level,
+                )))
+
+            if not users:
+                return
+
+            try:
+                rejected = await self.user_service.create_users_bulk([user for _, user in users])
+            except UserServiceException as e:
+                rejected = {user.uid: e.message for _, user in users}
+        except BaseException:
+            # No Student row was written: an unexpected error or a cancellation must not leave the
+            # imported accounts behind, or retrying the batch fails with "email already exists"
+            await self._delete_accounts([outcome.uid for outcome in imported if outcome.success])
+            raise
+
+        if rejected:
+            # Do not leave Firebase accounts without a Student row
+            await self._delete_accounts(list(rejected))
+
+        for index, user in users:
+            if user.uid in rejected:
+                results[index] = self._failed(index, user.email, rejected[user.uid])
+            else:
+                results[index] = BulkRowResultDTO(index=index, email=user.email, uid=user.uid, success=True)
+
+    async def _delete_accounts(self, uids: List[str]):
+        try:
+            await self.auth_service.delete_users(uids)
+        except UserServiceException as e:
+            logger.error("Could not delete %s orphaned Firebase accounts: %s", len(uids), e.message)
+
+    @staticmethod
+    def _failed(index: int, email: str, error: str) -> BulkRowResultDTO:
+        return BulkRowResultDTO(index=index, email=email, success=False, error=error)
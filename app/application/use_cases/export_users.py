@@ -0,0 +1,31 @@
+import logging
+from typing import AsyncIterator
+from app.core.config import settings
+from app.core.exceptions import DatabaseConnectionException, ServiceUnavailableException, UserServiceException
+from app.domain.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+
+class ExportUsersUseCase:
+    """Use case for exporting every user as a stream"""
+
+    def __init__(self, user_service: UserService):
+        self.user_service = user_service
+
+    async def execute(self) -> AsyncIterator[dict]:
+        """Yields one dict per user, in UID order, as rows arrive from the database"""
+        exported = 0
+        try:
+            logger.info("Starting users export")
+            async for user in self.user_service.stream_users(settings.EXPORT_BATCH_SIZE):
+                exported += 1
+                yield user.to_dict()
+            logger.info("Users export finished: %s users", exported)
+
+        except (DatabaseConnectionException, ServiceUnavailableException) as e:
+            logger.warning("Users export failed after %s users: %s", exported, e.message)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error exporting users after %s users: %s", exported, e, exc_info=True)
+            raise UserServiceException(f"Unexpected error exporting users: {str(e)}")
@@ -1,6 +1,9 @@
-from typing import List
-from app.application.dto.user_dto import UserResponseDTO
+import base64
+import binascii
+from typing import List, Optional
+from app.application.dto.user_dto import UserPageDTO, UserResponseDTO, UsersByUidDTO
 from app.core.exceptions import (
+    InvalidUserDataException,
     UserNotFoundException,
     DatabaseConnectionException,
     UserServiceException,
@@ -8,7 +11,6 @@ from app.core.exceptions import (
 )
 import logging
 
-from app.shared.utils import parse_piano_level
 from app.domain.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
@@ -22,56 +24,98 @@ class GetUserUseCase:
 
     async def get_by_id(self, uid: str) -> UserResponseDTO:
         try:
-            logger.info(f"Fetching user with UID: {uid}")
+            logger.info("Fetching user with UID: %s", uid)
 
             user = await self.user_service.get_user_by_uid(uid)
-            
-            piano_level_value = parse_piano_level(user.piano_level)
 
-            user_response = UserResponseDTO(
-                uid=user.uid,
-                email=user.email,
-                name=user.name,
-                piano_level=piano_level_value,
-            )
+            user_response = UserResponseDTO.from_entity(user)
 
-            logger.info(f"User retrieved successfully: {uid}")
+            logger.info("User retrieved successfully: %s", uid)
             return user_response
 
         except UserNotFoundException as e:
-            logger.warning(f"User not found: {uid} - {str(e)}")
+            logger.warning("User not found: %s - %s", uid, e)
             raise
             
         except (DatabaseConnectionException, ValidationException) as e:
-            logger.warning(f"Error fetching user {uid}: {e}")
+            logger.warning("Error fetching user %s: %s", uid, e)
             raise
             
         except Exception as e:
-            logger.error(f"Unexpected error fetching user: {uid} - {str(e)}", exc_info=True)
+            logger.error("Unexpected error fetching user: %s - %s", uid, e, exc_info=True)
             raise UserServiceException(f"Unexpected error fetching user: {str(e)}")
 
+    async def get_many(self, uids: List[str]) -> UsersByUidDTO:
+        try:
+            logger.info("Fetching %s users by UID", len(uids))
+
+            users, missing = await self.user_service.get_users_by_uids(uids)
+
+            result = UsersByUidDTO(
+                users={uid: UserResponseDTO.from_entity(user) for uid, user in users.items()},
+                missing=missing,
+            )
+
+            logger.info("Retrieved %s users, %s missing", len(result.users), len(missing))
+            return result
+
+        except (DatabaseConnectionException, ValidationException) as e:
+            logger.warning("Error fetching users by UID: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error fetching users by UID: %s", e, exc_info=True)
+            raise UserServiceException(f"Unexpected error fetching users by UID: {str(e)}")
+
     async def get_all(self) -> List[UserResponseDTO]:
         try:
             logger.info("Fetching all users")
 
             users = await self.user_service.get_all_users()
 
-            user_responses = [
-                UserResponseDTO(
-                    uid=user.uid,
-                    email=user.email,
-                    name=user.name,
-                    piano_level=parse_piano_level(user.piano_level),
-                )
-                for user in users
-            ]
-
-            logger.info(f"Retrieved {len(user_responses)} users successfully")
+            user_responses = [UserResponseDTO.from_entity(user) for user in users]
+
+            logger.info("Retrieved %s users successfully", len(user_responses))
             return user_responses
 
         except (DatabaseConnectionException, ValidationException) as e:
-            logger.warning(f"Error fetching all users: {e}")
+            logger.warning("Error fetching all users: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching all users: {str(e)}", exc_info=True)
-            raise UserServiceException(f"Unexpected error fetching all users: {str(e)}")
\ No newline at end of file
+            logger.error("Unexpected error fetching all users: %s", e, exc_info=True)
+            raise UserServiceException(f"Unexpected error fetching all users: {str(e)}")
+
+    async def get_page(self, limit: int, cursor: Optional[str] = None) -> UserPageDTO:
+        try:
+            after_uid = self._decode_cursor(cursor) if cursor else None
+            logger.info("Fetching users page (limit=%s, after=%s)", limit, after_uid)
+
+            users, last_uid = await self.user_service.get_users_page(limit, after_uid)
+
+            page = UserPageDTO(
+                items=[UserResponseDTO.from_entity(user) for user in users],
+                next_cursor=self._encode_cursor(last_uid) if last_uid else None,
+            )
+
+            logger.info("Retrieved page of %s users successfully", len(page.items))
+            return page
+
+        except (DatabaseConnectionException, ValidationException, InvalidUserDataException) as e:
+            logger.warning("Error fetching users page: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error fetching users page: %s", e, exc_info=True)
+            raise UserServiceException(f"Unexpected error fetching users page: {str(e)}")
+
+    @staticmethod
+    def _encode_cursor(uid: str) -> str:
+        return base64.urlsafe_b64encode(uid.encode()).rstrip(b"=").decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> str:
+        try:
+            uid = base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise ValidationException("Invalid cursor")
+        if not uid:
+            raise ValidationException("Invalid cursor")
+        return uid
@@ -0,0 +1,108 @@
+import asyncio
+import time
+import logging
+from typing import AsyncIterator, List
+from app.application.dto.user_dto import IngestLineResultDTO, IngestRowDTO
+from app.core.config import settings
+from app.core.exceptions import UserServiceException
+from app.domain.entities.user import User
+from app.domain.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+_END_OF_ROWS = object()
+
+
+class IngestUsersUseCase:
+    """Use case for ingesting a stream of user rows in multi-row batches"""
+
+    def __init__(self, user_service: UserService):
+        self.user_service = user_service
+
+    async def execute(self, rows: AsyncIterator[IngestRowDTO]) -> AsyncIterator[IngestLineResultDTO]:
+        """Yields one result per row, in input order. Only one batch is held in memory at a time.
+
+        A batch is flushed when it reaches INGEST_BATCH_SIZE rows or when its oldest row has
+        waited INGEST_FLUSH_INTERVAL, whether or not more rows arrive in the meantime.
+        """
+        batch: List[IngestRowDTO] = []
+        batch_uids = set()
+        batch_started_at = time.monotonic()
+        total = succeeded = 0
+        next_row = None
+
+        try:
+            while True:
+                if next_row is None:
+                    next_row = asyncio.ensure_future(anext(rows, _END_OF_ROWS))
+                if batch:
+                    remaining = settings.INGEST_FLUSH_INTERVAL - (time.monotonic() - batch_started_at)
+                    done, _ = await asyncio.wait({next_row}, timeout=max(remaining, 0))
+                    if not done:
+                        async for result in self._flush(batch):
+                            total += 1
+                            succeeded += result.success
+                            yield result
+                        batch, batch_uids = [], set()
+                        continue
+
+                row = await next_row
+                next_row = None
+                if row is _END_OF_ROWS:
+                    break
+
+                if row.user is not None:
+                    if row.user.uid in batch_uids:
+                        row = IngestRowDTO(line=row.line, error=f"Duplicate UID {row.user.uid} in batch")
+                    else:
+                        batch_uids.add(row.user.uid)
+                if not batch:
+                    batch_started_at = time.monotonic()
+                batch.append(row)
+
+                if len(batch) >= settings.INGEST_BATCH_SIZE:
+                    async for result in self._flush(batch):
+                        total += 1
+                        succeeded += result.success
+                        yield result
+                    batch, batch_uids = [], set()
+        finally:
+            if next_row is not None:
+                next_row.cancel()
+
+        async for result in self._flush(batch):
+            total += 1
+            succeeded += result.success
+            yield result
+
+        logger.info("Ingest finished: %s/%s rows stored", succeeded, total)
+
+    async def _flush(self, batch: List[IngestRowDTO]) -> AsyncIterator[IngestLineResultDTO]:
+        users = [
+            User(
+                uid=row.user.uid,
+                email=row.user.email,
+                name=row.user.name,
+                piano_level=row.user.piano_level
+            )
+            for row in batch if row.user is not None
+        ]
+
+        rejected = {}
+        if users:
+            try:
+                rejected = await self.user_service.create_users_bulk(users)
+            except UserServiceException as e:
+                logger.warning("Ingest batch of %s rows failed: %s", len(users), e.message)
+                rejected = {user.uid: e.message for user in users}
+            except Exception as e:
+                logger.error("Unexpected error ingesting a batch of %s rows: %s", len(users), e)
+                rejected = {user.uid: "Unexpected error" for user in users}
+
+        for row in batch:
+            if row.user is None:
+                yield IngestLineResultDTO(line=row.line, success=False, error=row.error)
+            elif row.user.uid in rejected:
+                yield IngestLineResultDTO(line=row.line, uid=row.user.uid, success=False, error=rejected[row.user.uid])
+            else:
+                yield IngestLineResultDTO(line=row.line, uid=row.user.uid, success=True)
@@ -1,7 +1,7 @@
 # app/application/use_cases/login_user.py
 from app.application.dto.auth_dto import LoginDTO
 from app.domain.services.auth_service import AuthService
-from app.core.exceptions import FirebaseAuthException, UserServiceException
+from app.core.exceptions import FirebaseAuthException, ServiceUnavailableException, UserServiceException
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +15,7 @@ class LoginUserUseCase:
 
     async def execute(self, email: str, password: str) -> LoginDTO:
         try:
-            logger.info(f"Logging in user: {email}")
+            logger.info("Logging in user: %s", email)
 
             # llamamos al dominio
             login_entity = await self.auth_service.login(email, password)
@@ -28,12 +28,15 @@ class LoginUserUseCase:
                 refresh_token=login_entity.refresh_token,
             )
 
-            logger.info(f"User logged in successfully: {email}")
+            logger.info("User logged in successfully: %s", email)
             return login_dto
 
         except FirebaseAuthException as e:
-            logger.warning(f"Firebase login failed: {e}")
+            logger.warning("Firebase login failed: %s", e)
+            raise
+        except ServiceUnavailableException as e:
+            logger.warning("Firebase unavailable during login: %s", e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error logging in user {email}: {str(e)}")
+            logger.error("Unexpected error logging in user %s: %s", email, e)
             raise UserServiceException(f"Unexpected error logging in user {email}: {str(e)}")
@@ -1,8 +1,13 @@
+import hashlib
 from app.application.dto.auth_dto import TokenDTO
-from app.core.exceptions import FirebaseAuthException, UserServiceException
+from app.core.config import settings
+from app.core.exceptions import FirebaseAuthException, ServiceUnavailableException, UserServiceException
 import logging
 
+from app.domain.entities.token import Token
 from app.domain.services.auth_service import AuthService
+from app.shared.cache import MISSING, TTLCache
+from app.shared.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -11,16 +16,47 @@ class RefreshTokenUseCase:
 
     def __init__(self, auth_service: AuthService):
         self.auth_service = auth_service
+        # Concurrent refreshes of the same token share one upstream call,
+        # and its result is reused for a short window to absorb retry storms
+        self._single_flight = SingleFlight()
+        self._recent = TTLCache(
+            max_size=settings.REFRESH_TOKEN_CACHE_MAX_SIZE,
+            ttl=settings.REFRESH_TOKEN_CACHE_TTL,
+        )
+        self.upstream_calls = 0
 
     async def execute(self, refresh_token: str) -> TokenDTO:
         try:
             logger.info("Refreshing Firebase token")
-            token_dto = await self.auth_service.refresh_token(refresh_token)
+            key = hashlib.sha256((refresh_token or "").encode()).hexdigest()
+            token_dto = self._recent.get(key)
+            if token_dto is MISSING:
+                token_dto = await self._single_flight.do(key, lambda: self._refresh(key, refresh_token))
             logger.info("Firebase token refreshed successfully")
             return token_dto
         except FirebaseAuthException as e:
-            logger.warning(f"Firebase token refresh failed: {e.message}")
+            logger.warning("Firebase token refresh failed: %s", e.message)
+            raise
+        except ServiceUnavailableException as e:
+            logger.warning("Firebase unavailable during token refresh: %s", e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error refreshing token: {str(e)}")
+            logger.error("Unexpected error refreshing token: %s", e)
             raise UserServiceException(f"Unexpected error refreshing token: {str(e)}")
+
+    def stats(self) -> dict:
+        cache = self._recent.stats()
+        flights = self._single_flight.stats()
+        return {
+            "upstream_calls": self.upstream_calls,
+            "cache_hits": cache["hits"],
+            "coalesced": flights["coalesced"],
+            "in_flight": flights["in_flight"],
+            "cached_tokens": cache["size"],
+        }
+
+    async def _refresh(self, key: str, refresh_token: str) -> Token:
+        self.upstream_calls += 1
+        token = await self.auth_service.refresh_token(refresh_token)
+        self._recent.set(key, token)
+        return token
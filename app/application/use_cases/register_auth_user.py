@@ -1,5 +1,5 @@
 from app.application.dto.auth_dto import AuthDTO
-from app.core.exceptions import FirebaseAuthException, UserAlreadyExistsException, UserServiceException
+from app.core.exceptions import FirebaseAuthException, ServiceUnavailableException, UserAlreadyExistsException, UserServiceException
 import logging
 
 from app.domain.services.auth_service import AuthService
@@ -14,16 +14,19 @@ class RegisterAuthUserUseCase:
 
     async def execute(self, email: str, password: str) -> AuthDTO:
         try:
-            logger.info(f"Registering user in Firebase: {email}")
+            logger.info("Registering user in Firebase: %s", email)
             auth_dto = await self.auth_service.register_user(email, password)
-            logger.info(f"User registered successfully in Firebase: {auth_dto.uid}")
+            logger.info("User registered successfully in Firebase: %s", auth_dto.uid)
             return auth_dto
         except UserAlreadyExistsException as e:
-            logger.warning(f"User already exists in Firebase: {e.message}")
+            logger.warning("User already exists in Firebase: %s", e.message)
             raise
         except FirebaseAuthException as e:
-            logger.warning(f"Firebase error creating user: {e.message}")
+            logger.warning("Firebase error creating user: %s", e.message)
+            raise
+        except ServiceUnavailableException as e:
+            logger.warning("Firebase unavailable creating user: %s", e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating Firebase user: {str(e)}")
+            logger.error("Unexpected error creating Firebase user: %s", e)
             raise UserServiceException(f"Unexpected error creating Firebase user: {str(e)}")
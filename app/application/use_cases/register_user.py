@@ -22,7 +22,7 @@ class RegisterUserUseCase:
 
     async def execute(self, create_user_dto: CreateUserDTO) -> UserResponseDTO:
         try:
-            logger.info(f"Initiating user registration for UID: {create_user_dto.uid}")
+            logger.info("Initiating user registration for UID: %s", create_user_dto.uid)
 
             # Convert DTO -> Domain Entity
             user_entity = User(
@@ -43,14 +43,14 @@ class RegisterUserUseCase:
                 piano_level=created_user.piano_level.value
             )
 
-            logger.info(f"User registered successfully: {created_user.uid}")
+            logger.info("User registered successfully: %s", created_user.uid)
             return user_response
 
         except (UserAlreadyExistsException, InvalidUserDataException,
                 DatabaseConnectionException, FirebaseAuthException,
                 ValidationException) as e:
-            logger.warning(f"Error registering user {create_user_dto.uid}: {e.message}")
+            logger.warning("Error registering user %s: %s", create_user_dto.uid, e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during user registration: {create_user_dto.uid} - {str(e)}")
+            logger.error("Unexpected error during user registration: %s - %s", create_user_dto.uid, e)
             raise UserServiceException(f"Unexpected error during registration: {str(e)}") 
@@ -13,7 +13,7 @@ class UpdateUserUseCase:
 
     async def execute(self, uid: str, update_user_dto: UpdateUserDTO) -> UserResponseDTO:
         try:
-            logger.info(f"Updating user with UID: {uid}")
+            logger.info("Updating user with UID: %s", uid)
 
             updated_user = await self.user_service.update_user(uid, update_user_dto)
 
@@ -24,12 +24,12 @@ class UpdateUserUseCase:
                 piano_level=updated_user.piano_level.value
             )
 
-            logger.info(f"User updated successfully: {uid}")
+            logger.info("User updated successfully: %s", uid)
             return user_response
 
         except (UserNotFoundException, InvalidUserDataException, DatabaseConnectionException) as e:
-            logger.warning(f"Error updating user {uid}: {e.message}")
+            logger.warning("Error updating user %s: %s", uid, e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during user update: {uid} - {str(e)}")
+            logger.error("Unexpected error during user update: %s - %s", uid, e)
             raise UserServiceException(f"Unexpected error during update: {str(e)}")
@@ -0,0 +1,37 @@
+from app.application.dto.auth_dto import VerifiedTokenDTO
+from app.core.exceptions import (
+    FirebaseAuthException,
+    InvalidUserDataException,
+    ServiceUnavailableException,
+    UserServiceException,
+)
+import logging
+
+from app.domain.services.auth_service import AuthService
+
+logger = logging.getLogger(__name__)
+
+class VerifyTokenUseCase:
+    """Use case for verifying a Firebase ID token locally"""
+
+    def __init__(self, auth_service: AuthService):
+        self.auth_service = auth_service
+
+    async def execute(self, id_token: str) -> VerifiedTokenDTO:
+        try:
+            verified = await self.auth_service.verify_id_token(id_token)
+            return VerifiedTokenDTO(
+                uid=verified.uid,
+                email=verified.email,
+                expires_at=verified.expires_at,
+                claims=verified.claims,
+            )
+        except (FirebaseAuthException, InvalidUserDataException) as e:
+            logger.warning("ID token verification failed: %s", e.message)
+            raise
+        except ServiceUnavailableException as e:
+            logger.warning("ID token verification unavailable: %s", e.message)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error verifying token: %s", e)
+            raise UserServiceException(f"Unexpected error verifying token: {str(e)}")
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -39,13 +39,122 @@ class Settings(BaseSettings):
             f"@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DB}"
         )
 
+    # MySQL connection pool (por worker y por servidor MySQL)
+    MYSQL_POOL_SIZE: int = 5                      # Conexiones persistentes en el pool
+    MYSQL_MAX_OVERFLOW: int = 10                  # Conexiones adicionales bajo carga
+    MYSQL_POOL_TIMEOUT: float = 30.0              # Timeout para obtener conexión del pool
+    MYSQL_POOL_RECYCLE: int = 7200                # Respaldo al reciclado del keeper (en el checkout)
+    MYSQL_POOL_SLOW_CHECKOUT: float = 0.1         # Esperas mayores (segundos) se registran como warning
+    MYSQL_KEEPER_INTERVAL: float = 30.0           # Cada cuánto se revisan las conexiones ociosas
+    MYSQL_KEEPER_IDLE: float = 60.0               # Ociosas más de esto reciben un SELECT 1
+    MYSQL_CONNECTION_MAX_AGE: float = 3600.0      # Conexiones más viejas se reemplazan en segundo plano
+    MYSQL_CONNECTION_BUDGET: int = 0              # Conexiones de todo el servicio por servidor (0 = sin límite)
+    WEB_CONCURRENCY: int = 1                      # Workers por instancia (mismo env que uvicorn --workers)
+    SERVICE_INSTANCES: int = 1                    # Instancias/pods que comparten el presupuesto
+
+    # MySQL read replicas (opcional)
+    MYSQL_REPLICA_URLS: list[str] = []            # URLs mysql+aiomysql://...; vacío = todo al primario
+    MYSQL_REPLICA_EJECT_SECONDS: float = 30.0     # Tiempo fuera de rotación tras un error de conexión
+    READ_YOUR_WRITES_WINDOW: float = 5.0          # Segundos que las lecturas de un UID escrito van al primario
+
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = Field(..., description="Path al archivo de credenciales Firebase")
     FIREBASE_WEB_API_KEY: str = Field(..., description="Firebase Web API Key")
+    FIREBASE_PROJECT_ID: Optional[str] = Field(default=None, description="Project ID (por defecto el de las credenciales)")
+
+    # ID token verification
+    FIREBASE_CERTS_URL: str = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+    FIREBASE_CERTS_REFRESH_MARGIN: float = 300.0  # Segundos antes del max-age para refrescar en segundo plano
+    TOKEN_VERIFY_CACHE_SIZE: int = 10000          # Tokens verificados memorizados (LRU)
+    TOKEN_CLOCK_SKEW: int = 5                     # Tolerancia de reloj en segundos
+
+    # Firebase timeouts, retries and circuit breaker
+    FIREBASE_LOGIN_TIMEOUT: float = 5.0           # Deadline de signInWithPassword
+    FIREBASE_REFRESH_TIMEOUT: float = 3.0         # Deadline de cada intento de refresh
+    FIREBASE_REFRESH_DEADLINE: float = 8.0        # Deadline total del refresh (con reintentos)
+    FIREBASE_REFRESH_ATTEMPTS: int = 3            # Solo refresh es idempotente y se reintenta
+    FIREBASE_RETRY_BASE_DELAY: float = 0.1
+    FIREBASE_RETRY_MAX_DELAY: float = 1.0
+    FIREBASE_ADMIN_TIMEOUT: float = 10.0          # Deadline de llamadas del Admin SDK
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5     # Tasa de error que abre el circuito
+    CIRCUIT_BREAKER_MIN_CALLS: int = 20           # Llamadas mínimas en la ventana antes de evaluar
+    CIRCUIT_BREAKER_WINDOW: float = 30.0          # Ventana de observación en segundos
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 15.0    # Tiempo abierto antes de probar de nuevo
+
+    # Login hedging (opt-in)
+    FIREBASE_LOGIN_HEDGE_ENABLED: bool = False
+    FIREBASE_LOGIN_HEDGE_DELAY: float = 0.5       # Segundos antes de enviar la copia (p. ej. el p95 observado)
+    FIREBASE_LOGIN_HEDGE_BUDGET: float = 0.05     # Máximo de llamadas extra (5%)
+
+    # Bulk onboarding
+    BULK_IMPORT_MAX_ROWS: int = 10000             # Filas máximas por request
+    BULK_IMPORT_CHUNK_SIZE: int = 1000            # Límite de import_users del Admin SDK
+    BULK_IMPORT_HASH_ROUNDS: int = 10000          # Rondas PBKDF2-SHA256 para importar contraseñas
+    FIREBASE_IMPORT_TIMEOUT: float = 60.0         # Deadline de import_users/delete_users por chunk
+
+    # Read coalescing (funciona también con la cache desactivada)
+    USER_READ_COALESCING_ENABLED: bool = True
+
+    # User profile cache
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_BACKEND: str = "memory"            # memory (por worker) | redis (compartido)
+    USER_CACHE_MAX_SIZE: int = 10000              # Perfiles en memoria por worker
+    USER_CACHE_TTL: float = 30.0                  # Segundos que vive un perfil en cache
+    USER_CACHE_NEGATIVE_TTL: float = 5.0          # Segundos que se recuerda un UID inexistente
+    USER_CACHE_VERSION_TTL: float = 86400.0       # Debe superar USER_CACHE_TTL
+    USER_CACHE_L1_TTL: float = 0.0                # Solo redis: cache en proceso delante (0 = desactivada)
+    USER_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    USER_CACHE_REDIS_TIMEOUT: float = 0.1         # Segundos; si Redis no responde se va a MySQL
+    USER_CACHE_REDIS_MAX_CONNECTIONS: int = 50
+    USER_CACHE_KEY_PREFIX: str = "auth:user:"
+
+    # User listing
+    USERS_PAGE_DEFAULT_LIMIT: int = 100           # Tamaño de página por defecto
+    USERS_PAGE_MAX_LIMIT: int = 1000              # Tamaño de página máximo
+
+    # Batch lookup
+    BATCH_GET_MAX_UIDS: int = 500                 # UIDs máximos por request
+    BATCH_GET_CHUNK_SIZE: int = 100               # UIDs por cláusula IN
+
+    # Export
+    EXPORT_BATCH_SIZE: int = 1000                 # Filas por lectura del cursor del servidor
+    EXPORT_MAX_CONCURRENT: int = 2                # Exportaciones simultáneas (cada una usa su conexión)
+
+    # Streaming ingest
+    INGEST_BATCH_SIZE: int = 500                  # Filas por INSERT multi-fila
+    INGEST_FLUSH_INTERVAL: float = 1.0            # Segundos máximos que una fila espera su lote
+    INGEST_MAX_LINE_BYTES: int = 65536            # Tamaño máximo de una línea NDJSON
+
+    # Refresh token coalescing
+    REFRESH_TOKEN_CACHE_TTL: float = 5.0          # Segundos que se reutiliza un refresh reciente
+    REFRESH_TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    # HTTP client (Firebase REST)
+    HTTP_POOL_LIMIT: int = 100               # Conexiones totales en el pool
+    HTTP_POOL_LIMIT_PER_HOST: int = 20       # Conexiones por host de Google
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0     # Segundos que una conexión ociosa se mantiene abierta
+    HTTP_DNS_CACHE_TTL: int = 300            # Segundos de cache DNS
+    HTTP_CONNECT_TIMEOUT: float = 3.0        # Timeout para obtener/abrir conexión
+    HTTP_READ_TIMEOUT: float = 10.0          # Timeout de lectura del socket
+    HTTP_TOTAL_TIMEOUT: float = 15.0         # Timeout total por request
+
+    # Firebase Admin SDK executor
+    FIREBASE_ADMIN_MAX_WORKERS: int = 8      # Hilos dedicados a llamadas bloqueantes del Admin SDK
+    FIREBASE_ADMIN_MAX_QUEUE: int = 100      # Llamadas en espera antes de rechazar con 503
 
     # logging
     LOG_LEVEL: str = "INFO"
-    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"  # Solo con LOG_JSON=False
+    LOG_JSON: bool = True                    # Una línea JSON por registro
+    LOG_QUEUE_SIZE: int = 10000              # Registros en cola hacia stdout; si se llena se descartan (y se cuentan)
+    LOG_SAMPLE_RATE: float = 1.0             # Fracción de peticiones cuyas líneas INFO/DEBUG se emiten
+    LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {  # Por ruta ("METHOD /path"); WARNING y superiores siempre se emiten
+        "GET /api/v1/users/{uid}": 0.01,
+        "GET /api/v1/users/": 0.01,
+        "POST /api/v1/users/batch-get": 0.01,
+        "POST /api/v1/auth/refresh-token": 0.05,
+        "POST /api/v1/auth/verify": 0.01,
+    }
 
     # CORS
     CORS_ORIGINS: list[str] = ["*"]
@@ -36,4 +36,9 @@ class FirebaseAuthException(UserServiceException):
 class ValidationException(UserServiceException):
     """Data validation error"""
     def __init__(self, message: str = "Validation error"):
-        super().__init__(message, 400)
\ No newline at end of file
+        super().__init__(message, 400)
+
+class ServiceUnavailableException(UserServiceException):
+    """Upstream dependency temporarily unavailable"""
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(message, 503)
\ No newline at end of file
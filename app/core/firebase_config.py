@@ -10,4 +10,7 @@ def get_firebase_auth():
     return auth
 
 def get_web_api_key() -> str:
-    return settings.FIREBASE_WEB_API_KEY
\ No newline at end of file
+    return settings.FIREBASE_WEB_API_KEY
+
+def get_project_id() -> str:
+    return settings.FIREBASE_PROJECT_ID or firebase_admin.get_app().project_id
\ No newline at end of file
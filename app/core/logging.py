@@ -1,15 +1,155 @@
+import atexit
+import copy
 import logging
+import queue
+import random
 import sys
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+import orjson
 from app.core.config import settings
 
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_sampling_filter: Optional["RequestSamplingFilter"] = None
+_request_sampling: ContextVar[Optional["RequestSampling"]] = ContextVar("request_log_sampling", default=None)
+_exception_formatter = logging.Formatter()
+
+
+class RequestSampling:
+    """Whether the routine (INFO and below) log lines of one request are emitted.
+
+    Decided on the first routine line, once routing has put the matched route in the scope,
+    from LOG_ROUTE_SAMPLE_RATES or LOG_SAMPLE_RATE.
+    """
+
+    __slots__ = ("scope", "_route", "_keep")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self._route: Optional[str] = None
+        self._keep: Optional[bool] = None
+
+    @property
+    def route(self) -> Optional[str]:
+        if self._route is None:
+            route = self.scope.get("route")
+            if route is None:
+                return None
+            self._route = f"{self.scope['method']} {route.path}"
+        return self._route
+
+    def keep(self) -> bool:
+        if self._keep is None:
+            rate = settings.LOG_ROUTE_SAMPLE_RATES.get(self.route, settings.LOG_SAMPLE_RATE)
+            self._keep = rate >= 1 or random.random() < rate
+        return self._keep
+
+
+def start_request_sampling(scope: dict) -> Token:
+    return _request_sampling.set(RequestSampling(scope))
+
+
+def end_request_sampling(token: Token):
+    _request_sampling.reset(token)
+
+
+class RequestSamplingFilter(logging.Filter):
+    """Drops the routine lines of requests that were not sampled and tags records with their route"""
+
+    def __init__(self):
+        super().__init__()
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        sampling = _request_sampling.get()
+        if sampling is None:
+            return True
+        if record.levelno < logging.WARNING and not sampling.keep():
+            self.sampled_out += 1
+            return False
+        record.route = sampling.route
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller: when the queue is full the record is dropped.
+
+    Like the stdlib handler, the message and any exception are rendered in the caller, so the
+    listener thread never touches the logged objects. Sampled-out lines are filtered before this
+    and are never formatted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, plus route and exception when present"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        route = getattr(record, "route", None)
+        if route:
+            entry["route"] = route
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return orjson.dumps(entry, default=str).decode()
+
 
 def configure_logging():
-    """Configures logging for the application."""
+    """Configures logging for the application.
+
+    Records go through a bounded queue to a listener thread that writes them to stdout, so a
+    slow log collector never blocks the event loop.
+    """
+    global _listener, _queue_handler, _sampling_filter
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)  # stdout para Docker/K8s
+    stream_handler.setFormatter(JsonFormatter() if settings.LOG_JSON else logging.Formatter(settings.LOG_FORMAT))
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _sampling_filter = RequestSamplingFilter()
+    _queue_handler.addFilter(_sampling_filter)
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(stop_logging)
 
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-        format=settings.LOG_FORMAT,
-        handlers=[logging.StreamHandler(sys.stdout)],  # stdout para Docker/K8s
+        handlers=[_queue_handler],
     )
 
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -17,4 +157,21 @@ def configure_logging():
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
     logging.getLogger("fastapi").setLevel(logging.WARNING)
-    logging.getLogger("aiomysql").setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger("aiomysql").setLevel(logging.WARNING)
+
+
+def stop_logging():
+    """Writes out the queued records and stops the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_stats() -> dict:
+    return {
+        "queued": _queue_handler.queue.qsize() if _queue_handler else 0,
+        "enqueued": _queue_handler.enqueued if _queue_handler else 0,
+        "dropped": _queue_handler.dropped if _queue_handler else 0,
+        "sampled_out": _sampling_filter.sampled_out if _sampling_filter else 0,
+    }
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Auth:
     """Domain entity representing a registered user (after creation)"""
     uid: str
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(slots=True)
+class AccountCredentials:
+    """Domain entity representing an account to be created in a bulk import"""
+    email: str
+    password: str
+    display_name: Optional[str] = None
+
+    def __post_init__(self):
+        if not self.email or "@" not in self.email:
+            raise ValueError("Valid email is required")
+        if not self.password:
+            raise ValueError("Password is required")
+
+
+@dataclass(slots=True)
+class BulkImportResult:
+    """Domain entity representing the outcome of one row of a bulk import"""
+    index: int
+    email: str
+    uid: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "email": self.email,
+            "uid": self.uid,
+            "success": self.success,
+            "error": self.error,
+        }
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Domain entity representing refreshed tokens"""
     id_token: str
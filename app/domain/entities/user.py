@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from app.shared.enums import PianoLevel
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Domain entity for the user"""
     uid: str
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass(slots=True)
+class VerifiedToken:
+    """Domain entity representing the claims of a verified ID token"""
+    uid: str
+    email: Optional[str]
+    expires_at: int
+    claims: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.uid:
+            raise ValueError("UID is required")
+        if not self.expires_at:
+            raise ValueError("Expiration is required")
+
+    def to_dict(self) -> dict:
+        return {
+            "uid": self.uid,
+            "email": self.email,
+            "expires_at": self.expires_at,
+            "claims": self.claims,
+        }
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from app.domain.entities.auth import Auth
+from app.domain.entities.bulk_import import AccountCredentials, BulkImportResult
 from app.domain.entities.login import Login
 from app.domain.entities.token import Token
+from app.domain.entities.verified_token import VerifiedToken
 
 class AuthRepository(ABC):
     """Interface for implementation in infrastructure"""
@@ -16,4 +18,18 @@ class AuthRepository(ABC):
 
     @abstractmethod
     async def refresh_token(self, refresh_token: str) -> Token:
+        pass
+
+    @abstractmethod
+    async def verify_id_token(self, id_token: str) -> VerifiedToken:
+        pass
+
+    @abstractmethod
+    async def import_users(self, accounts: list[AccountCredentials]) -> list[BulkImportResult]:
+        """Create accounts in one batch. Returns one result per account, in order"""
+        pass
+
+    @abstractmethod
+    async def delete_users(self, uids: list[str]) -> None:
+        """Delete accounts in one batch"""
         pass
\ No newline at end of file
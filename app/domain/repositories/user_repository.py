@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 from app.domain.entities.user import User
 
 
@@ -11,11 +11,21 @@ class UserRepository(ABC):
         """Create a new user"""
         pass
 
+    @abstractmethod
+    async def create_users_bulk(self, users: list[User]) -> dict[str, str]:
+        """Create users (unique UIDs) with multi-row inserts in one transaction. Returns {uid: error} for rejected users"""
+        pass
+
     @abstractmethod
     async def get_user_by_uid(self, uid: str) -> Optional[User]:
         """Get user by UID"""
         pass
 
+    @abstractmethod
+    async def get_users_by_uids(self, uids: list[str]) -> dict[str, User]:
+        """Get the users with the given UIDs, keyed by UID. Missing UIDs are absent from the result"""
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
@@ -26,6 +36,16 @@ class UserRepository(ABC):
         """Get all users"""
         pass
 
+    @abstractmethod
+    async def get_users_page(self, limit: int, after_uid: Optional[str] = None) -> list[User]:
+        """Get up to `limit` users ordered by UID, starting after `after_uid`"""
+        pass
+
+    @abstractmethod
+    def stream_users(self, batch_size: int) -> AsyncIterator[User]:
+        """Stream every user ordered by UID without loading the table in memory"""
+        pass
+
     @abstractmethod
     async def user_exists_by_uid(self, uid: str) -> bool:
         """Check if a user exists by UID"""
@@ -41,6 +61,16 @@ class UserRepository(ABC):
         """Update user"""
         pass
 
+    @abstractmethod
+    async def update_user_fields(self, uid: str, fields: dict) -> bool:
+        """Update the given fields with a single statement. Returns False if the user does not exist"""
+        pass
+
+    @abstractmethod
+    async def update_user_fields_returning(self, uid: str, fields: dict) -> Optional[User]:
+        """Update the given fields and return the updated user, or None if the user does not exist"""
+        pass
+
     @abstractmethod
     async def delete_user(self, uid: str) -> bool:
         """Delete user"""
@@ -1,12 +1,15 @@
 from app.domain.entities.auth import Auth
+from app.domain.entities.bulk_import import AccountCredentials, BulkImportResult
 from app.domain.entities.login import Login
 from app.domain.entities.token import Token
+from app.domain.entities.verified_token import VerifiedToken
 from app.domain.repositories.auth_repository import AuthRepository
 from app.core.exceptions import (
     FirebaseAuthException,
     InvalidUserDataException,
     UserAlreadyExistsException,
     UserNotFoundException,
+    ServiceUnavailableException,
 )
 
 
@@ -23,7 +26,7 @@ class AuthService:
             # Create user in Firebase Auth
             auth_entity = await self.auth_repository.register_user(email, password)
             return auth_entity
-        except UserAlreadyExistsException: 
+        except (UserAlreadyExistsException, ServiceUnavailableException):
             raise
         except Exception as e:
             raise FirebaseAuthException(str(e))
@@ -36,6 +39,8 @@ class AuthService:
             if not login_entity:
                 raise UserNotFoundException("User not found or invalid credentials")
             return login_entity
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             raise FirebaseAuthException(str(e))
 
@@ -46,6 +51,41 @@ class AuthService:
         try:
             token_entity = await self.auth_repository.refresh_token(refresh_token)
             return token_entity
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            raise FirebaseAuthException(str(e))
+
+    async def verify_id_token(self, id_token: str) -> VerifiedToken:
+        if not id_token or len(id_token.strip()) == 0:
+            raise InvalidUserDataException("ID token is required")
+
+        try:
+            return await self.auth_repository.verify_id_token(id_token.strip())
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            raise FirebaseAuthException(str(e))
+
+    async def import_users(self, accounts: list[AccountCredentials]) -> list[BulkImportResult]:
+        if not accounts:
+            return []
+
+        try:
+            return await self.auth_repository.import_users(accounts)
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            raise FirebaseAuthException(str(e))
+
+    async def delete_users(self, uids: list[str]) -> None:
+        if not uids:
+            return
+
+        try:
+            await self.auth_repository.delete_users(uids)
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             raise FirebaseAuthException(str(e))
 
@@ -1,7 +1,8 @@
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from app.application.dto.user_dto import UpdateUserDTO
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import UserRepository
-from app.core.exceptions import UserAlreadyExistsException, InvalidUserDataException, UserNotFoundException
+from app.core.exceptions import InvalidUserDataException, UserNotFoundException
 from app.shared.enums import PianoLevel
 
 class UserService:
@@ -11,12 +12,7 @@ class UserService:
         self.user_repository = user_repository
 
     async def create_user(self, user: User) -> User:
-        # Check existence
-        if await self.user_repository.user_exists_by_uid(user.uid):
-            raise UserAlreadyExistsException(f"User with UID {user.uid} already exists")
-        if await self.user_repository.user_exists_by_email(user.email):
-            raise UserAlreadyExistsException(f"User with email {user.email} already exists")
-
+        # Conflicts on uid/email are detected by the repository's unique constraints
         self._validate_user_data(user.piano_level)
 
         user = User(
@@ -28,17 +24,36 @@ class UserService:
 
         return await self.user_repository.create_user(user)
 
+    async def create_users_bulk(self, users: list[User]) -> dict[str, str]:
+        """Creates users in one batch. Returns {uid: error} for the users that were rejected"""
+        for user in users:
+            self._validate_user_data(user.piano_level)
+
+        users = [
+            User(
+                uid=user.uid,
+                email=user.email.lower().strip(),
+                name=user.name.strip(),
+                piano_level=user.piano_level
+            )
+            for user in users
+        ]
+
+        return await self.user_repository.create_users_bulk(users)
+
     async def update_user(self, uid: str, updated_user: UpdateUserDTO) -> User:
-        user = await self.user_repository.get_user_by_uid(uid)
+        if updated_user.piano_level is None:
+            # Nothing to change
+            user = await self.user_repository.get_user_by_uid(uid)
+        else:
+            self._validate_user_data(updated_user.piano_level)
+            user = await self.user_repository.update_user_fields_returning(
+                uid, {"piano_level": updated_user.piano_level}
+            )
+
         if not user:
             raise InvalidUserDataException(f"User with UID {uid} not found")
-        
-        # Update fields
-        user.piano_level = updated_user.piano_level or user.piano_level
-
-        self._validate_user_data(user.piano_level)
-
-        return await self.user_repository.update_user(user)
+        return user
 
     async def get_user_by_uid(self, uid: str) -> User:
         user = await self.user_repository.get_user_by_uid(uid)
@@ -46,9 +61,31 @@ class UserService:
             raise UserNotFoundException(f"User with UID {uid} not found")
         return user
 
+    async def get_users_by_uids(self, uids: List[str]) -> Tuple[Dict[str, User], List[str]]:
+        """Returns the users found, keyed by UID, and the UIDs that do not exist (in request order)"""
+        unique_uids = list(dict.fromkeys(uid.strip() for uid in uids if uid and uid.strip()))
+        users = await self.user_repository.get_users_by_uids(unique_uids)
+        missing = [uid for uid in unique_uids if uid not in users]
+        return users, missing
+
     async def get_all_users(self) -> list[User]:
         return await self.user_repository.get_all_users()
 
+    async def get_users_page(self, limit: int, after_uid: Optional[str] = None) -> Tuple[List[User], Optional[str]]:
+        """Returns a page of users and the UID to continue after, or None on the last page"""
+        if limit < 1:
+            raise InvalidUserDataException("Limit must be at least 1")
+
+        # One extra row tells whether there is a next page
+        users = await self.user_repository.get_users_page(limit + 1, after_uid)
+        if len(users) > limit:
+            users = users[:limit]
+            return users, users[-1].uid
+        return users, None
+
+    def stream_users(self, batch_size: int) -> AsyncIterator[User]:
+        return self.user_repository.stream_users(batch_size)
+
     async def user_exists(self, uid: str) -> bool:
         return await self.user_repository.user_exists_by_uid(uid)
 
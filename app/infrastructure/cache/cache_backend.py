@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class CacheBackend(ABC):
+    """Interface for a key-value cache tier. Values are JSON-compatible Python objects"""
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several keys in one round trip. Absent keys come back as None"""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, Any], ttl: float) -> None:
+        """Set several keys with the same TTL in one round trip"""
+        pass
+
+    @abstractmethod
+    async def invalidate(self, version_keys: list[str], data_keys: list[str], version_ttl: float) -> None:
+        """Increment the version keys and delete the data keys in one round trip"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
@@ -0,0 +1,34 @@
+from typing import Any, Optional
+from app.infrastructure.cache.cache_backend import CacheBackend
+from app.shared.cache import MISSING, TTLCache
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process cache backend. Per worker; also the local stand-in for a shared backend"""
+
+    def __init__(self, max_size: int):
+        self._cache = TTLCache(max_size=max_size, ttl=0)
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        values = []
+        for key in keys:
+            value = self._cache.get(key)
+            values.append(None if value is MISSING else value)
+        return values
+
+    async def set_many(self, items: dict[str, Any], ttl: float) -> None:
+        for key, value in items.items():
+            self._cache.set(key, value, ttl=ttl)
+
+    async def invalidate(self, version_keys: list[str], data_keys: list[str], version_ttl: float) -> None:
+        for key in version_keys:
+            version = self._cache.get(key, 0)
+            self._cache.set(key, version + 1, ttl=version_ttl)
+        for key in data_keys:
+            self._cache.delete(key)
+
+    async def close(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self._cache.stats()}
@@ -0,0 +1,83 @@
+import json
+import logging
+from typing import Any, Optional
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from app.infrastructure.cache.cache_backend import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache backend for any Redis-protocol server.
+
+    Every operation is a single MGET or a single non-transactional pipeline. Failures are
+    logged and counted, and the cache then behaves as empty: callers fall back to the database.
+    """
+
+    def __init__(self, url: str, key_prefix: str, timeout: float, max_connections: int):
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            max_connections=max_connections,
+        )
+
+        # Metrics
+        self.round_trips = 0
+        self.errors = 0
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        if not keys:
+            return []
+        try:
+            self.round_trips += 1
+            raw_values = await self._client.mget([self.key_prefix + key for key in keys])
+        except RedisError as e:
+            self._failed("MGET", e)
+            return [None] * len(keys)
+        return [json.loads(raw) if raw is not None else None for raw in raw_values]
+
+    async def set_many(self, items: dict[str, Any], ttl: float) -> None:
+        if not items:
+            return
+        try:
+            self.round_trips += 1
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self.key_prefix + key, json.dumps(value), px=max(int(ttl * 1000), 1))
+                await pipe.execute()
+        except RedisError as e:
+            self._failed("SET", e)
+
+    async def invalidate(self, version_keys: list[str], data_keys: list[str], version_ttl: float) -> None:
+        try:
+            self.round_trips += 1
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in version_keys:
+                    pipe.incr(self.key_prefix + key)
+                    pipe.pexpire(self.key_prefix + key, max(int(version_ttl * 1000), 1))
+                if data_keys:
+                    pipe.delete(*(self.key_prefix + key for key in data_keys))
+                await pipe.execute()
+        except RedisError as e:
+            # Other workers may serve the old value until its TTL expires
+            self._failed("invalidate", e)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def stats(self) -> dict:
+        pool = self._client.connection_pool
+        return {
+            "backend": "redis",
+            "round_trips": self.round_trips,
+            "errors": self.errors,
+            "connections_in_use": len(getattr(pool, "_in_use_connections", ())),
+            "connections_idle": len(getattr(pool, "_available_connections", ())),
+        }
+
+    def _failed(self, operation: str, error: Exception):
+        self.errors += 1
+        logger.warning(f"Redis cache {operation} failed: {type(error).__name__}: {error}")
@@ -0,0 +1,131 @@
+import time
+import asyncio
+import logging
+from typing import Optional
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionKeeper:
+    """Keeps pooled MySQL connections healthy in the background instead of pinging on every checkout.
+
+    Every `interval` seconds each watched pool that has no connection checked out is walked one
+    connection at a time, so requests always find the rest of the pool idle: connections idle for
+    more than `idle_seconds` get a `SELECT 1` (which also keeps them under the server's and any
+    proxy's idle timeout), and those older than `max_age` are replaced by a new connection. Busy
+    pools are skipped, their connections are kept warm by the traffic itself. A connection that
+    still dies between rounds is handled by the caller's retry.
+    """
+
+    def __init__(self, interval: float, idle_seconds: float, max_age: float):
+        self.interval = interval
+        self.idle_seconds = idle_seconds
+        self.max_age = max_age
+        self._engines: dict[str, AsyncEngine] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.rounds = 0
+        self.pings = 0
+        self.dead = 0
+        self.recycled = 0
+        self.failures = 0
+        self.busy_skips = 0
+
+    def watch(self, name: str, engine: AsyncEngine):
+        """Tracks when the engine's connections were opened and last returned to the pool"""
+        self._engines[name] = engine
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            now = time.monotonic()
+            connection_record.info["connected_at"] = now
+            connection_record.info["last_used"] = now
+
+        @event.listens_for(engine.sync_engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            # A keeper visit that sent nothing must not make the connection look recently used
+            if connection_record.info.pop("keeper_untouched", False):
+                return
+            connection_record.info["last_used"] = time.monotonic()
+
+    def start(self):
+        if not self._task:
+            self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self):
+        """Visits each idle connection of every quiet watched pool once, one at a time"""
+        self.rounds += 1
+        for name, engine in list(self._engines.items()):
+            pool = engine.sync_engine.pool
+            # The pool hands out idle connections in FIFO order, so each visit reaches the next one
+            for _ in range(pool.checkedin()):
+                if pool.checkedout():
+                    self.busy_skips += 1
+                    break
+                try:
+                    await self._check(engine)
+                except Exception as e:
+                    self.failures += 1
+                    logger.warning("MySQL connection check on %s failed: %s", name, e)
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "rounds": self.rounds,
+            "pings": self.pings,
+            "dead": self.dead,
+            "recycled": self.recycled,
+            "failures": self.failures,
+            "busy_skips": self.busy_skips,
+        }
+
+    async def _check(self, engine: AsyncEngine):
+        async with engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            now = time.monotonic()
+            connected_at = raw.info.get("connected_at", now)
+            last_used = raw.info.get("last_used", now)
+
+            if now - connected_at >= self.max_age:
+                self.recycled += 1
+                await self._reconnect(connection)
+            elif now - last_used >= self.idle_seconds:
+                self.pings += 1
+                try:
+                    await connection.execute(text("SELECT 1"))
+                except DBAPIError as e:
+                    if not e.connection_invalidated:
+                        raise
+                    self.dead += 1
+                    await connection.rollback()
+                    await self._reconnect(connection)
+            else:
+                raw.info["keeper_untouched"] = True
+
+    @staticmethod
+    async def _reconnect(connection: AsyncConnection):
+        """Closes the connection's DBAPI connection and opens a fresh one before a request needs it"""
+        if not connection.invalidated:
+            await connection.invalidate()
+        await connection.execute(text("SELECT 1"))
+
+    async def _run_loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except SQLAlchemyError as e:
+                logger.warning(f"MySQL connection keeper round failed: {e}")
@@ -1,48 +1,119 @@
-import os
+import time
+import asyncio
 import logging
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.infrastructure.database.connection_keeper import ConnectionKeeper
+from app.infrastructure.database.pool import InstrumentedAsyncQueuePool, PoolTelemetry, per_worker_pool_limits
+from app.shared.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# UIDs remembered in the read-your-writes window per worker
+_RECENT_WRITES_MAX_SIZE = 100000
+
+# Can't connect (socket / TCP), server has gone away, lost connection during query
+_CONNECTION_ERRORS = (2002, 2003, 2006, 2013)
+
+
+class ReplicaNode:
+    """A read replica with its own pool, taken out of rotation for a while after a connection error"""
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        self.ejected_until = 0.0
+
+        # Metrics
+        self.reads = 0
+        self.ejections = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until <= time.monotonic()
+
+    def eject(self, seconds: float, error: BaseException):
+        if self.healthy:
+            self.ejections += 1
+            logger.warning(f"Ejecting MySQL replica {self.name} for {seconds:.0f}s: {error}")
+        self.ejected_until = time.monotonic() + seconds
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "reads": self.reads,
+            "ejections": self.ejections,
+            "pool": self.engine.sync_engine.pool.telemetry.stats(),
+        }
+
+
 class DatabaseConnection:
     """MySQL async connection manager using SQLAlchemy"""
 
     def __init__(self):
-        self.mysql_host = os.getenv("MYSQL_HOST", "localhost")
-        self.mysql_port = os.getenv("MYSQL_PORT", "3306")
-        self.mysql_user = os.getenv("MYSQL_USER", "root")
-        self.mysql_password = os.getenv("MYSQL_PASSWORD", "")
-        self.mysql_db = os.getenv("MYSQL_DB", "music_db")
-
-        self.async_database_url = (
-            f"mysql+aiomysql://{self.mysql_user}:{self.mysql_password}"
-            f"@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
-        )
+        self.mysql_host = settings.MYSQL_HOST
+        self.mysql_port = settings.MYSQL_PORT
+        self.mysql_db = settings.MYSQL_DB
+        self.async_database_url = settings.ASYNC_DATABASE_URL
 
         self.async_engine = None
         self.async_session_factory: async_sessionmaker[AsyncSession] | None = None
 
+        # Long-running exports get their own connections so they never hold interactive pool slots
+        self.export_engine = None
+        self.export_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._export_slots: Optional[asyncio.Semaphore] = None
+
+        # Read-only queries are spread over the replicas; recently written UIDs stay on the primary
+        self.replicas: list[ReplicaNode] = []
+        self._next_replica = 0
+        self._recent_writes = TTLCache(_RECENT_WRITES_MAX_SIZE, settings.READ_YOUR_WRITES_WINDOW)
+        self.primary_reads = 0
+        self.pinned_reads = 0
+
+        # Connections are validated in the background, not with a ping on every checkout
+        self.keeper = ConnectionKeeper(
+            interval=settings.MYSQL_KEEPER_INTERVAL,
+            idle_seconds=settings.MYSQL_KEEPER_IDLE,
+            max_age=settings.MYSQL_CONNECTION_MAX_AGE,
+        )
+        self.retried_queries = 0
+
     def init_engine(self):
         """Initializes the async database engine and session factory if not already done."""
         if not self.async_engine:
             try:
-                self.async_engine = create_async_engine(
-                    self.async_database_url,
-                    echo=False,
-                    pool_pre_ping=True,
-                    pool_recycle=300,  # Reciclar conexiones cada 5 minutos
-                    pool_size=5,       # Máximo 5 conexiones en el pool
-                    max_overflow=10,   # Máximo 10 conexiones adicionales
-                    pool_timeout=30,   # Timeout para obtener conexión del pool
-                    isolation_level="READ_COMMITTED",  # Nivel de aislamiento consistente
+                # Exports open up to EXPORT_MAX_CONCURRENT unpooled connections on the primary
+                self.async_engine = self._create_pooled_engine(
+                    self.async_database_url, "primary", reserved=settings.EXPORT_MAX_CONCURRENT
                 )
                 self.async_session_factory = async_sessionmaker(
                     self.async_engine,
                     class_=AsyncSession,
                     expire_on_commit=False,
                 )
-                logger.info("Async database engine created successfully")
+                self.export_engine = create_async_engine(
+                    self.async_database_url,
+                    echo=False,
+                    poolclass=NullPool,  # Una conexión nueva por exportación, cerrada al terminar
+                    isolation_level="READ_COMMITTED",
+                )
+                self.export_session_factory = async_sessionmaker(
+                    self.export_engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                )
+                for url in settings.MYSQL_REPLICA_URLS:
+                    self.replicas.append(self._create_replica(url))
+                logger.info(f"Async database engine created successfully ({len(self.replicas)} read replicas)")
             except Exception as e:
                 logger.error("Error creating async database engine", exc_info=True)
                 raise RuntimeError(f"Failed to create database connection: {e}")
@@ -66,12 +137,127 @@ class DatabaseConnection:
             self.init_engine()
         return self.async_session_factory()
 
+    def get_read_session(self, uid: Optional[str] = None) -> AsyncSession:
+        """Gets a new async session for a read-only query.
+
+        Uses the next healthy replica (round robin), or the primary when there are no healthy
+        replicas or `uid` was written by this worker within READ_YOUR_WRITES_WINDOW.
+        """
+        if not self.async_session_factory:
+            self.init_engine()
+
+        if uid is not None and self.replicas and self._recent_writes.get(uid, None) is not None:
+            self.pinned_reads += 1
+            return self.async_session_factory()
+
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next_replica]
+            self._next_replica = (self._next_replica + 1) % len(self.replicas)
+            if replica.healthy:
+                replica.reads += 1
+                return replica.session_factory()
+
+        self.primary_reads += 1
+        return self.async_session_factory()
+
+    def mark_written(self, *uids: str):
+        """Pins reads of these UIDs to the primary for READ_YOUR_WRITES_WINDOW seconds"""
+        if self.replicas:
+            for uid in uids:
+                self._recent_writes.set(uid, True)
+
+    def get_export_session(self) -> AsyncSession:
+        """Gets a new async session on a dedicated (unpooled) export connection."""
+        if not self.export_session_factory:
+            self.init_engine()
+        return self.export_session_factory()
+
+    @asynccontextmanager
+    async def export_slot(self) -> AsyncIterator[None]:
+        """Reserves one of the EXPORT_MAX_CONCURRENT export slots, failing fast when all are taken."""
+        if self._export_slots is None:
+            self._export_slots = asyncio.Semaphore(settings.EXPORT_MAX_CONCURRENT)
+        if self._export_slots.locked():
+            raise ServiceUnavailableException("Too many exports in progress, try again later")
+        async with self._export_slots:
+            yield
+
+    def start_keeper(self):
+        """Starts the background connection health checks."""
+        self.keeper.start()
+
+    def stats(self) -> dict:
+        return {
+            "keeper": self.keeper.stats(),
+            "retried_queries": self.retried_queries,
+            "primary_reads": self.primary_reads,
+            "pinned_reads": self.pinned_reads,
+            "recently_written": len(self._recent_writes),
+            "pool": self.async_engine.sync_engine.pool.telemetry.stats() if self.async_engine else None,
+            "replicas": [replica.stats() for replica in self.replicas],
+        }
+
     async def close_connections(self):
         """Closes the database engine connections."""
+        await self.keeper.stop()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+        self.replicas = []
+        if self.export_engine:
+            await self.export_engine.dispose()
         if self.async_engine:
             await self.async_engine.dispose()
             logger.info("Database connections closed")
 
 
+    def _create_pooled_engine(self, url: str, name: str, reserved: int = 0) -> AsyncEngine:
+        workers = settings.WEB_CONCURRENCY * settings.SERVICE_INSTANCES
+        pool_size, max_overflow = per_worker_pool_limits(
+            settings.MYSQL_CONNECTION_BUDGET,
+            workers,
+            reserved,
+            settings.MYSQL_POOL_SIZE,
+            settings.MYSQL_MAX_OVERFLOW,
+        )
+        logger.info(
+            f"MySQL pool {name}: pool_size={pool_size}, max_overflow={max_overflow} "
+            f"per worker ({workers} workers)"
+        )
+
+        telemetry = PoolTelemetry(name, settings.MYSQL_POOL_SLOW_CHECKOUT)
+        engine = create_async_engine(
+            url,
+            echo=False,
+            poolclass=InstrumentedAsyncQueuePool,
+            telemetry=telemetry,
+            pool_recycle=settings.MYSQL_POOL_RECYCLE,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.MYSQL_POOL_TIMEOUT,
+            isolation_level="READ_COMMITTED",  # Nivel de aislamiento consistente
+        )
+        telemetry.attach(engine.sync_engine)
+        self.keeper.watch(name, engine)
+        return engine
+
+    def _create_replica(self, url: str) -> ReplicaNode:
+        name = make_url(url).render_as_string(hide_password=True)
+        replica = ReplicaNode(name, self._create_pooled_engine(url, name))
+
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def eject_on_connection_error(context):
+            # Disconnects and refused/timed-out connects only. Lock wait timeouts, deadlocks and
+            # max_execution_time are OperationalErrors too, but they keep the replica in rotation
+            if context.is_disconnect or _connection_error_code(context.original_exception) in _CONNECTION_ERRORS:
+                replica.eject(settings.MYSQL_REPLICA_EJECT_SECONDS, context.original_exception)
+
+        return replica
+
+
+def _connection_error_code(error: BaseException) -> Optional[int]:
+    args = getattr(error, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
+
+
 # Global instance
 mysql_connection = DatabaseConnection()
\ No newline at end of file
@@ -0,0 +1,155 @@
+import time
+import logging
+from collections import deque
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTelemetry:
+    """Checkout waits and connection lifecycle counters for one connection pool"""
+
+    def __init__(self, name: str, slow_checkout: float):
+        self.name = name
+        self.slow_checkout = slow_checkout
+        self.pool: Optional["InstrumentedAsyncQueuePool"] = None
+        self._waits: deque[float] = deque(maxlen=1000)
+
+        # Metrics
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+        self.connects = 0
+        self.disconnects = 0
+        self.invalidations = 0
+
+    def attach(self, engine: Engine):
+        """Counts connects, disconnects and invalidations of the engine's pool"""
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+            logger.debug(f"MySQL pool {self.name}: new connection ({self._describe()})")
+
+        @event.listens_for(engine, "close")
+        def on_close(dbapi_connection, connection_record):
+            self.disconnects += 1
+            logger.debug(f"MySQL pool {self.name}: connection closed ({self._describe()})")
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+            logger.info(f"MySQL pool {self.name}: connection invalidated: {exception}")
+
+    def record_checkout(self, wait: float):
+        self.checkouts += 1
+        self._waits.append(wait)
+        self.max_wait = max(self.max_wait, wait)
+        if wait >= self.slow_checkout:
+            self.slow_checkouts += 1
+            logger.warning(f"MySQL pool {self.name}: checkout waited {wait * 1000:.1f}ms ({self._describe()})")
+
+    def record_timeout(self, wait: float):
+        self.timeouts += 1
+        logger.error(f"MySQL pool {self.name}: checkout timed out after {wait:.1f}s ({self._describe()})")
+
+    def stats(self) -> dict:
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(int(len(waits) * p), len(waits) - 1)] * 1000, 3)
+
+        pool = self.pool
+        return {
+            "pool_size": pool.size() if pool else 0,
+            "max_overflow": pool._max_overflow if pool else 0,
+            "checked_out": pool.checkedout() if pool else 0,
+            "checked_in": pool.checkedin() if pool else 0,
+            "overflow": max(pool.overflow(), 0) if pool else 0,
+            "checkouts": self.checkouts,
+            "slow_checkouts": self.slow_checkouts,
+            "timeouts": self.timeouts,
+            "wait_p50_ms": percentile(0.50),
+            "wait_p95_ms": percentile(0.95),
+            "wait_p99_ms": percentile(0.99),
+            "wait_max_ms": round(self.max_wait * 1000, 3),
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "invalidations": self.invalidations,
+        }
+
+    def _describe(self) -> str:
+        pool = self.pool
+        if pool is None:
+            return "no pool"
+        return f"checked out {pool.checkedout()}/{pool.size() + pool._max_overflow}, overflow {max(pool.overflow(), 0)}"
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports how long each checkout waited to its PoolTelemetry"""
+
+    # create_engine() only forwards pool arguments it finds among the positional-or-keyword parameters
+    def __init__(self, creator, telemetry: PoolTelemetry, **kwargs):
+        super().__init__(creator, **kwargs)
+        self.telemetry = telemetry
+        telemetry.pool = self
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.telemetry.record_timeout(time.perf_counter() - started_at)
+            raise
+        self.telemetry.record_checkout(time.perf_counter() - started_at)
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # dispose() swaps in a new pool: keep reporting to the same telemetry
+        return self.__class__(
+            self._creator,
+            telemetry=self.telemetry,
+            pool_size=self._pool.maxsize,
+            max_overflow=self._max_overflow,
+            pre_ping=self._pre_ping,
+            use_lifo=self._pool.use_lifo,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+
+def per_worker_pool_limits(
+    budget: int, workers: int, reserved: int, pool_size: int, max_overflow: int
+) -> tuple[int, int]:
+    """Returns (pool_size, max_overflow) for one worker's pool on one MySQL server.
+
+    `budget` is the number of connections the whole service may open on that server, shared by
+    `workers` processes, each of which also keeps `reserved` connections outside the pool. With
+    no budget (0) the configured sizes are used as they are; otherwise they are capped so that
+    workers * (pool_size + max_overflow + reserved) <= budget.
+    """
+    if budget <= 0:
+        return pool_size, max_overflow
+
+    available = budget // max(workers, 1) - reserved
+    if available < 1:
+        logger.error(
+            f"MySQL connection budget {budget} is too small for {workers} workers "
+            f"with {reserved} reserved connections each; using a single connection per worker"
+        )
+        return 1, 0
+
+    size = min(pool_size, available)
+    return size, min(max_overflow, available - size)
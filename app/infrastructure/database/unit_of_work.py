@@ -0,0 +1,80 @@
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.exceptions import DatabaseConnectionException
+from app.infrastructure.database.mysql_connection import mysql_connection
+
+logger = logging.getLogger(__name__)
+
+_current_unit_of_work: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """One session on the primary shared by every repository call of a request.
+
+    The session (and its connection) is only opened by the first repository call. Repositories
+    do not commit inside a unit of work: the owner commits once at the end, and anything left
+    uncommitted is rolled back when the unit of work is closed.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self._session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]):
+        """Runs `callback` once the work is committed (never if it is rolled back)"""
+        self._after_commit.append(callback)
+
+    async def commit(self):
+        if self._session is not None:
+            try:
+                await self._session.commit()
+            except SQLAlchemyError as e:
+                await self.rollback()
+                logger.error(f"Database error committing unit of work: {e}")
+                raise DatabaseConnectionException(f"Error committing transaction: {str(e)}")
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Error running after-commit callback: {e}")
+
+    async def rollback(self):
+        self._after_commit.clear()
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self):
+        self._after_commit.clear()
+        if self._session is not None:
+            # Rolls back whatever was not committed and returns the connection to the pool
+            await self._session.close()
+            self._session = None
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """The unit of work of the current request, None outside of one"""
+    return _current_unit_of_work.get()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Makes a new unit of work current for the enclosed code"""
+    work = UnitOfWork(mysql_connection.get_async_session)
+    token = _current_unit_of_work.set(work)
+    try:
+        yield work
+    finally:
+        _current_unit_of_work.reset(token)
+        await work.close()
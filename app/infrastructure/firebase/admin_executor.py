@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FirebaseAdminExecutor:
+    """Bounded thread pool for the blocking Firebase Admin SDK calls"""
+
+    def __init__(self):
+        self.max_workers = settings.FIREBASE_ADMIN_MAX_WORKERS
+        self.max_queue = settings.FIREBASE_ADMIN_MAX_QUEUE
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Queue metrics
+        self.queued = 0
+        self.running = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        # {operation: {"calls", "errors", "wait_total", "wait_max", "run_total", "run_max"}}
+        self._operations: dict[str, dict[str, float]] = {}
+
+    def start(self):
+        """Creates the thread pool if not already done."""
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="firebase-admin",
+            )
+            logger.info(f"Firebase Admin executor started with {self.max_workers} workers")
+
+    def shutdown(self):
+        """Waits for running calls and releases the worker threads."""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info(f"Firebase Admin executor stopped - stats: {self.stats()}")
+
+    async def run(
+        self, fn: Callable[..., T], *args: Any, start_timeout: Optional[float] = None, **kwargs: Any
+    ) -> T:
+        """Runs a blocking Admin SDK call in the pool without blocking the event loop.
+
+        With `start_timeout`, TimeoutError is raised only if no worker picked the call up in time;
+        a call that already started is awaited to the end, since cancelling the await would not
+        stop the thread and the caller would lose a result that did happen.
+        Raises ServiceUnavailableException when the queue is full.
+        """
+        if not self._executor:
+            self.start()
+
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise ServiceUnavailableException("Firebase Admin queue is full, try again later")
+            self.queued += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queued)
+
+        operation = getattr(fn, "__name__", "call")
+        submitted_at = time.perf_counter()
+        state = {"started": False, "abandoned": False}
+        timings = {}
+
+        def call():
+            started_at = time.perf_counter()
+            with self._lock:
+                if state["abandoned"]:
+                    return None
+                state["started"] = True
+                self.queued -= 1
+                self.running += 1
+            timings["wait"] = started_at - submitted_at
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                timings["run"] = time.perf_counter() - started_at
+                with self._lock:
+                    self.running -= 1
+
+        loop = asyncio.get_running_loop()
+        failed = False
+        future = loop.run_in_executor(self._executor, functools.partial(call))
+        try:
+            if start_timeout is None:
+                return await future
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), start_timeout)
+            except TimeoutError:
+                with self._lock:
+                    if not state["started"]:
+                        state["abandoned"] = True
+                        self.queued -= 1
+                        raise
+            return await future
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                if not state["started"] and not state["abandoned"]:
+                    # Cancelled or timed out before a worker picked it up
+                    state["abandoned"] = True
+                    self.queued -= 1
+            if "wait" in timings:
+                self._record(operation, timings, failed)
+
+    def stats(self) -> dict:
+        """Queue depth and per-operation latency metrics"""
+        operations = {}
+        for name, op in self._operations.items():
+            calls = op["calls"] or 1
+            operations[name] = {
+                "calls": int(op["calls"]),
+                "errors": int(op["errors"]),
+                "wait_avg_ms": round(op["wait_total"] / calls * 1000, 3),
+                "wait_max_ms": round(op["wait_max"] * 1000, 3),
+                "run_avg_ms": round(op["run_total"] / calls * 1000, 3),
+                "run_max_ms": round(op["run_max"] * 1000, 3),
+            }
+
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self.queued,
+            "running": self.running,
+            "max_queue_depth": self.max_queue_depth,
+            "rejected": self.rejected,
+            "operations": operations,
+        }
+
+    def _record(self, operation: str, timings: dict, failed: bool):
+        op = self._operations.setdefault(operation, {
+            "calls": 0, "errors": 0,
+            "wait_total": 0.0, "wait_max": 0.0,
+            "run_total": 0.0, "run_max": 0.0,
+        })
+        op["calls"] += 1
+        op["errors"] += int(failed)
+        op["wait_total"] += timings["wait"]
+        op["wait_max"] = max(op["wait_max"], timings["wait"])
+        run = timings.get("run", 0.0)
+        op["run_total"] += run
+        op["run_max"] = max(op["run_max"], run)
+
+
+# Global instance
+firebase_admin_executor = FirebaseAdminExecutor()
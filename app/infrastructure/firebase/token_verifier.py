@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import re
+import time
+import logging
+from typing import Any, Optional
+import jwt
+from cryptography.x509 import load_pem_x509_certificate
+from app.core.config import settings
+from app.core.exceptions import FirebaseAuthException, ServiceUnavailableException
+from app.core.firebase_config import get_project_id
+from app.infrastructure.http.http_client import http_client
+from app.shared.cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+_DEFAULT_MAX_AGE = 3600
+_RETRY_DELAY = 30.0
+_UNKNOWN_KID_REFRESH_INTERVAL = 60.0
+
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens locally against cached Google signing keys"""
+
+    def __init__(self):
+        self._keys: dict[str, Any] = {}
+        self._keys_expire_at = 0.0
+        self._last_forced_refresh = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._claims_cache = TTLCache(max_size=settings.TOKEN_VERIFY_CACHE_SIZE, ttl=0)
+
+        # Metrics
+        self.verifications = 0
+        self.failures = 0
+        self.key_refreshes = 0
+        self.key_refresh_failures = 0
+
+    async def start(self):
+        """Loads the signing keys and starts the background refresh task."""
+        try:
+            await self._refresh_keys(force=True)
+        except ServiceUnavailableException as e:
+            logger.warning(f"Google signing keys not loaded at startup: {e.message}")
+        if not self._refresh_task:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Stops the background refresh task."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def verify(self, id_token: str) -> dict:
+        """Verifies an ID token and returns its claims. Results are memoized until `exp`."""
+        cache_key = hashlib.sha256(id_token.encode()).digest()
+        claims = self._claims_cache.get(cache_key)
+        if claims is not MISSING:
+            return claims
+
+        self.verifications += 1
+        try:
+            claims = await self._decode(id_token)
+        except FirebaseAuthException:
+            self.failures += 1
+            raise
+
+        self._claims_cache.set(cache_key, claims, ttl=claims["exp"] - time.time())
+        return claims
+
+    def stats(self) -> dict:
+        return {
+            "keys_loaded": len(self._keys),
+            "keys_expire_in_s": max(round(self._keys_expire_at - time.monotonic(), 1), 0.0),
+            "key_refreshes": self.key_refreshes,
+            "key_refresh_failures": self.key_refresh_failures,
+            "verifications": self.verifications,
+            "failures": self.failures,
+            "claims_cache": self._claims_cache.stats(),
+        }
+
+    async def _decode(self, id_token: str) -> dict:
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.PyJWTError:
+            raise FirebaseAuthException("Malformed ID token")
+
+        if header.get("alg") != "RS256":
+            raise FirebaseAuthException("ID token has an invalid algorithm")
+
+        key = await self._get_key(header.get("kid"))
+        project_id = get_project_id()
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=["RS256"],
+                audience=project_id,
+                issuer=f"https://securetoken.google.com/{project_id}",
+                leeway=settings.TOKEN_CLOCK_SKEW,
+                options={"require": ["exp", "iat", "sub", "aud", "iss"]},
+            )
+        except jwt.ExpiredSignatureError:
+            raise FirebaseAuthException("ID token has expired")
+        except jwt.PyJWTError as e:
+            raise FirebaseAuthException(f"Invalid ID token: {e}")
+
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise FirebaseAuthException("ID token has an invalid subject")
+        if claims.get("auth_time", 0) > time.time() + settings.TOKEN_CLOCK_SKEW:
+            raise FirebaseAuthException("ID token has an invalid auth_time")
+
+        return claims
+
+    async def _get_key(self, kid: Optional[str]):
+        if not self._keys or time.monotonic() >= self._keys_expire_at:
+            await self._refresh_keys()
+
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._last_forced_refresh > _UNKNOWN_KID_REFRESH_INTERVAL:
+            # Keys may have rotated before our copy expired
+            self._last_forced_refresh = time.monotonic()
+            await self._refresh_keys(force=True)
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise FirebaseAuthException("ID token signed with an unknown key")
+        return key
+
+    async def _refresh_keys(self, force: bool = False):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if not force and self._keys and time.monotonic() < self._keys_expire_at:
+                # Another coroutine refreshed while we waited
+                return
+
+            try:
+                session = http_client.get_session()
+                async with session.get(settings.FIREBASE_CERTS_URL) as resp:
+                    if resp.status != 200:
+                        raise ValueError(f"unexpected status {resp.status}")
+                    certs = await resp.json()
+                    max_age = self._parse_max_age(resp.headers.get("Cache-Control"))
+
+                self._keys = {
+                    kid: load_pem_x509_certificate(pem.encode()).public_key()
+                    for kid, pem in certs.items()
+                }
+                self._keys_expire_at = time.monotonic() + max_age
+                self.key_refreshes += 1
+                logger.info(f"Google signing keys refreshed: {len(self._keys)} keys, max-age {max_age}s")
+            except Exception as e:
+                self.key_refresh_failures += 1
+                if not self._keys:
+                    raise ServiceUnavailableException(f"Unable to fetch Google signing keys: {e}")
+                # Keep serving with the keys we have and try again shortly
+                self._keys_expire_at = time.monotonic() + _RETRY_DELAY
+                logger.warning(f"Google signing keys refresh failed, keeping cached keys: {e}")
+
+    async def _refresh_loop(self):
+        while True:
+            delay = self._keys_expire_at - time.monotonic() - settings.FIREBASE_CERTS_REFRESH_MARGIN
+            await asyncio.sleep(max(delay, _RETRY_DELAY))
+            try:
+                await self._refresh_keys(force=True)
+            except ServiceUnavailableException as e:
+                logger.warning(f"Background refresh of Google signing keys failed: {e.message}")
+
+    @staticmethod
+    def _parse_max_age(cache_control: Optional[str]) -> int:
+        match = _MAX_AGE_RE.search(cache_control or "")
+        return int(match.group(1)) if match else _DEFAULT_MAX_AGE
+
+
+# Global instance
+firebase_token_verifier = FirebaseTokenVerifier()
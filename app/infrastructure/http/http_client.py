@@ -0,0 +1,113 @@
+import time
+import logging
+from typing import Optional
+import aiohttp
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    """Long-lived aiohttp client with a pooled, keep-alive connector"""
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+
+        # Pool metrics
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.acquire_waits = 0
+        self.acquire_wait_total = 0.0
+        self.acquire_wait_max = 0.0
+
+    def init_session(self):
+        """Creates the shared session and connector if not already done."""
+        if self.session and not self.session.closed:
+            return
+
+        self._connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.HTTP_TOTAL_TIMEOUT,
+            connect=settings.HTTP_CONNECT_TIMEOUT,
+            sock_read=settings.HTTP_READ_TIMEOUT,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=timeout,
+            trace_configs=[self._build_trace_config()],
+        )
+        logger.info("HTTP client session created")
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Gets the shared session, creating it lazily."""
+        if not self.session or self.session.closed:
+            self.init_session()
+        return self.session
+
+    async def close_session(self):
+        """Closes the shared session and its pooled connections."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+            logger.info(f"HTTP client session closed - stats: {self.stats()}")
+        self.session = None
+        self._connector = None
+
+    def stats(self) -> dict:
+        """Pool statistics for sizing the connector"""
+        acquired = 0
+        idle = 0
+        waiting = 0
+        if self._connector and not self._connector.closed:
+            # aiohttp does not expose these counters publicly
+            acquired = len(getattr(self._connector, "_acquired", ()))
+            idle = sum(len(conns) for conns in getattr(self._connector, "_conns", {}).values())
+            waiting = sum(len(waiters) for waiters in getattr(self._connector, "_waiters", {}).values())
+
+        return {
+            "limit": settings.HTTP_POOL_LIMIT,
+            "limit_per_host": settings.HTTP_POOL_LIMIT_PER_HOST,
+            "open": acquired + idle,
+            "in_use": acquired,
+            "idle": idle,
+            "waiting": waiting,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "acquire_waits": self.acquire_waits,
+            "acquire_wait_avg_ms": round(self.acquire_wait_total / self.acquire_waits * 1000, 3) if self.acquire_waits else 0.0,
+            "acquire_wait_max_ms": round(self.acquire_wait_max * 1000, 3),
+        }
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+
+        async def on_queued_end(session, ctx, params):
+            waited = time.perf_counter() - getattr(ctx, "queued_at", time.perf_counter())
+            self.acquire_waits += 1
+            self.acquire_wait_total += waited
+            self.acquire_wait_max = max(self.acquire_wait_max, waited)
+
+        async def on_create_end(session, ctx, params):
+            self.connections_created += 1
+
+        async def on_reuse(session, ctx, params):
+            self.connections_reused += 1
+
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_create_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+
+# Global instance
+http_client = HttpClient()
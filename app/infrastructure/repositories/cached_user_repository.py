@@ -0,0 +1,224 @@
+from typing import AsyncIterator, Optional
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.cache_backend import CacheBackend
+from app.infrastructure.database.unit_of_work import current_unit_of_work
+from app.shared.cache import MISSING, TTLCache
+from app.shared.enums import PIANO_LEVELS_BY_VALUE
+
+
+class CachedUserRepository(UserRepository):
+    """Read-through cache of user profiles by UID in front of another user repository.
+
+    Entries live in a CacheBackend under versioned keys: `v:{uid}` holds the UID's version and
+    `u:{uid}` holds {"v": version, "u": profile or None}. Both are read with one multi-get and an
+    entry only counts when its version matches, so a write invalidates every worker at once by
+    bumping the version. A load that overlapped a write stores the version it read before the
+    load, which is already stale and therefore ignored.
+
+    Not-found UIDs are cached too, with `negative_ttl`. With `l1` set, hits are also kept in an
+    in-process cache; other workers can then see a stale profile for up to the L1 TTL.
+
+    Inside a unit of work reads skip the cache (they must see the transaction) and invalidations
+    wait for the commit, so no other request can cache the old row under the new version.
+    """
+
+    def __init__(
+        self,
+        inner: UserRepository,
+        backend: CacheBackend,
+        ttl: float,
+        negative_ttl: float,
+        version_ttl: float,
+        l1: Optional[TTLCache] = None,
+    ):
+        self.inner = inner
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.version_ttl = version_ttl
+        self.l1 = l1
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.stale_versions = 0
+        self.invalidations = 0
+
+    async def get_user_by_uid(self, uid: str) -> Optional[User]:
+        if current_unit_of_work() is not None:
+            return await self.inner.get_user_by_uid(uid)
+        users = await self._get_many([uid])
+        return users.get(uid)
+
+    async def get_users_by_uids(self, uids: list[str]) -> dict[str, User]:
+        if current_unit_of_work() is not None:
+            return await self.inner.get_users_by_uids(uids)
+        return await self._get_many(uids)
+
+    async def create_user(self, user: User) -> User:
+        try:
+            return await self.inner.create_user(user)
+        finally:
+            await self._invalidate([user.uid])
+
+    async def create_users_bulk(self, users: list[User]) -> dict[str, str]:
+        try:
+            return await self.inner.create_users_bulk(users)
+        finally:
+            await self._invalidate([user.uid for user in users])
+
+    async def update_user(self, user: User) -> User:
+        try:
+            return await self.inner.update_user(user)
+        finally:
+            await self._invalidate([user.uid])
+
+    async def update_user_fields(self, uid: str, fields: dict) -> bool:
+        try:
+            return await self.inner.update_user_fields(uid, fields)
+        finally:
+            await self._invalidate([uid])
+
+    async def update_user_fields_returning(self, uid: str, fields: dict) -> Optional[User]:
+        try:
+            return await self.inner.update_user_fields_returning(uid, fields)
+        finally:
+            await self._invalidate([uid])
+
+    async def delete_user(self, uid: str) -> bool:
+        try:
+            return await self.inner.delete_user(uid)
+        finally:
+            await self._invalidate([uid])
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        return await self.inner.get_user_by_email(email)
+
+    async def get_all_users(self) -> list[User]:
+        return await self.inner.get_all_users()
+
+    async def get_users_page(self, limit: int, after_uid: Optional[str] = None) -> list[User]:
+        return await self.inner.get_users_page(limit, after_uid)
+
+    def stream_users(self, batch_size: int) -> AsyncIterator[User]:
+        return self.inner.stream_users(batch_size)
+
+    async def user_exists_by_uid(self, uid: str) -> bool:
+        return await self.get_user_by_uid(uid) is not None
+
+    async def user_exists_by_email(self, email: str) -> bool:
+        return await self.inner.user_exists_by_email(email)
+
+    async def close(self):
+        await self.backend.close()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "negative_hits": self.negative_hits,
+            "stale_versions": self.stale_versions,
+            "invalidations": self.invalidations,
+            "l1": self.l1.stats() if self.l1 is not None else None,
+            "backend": self.backend.stats(),
+        }
+
+    async def _get_many(self, uids: list[str]) -> dict[str, User]:
+        found: dict[str, Optional[User]] = {}
+        pending = []
+        for uid in dict.fromkeys(uids):
+            cached = self.l1.get(uid) if self.l1 is not None else MISSING
+            if cached is MISSING:
+                pending.append(uid)
+            else:
+                self._count_hit(cached)
+                found[uid] = cached
+
+        if pending:
+            # One multi-get for every version and data key
+            keys = []
+            for uid in pending:
+                keys.extend((f"v:{uid}", f"u:{uid}"))
+            values = await self.backend.get_many(keys)
+
+            versions = {}
+            for i, uid in enumerate(pending):
+                version = int(values[2 * i] or 0)
+                entry = values[2 * i + 1]
+                if entry is not None and entry["v"] == version:
+                    user = self._from_cache(entry["u"])
+                    self._count_hit(user)
+                    found[uid] = user
+                    if self.l1 is not None:
+                        self.l1.set(uid, user, None if user is not None else min(self.negative_ttl, self.l1.ttl))
+                else:
+                    if entry is not None:
+                        self.stale_versions += 1
+                    versions[uid] = version
+
+            if versions:
+                await self._load(versions, found)
+
+        return {uid: user for uid, user in found.items() if user is not None}
+
+    def _count_hit(self, user: Optional[User]):
+        self.hits += 1
+        if user is None:
+            self.negative_hits += 1
+
+    async def _load(self, versions: dict[str, int], found: dict[str, Optional[User]]):
+        """Loads missed UIDs from the inner repository and stores them under the version read before the load"""
+        self.misses += len(versions)
+        loaded = await self.inner.get_users_by_uids(list(versions))
+
+        positive, negative = {}, {}
+        for uid, version in versions.items():
+            user = loaded.get(uid)
+            found[uid] = user
+            if user is not None:
+                positive[f"u:{uid}"] = {"v": version, "u": self._to_cache(user)}
+            else:
+                negative[f"u:{uid}"] = {"v": version, "u": None}
+
+        await self.backend.set_many(positive, self.ttl)
+        await self.backend.set_many(negative, self.negative_ttl)
+
+    async def _invalidate(self, uids: list[str]):
+        if not uids:
+            return
+
+        work = current_unit_of_work()
+        if work is not None:
+            work.after_commit(lambda: self._drop(uids))
+        else:
+            await self._drop(uids)
+
+    async def _drop(self, uids: list[str]):
+        if self.l1 is not None:
+            for uid in uids:
+                self.l1.delete(uid)
+        await self.backend.invalidate(
+            version_keys=[f"v:{uid}" for uid in uids],
+            data_keys=[f"u:{uid}" for uid in uids],
+            version_ttl=self.version_ttl,
+        )
+        self.invalidations += len(uids)
+
+    @staticmethod
+    def _to_cache(user: User) -> dict:
+        return user.to_dict()
+
+    @staticmethod
+    def _from_cache(data: Optional[dict]) -> Optional[User]:
+        if data is None:
+            return None
+        return User(
+            uid=data["uid"],
+            email=data["email"],
+            name=data["name"],
+            piano_level=PIANO_LEVELS_BY_VALUE[data["piano_level"]],
+        )
@@ -0,0 +1,100 @@
+from typing import AsyncIterator, Optional
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.database.unit_of_work import current_unit_of_work
+from app.shared.single_flight import SingleFlight
+
+
+class CoalescingUserRepository(UserRepository):
+    """Shares one in-flight query between concurrent reads of the same UID.
+
+    A burst of identical reads then uses one pool connection instead of one each. Writes make
+    later reads of the UID start a fresh query, so no caller that arrives after a write gets a
+    result loaded before it. Reads inside a unit of work see that transaction and are never shared.
+    """
+
+    def __init__(self, inner: UserRepository):
+        self.inner = inner
+        self._flights = SingleFlight()
+
+    async def get_user_by_uid(self, uid: str) -> Optional[User]:
+        if current_unit_of_work() is not None:
+            return await self.inner.get_user_by_uid(uid)
+        return await self._flights.do(("user", uid), lambda: self.inner.get_user_by_uid(uid))
+
+    async def user_exists_by_uid(self, uid: str) -> bool:
+        if current_unit_of_work() is not None:
+            return await self.inner.user_exists_by_uid(uid)
+        return await self._flights.do(("exists", uid), lambda: self.inner.user_exists_by_uid(uid))
+
+    async def create_user(self, user: User) -> User:
+        try:
+            return await self.inner.create_user(user)
+        finally:
+            self._forget(user.uid)
+
+    async def create_users_bulk(self, users: list[User]) -> dict[str, str]:
+        try:
+            return await self.inner.create_users_bulk(users)
+        finally:
+            self._forget(*(user.uid for user in users))
+
+    async def update_user(self, user: User) -> User:
+        try:
+            return await self.inner.update_user(user)
+        finally:
+            self._forget(user.uid)
+
+    async def update_user_fields(self, uid: str, fields: dict) -> bool:
+        try:
+            return await self.inner.update_user_fields(uid, fields)
+        finally:
+            self._forget(uid)
+
+    async def update_user_fields_returning(self, uid: str, fields: dict) -> Optional[User]:
+        try:
+            return await self.inner.update_user_fields_returning(uid, fields)
+        finally:
+            self._forget(uid)
+
+    async def delete_user(self, uid: str) -> bool:
+        try:
+            return await self.inner.delete_user(uid)
+        finally:
+            self._forget(uid)
+
+    async def get_users_by_uids(self, uids: list[str]) -> dict[str, User]:
+        return await self.inner.get_users_by_uids(uids)
+
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        return await self.inner.get_user_by_email(email)
+
+    async def get_all_users(self) -> list[User]:
+        return await self.inner.get_all_users()
+
+    async def get_users_page(self, limit: int, after_uid: Optional[str] = None) -> list[User]:
+        return await self.inner.get_users_page(limit, after_uid)
+
+    def stream_users(self, batch_size: int) -> AsyncIterator[User]:
+        return self.inner.stream_users(batch_size)
+
+    async def user_exists_by_email(self, email: str) -> bool:
+        return await self.inner.user_exists_by_email(email)
+
+    def stats(self) -> dict:
+        return self._flights.stats()
+
+    def _forget(self, *uids: str):
+        self._forget_flights(uids)
+
+        work = current_unit_of_work()
+        if work is not None:
+            # Reads started before the commit must not be shared with callers arriving after it
+            async def forget_committed():
+                self._forget_flights(uids)
+            work.after_commit(forget_committed)
+
+    def _forget_flights(self, uids: tuple[str, ...]):
+        for uid in uids:
+            self._flights.forget(("user", uid))
+            self._flights.forget(("exists", uid))
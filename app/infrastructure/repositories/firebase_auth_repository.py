@@ -1,26 +1,76 @@
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+from typing import Any, Callable, Optional
 import aiohttp
 import firebase_admin.auth as firebase_auth
+from firebase_admin import exceptions as firebase_exceptions
 from app.domain.repositories.auth_repository import AuthRepository
 from app.domain.entities.auth import Auth
+from app.domain.entities.bulk_import import AccountCredentials, BulkImportResult
 from app.domain.entities.login import Login
 from app.domain.entities.token import Token
+from app.domain.entities.verified_token import VerifiedToken
+from app.core.config import settings
 from app.core.exceptions import (
     UserAlreadyExistsException,
     FirebaseAuthException,
     UserNotFoundException,
+    ServiceUnavailableException,
 )
 from app.core.firebase_config import get_web_api_key
+from app.infrastructure.http.http_client import http_client
+from app.infrastructure.firebase.admin_executor import firebase_admin_executor
+from app.infrastructure.firebase.token_verifier import firebase_token_verifier
+from app.shared.circuit_breaker import CircuitBreaker
+from app.shared.hedging import HedgedCall
+from app.shared.retry import retry_with_backoff
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamError(Exception):
+    """Transient Firebase failure (5xx or 429)"""
+
+
+# Failures that mean Google is slow or down, as opposed to a rejected request
+REST_FAILURES = (TimeoutError, aiohttp.ClientError, UpstreamError)
+ADMIN_FAILURES = (
+    TimeoutError,
+    firebase_exceptions.UnavailableError,
+    firebase_exceptions.DeadlineExceededError,
+    firebase_exceptions.InternalError,
+    firebase_exceptions.UnknownError,
+    firebase_exceptions.ResourceExhaustedError,
+)
 
 
 class FirebaseAuthRepository(AuthRepository):
     """Auth repository implementation using Firebase Authentication"""
 
+    def __init__(self):
+        self.rest_breaker = self._build_breaker("Firebase REST", REST_FAILURES)
+        self.admin_breaker = self._build_breaker("Firebase Admin", ADMIN_FAILURES)
+        self.login_hedge: Optional[HedgedCall] = None
+        if settings.FIREBASE_LOGIN_HEDGE_ENABLED:
+            self.login_hedge = HedgedCall(
+                delay=settings.FIREBASE_LOGIN_HEDGE_DELAY,
+                budget_ratio=settings.FIREBASE_LOGIN_HEDGE_BUDGET,
+            )
+
     async def register_user(self, email: str, password: str) -> Auth:
         try:
-            user = firebase_auth.create_user(email=email, password=password)
+            # Not safe to abandon once started: the account would exist while the client gets a 503
+            user = await self._call_admin(
+                firebase_auth.create_user, email=email, password=password, finish_started=True
+            )
             return Auth(uid=user.uid, email=user.email)
         except firebase_auth.EmailAlreadyExistsError:
             raise UserAlreadyExistsException()
+        except ServiceUnavailableException:
+            raise
         except Exception as e:
             raise FirebaseAuthException(str(e))
 
@@ -28,28 +78,181 @@ class FirebaseAuthRepository(AuthRepository):
         url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={get_web_api_key()}"
         payload = {"email": email, "password": password, "returnSecureToken": True}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload) as resp:
-                if resp.status != 200:
-                    raise UserNotFoundException("Invalid credentials")
-                data = await resp.json()
-                return Login(
-                    uid=data["localId"],
-                    email=data["email"],
-                    id_token=data["idToken"],
-                    refresh_token=data["refreshToken"],
-                )
+        def sign_in():
+            return self._post(url, settings.FIREBASE_LOGIN_TIMEOUT, json=payload)
+
+        try:
+            if self.login_hedge:
+                data = await self.rest_breaker.call(lambda: self.login_hedge.run(sign_in))
+            else:
+                data = await self.rest_breaker.call(sign_in)
+        except REST_FAILURES as e:
+            raise ServiceUnavailableException(f"Firebase login failed: {self._describe(e)}")
+
+        if data is None:
+            raise UserNotFoundException("Invalid credentials")
+        return Login(
+            uid=data["localId"],
+            email=data["email"],
+            id_token=data["idToken"],
+            refresh_token=data["refreshToken"],
+        )
 
     async def refresh_token(self, refresh_token: str) -> Token:
         url = f"https://securetoken.googleapis.com/v1/token?key={get_web_api_key()}"
         payload = {"grant_type": "refresh_token", "refresh_token": refresh_token}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=payload) as resp:
+        try:
+            async with asyncio.timeout(settings.FIREBASE_REFRESH_DEADLINE):
+                data = await retry_with_backoff(
+                    lambda: self.rest_breaker.call(
+                        lambda: self._post(url, settings.FIREBASE_REFRESH_TIMEOUT, data=payload)
+                    ),
+                    retry_on=REST_FAILURES,
+                    attempts=settings.FIREBASE_REFRESH_ATTEMPTS,
+                    base_delay=settings.FIREBASE_RETRY_BASE_DELAY,
+                    max_delay=settings.FIREBASE_RETRY_MAX_DELAY,
+                )
+        except REST_FAILURES as e:
+            raise ServiceUnavailableException(f"Firebase token refresh failed: {self._describe(e)}")
+
+        if data is None:
+            raise FirebaseAuthException("Invalid refresh token")
+        return Token(
+            id_token=data["id_token"],
+            refresh_token=data["refresh_token"],
+        )
+
+    async def verify_id_token(self, id_token: str) -> VerifiedToken:
+        claims = await firebase_token_verifier.verify(id_token)
+        return VerifiedToken(
+            uid=claims["sub"],
+            email=claims.get("email"),
+            expires_at=claims["exp"],
+            claims=claims,
+        )
+
+    async def import_users(self, accounts: list[AccountCredentials]) -> list[BulkImportResult]:
+        # UIDs and hashes are built first, outside the deadline, so a failed import can be undone
+        records = await firebase_admin_executor.run(self._build_import_records, accounts)
+        rounds = settings.BULK_IMPORT_HASH_ROUNDS
+        try:
+            result = await self._call_admin(
+                firebase_auth.import_users,
+                records,
+                hash_alg=firebase_auth.UserImportHash.pbkdf2_sha256(rounds=rounds),
+                deadline=settings.FIREBASE_IMPORT_TIMEOUT,
+                finish_started=True,
+            )
+        except ServiceUnavailableException:
+            # A 503 or a timeout does not say which accounts were created: remove all of them
+            await self._delete_unconfirmed([record.uid for record in records])
+            raise
+        except Exception as e:
+            raise FirebaseAuthException(str(e))
+
+        errors = {error.index: error.reason for error in result.errors}
+        return [
+            BulkImportResult(
+                index=index,
+                email=record.email,
+                uid=None if index in errors else record.uid,
+                error=errors.get(index),
+            )
+            for index, record in enumerate(records)
+        ]
+
+    async def delete_users(self, uids: list[str]) -> None:
+        try:
+            result = await self._call_admin(
+                firebase_auth.delete_users, uids, deadline=settings.FIREBASE_IMPORT_TIMEOUT
+            )
+        except ServiceUnavailableException:
+            raise
+        except Exception as e:
+            raise FirebaseAuthException(str(e))
+
+        if result.failure_count:
+            reasons = "; ".join(error.reason for error in result.errors)
+            logger.error(f"Failed to delete {result.failure_count} Firebase users: {reasons}")
+
+    def stats(self) -> dict:
+        return {
+            "rest_breaker": self.rest_breaker.stats(),
+            "admin_breaker": self.admin_breaker.stats(),
+            "login_hedge": self.login_hedge.stats() if self.login_hedge else None,
+        }
+
+    async def _post(self, url: str, timeout: float, **kwargs) -> Optional[dict]:
+        """POSTs to a Firebase REST endpoint. Returns None when the request is rejected (4xx)."""
+        async with asyncio.timeout(timeout):
+            session = http_client.get_session()
+            async with session.post(url, **kwargs) as resp:
+                if resp.status >= 500 or resp.status == 429:
+                    raise UpstreamError(f"HTTP {resp.status}")
                 if resp.status != 200:
-                    raise FirebaseAuthException("Invalid refresh token")
-                data = await resp.json()
-                return Token(
-                    id_token=data["id_token"],
-                    refresh_token=data["refresh_token"],
-                )
\ No newline at end of file
+                    return None
+                return await resp.json()
+
+    async def _call_admin(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        deadline: Optional[float] = None,
+        finish_started: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Runs an Admin SDK call in the executor with a deadline, behind the Admin breaker.
+
+        With `finish_started` the deadline only bounds the wait for a worker: writes that are not
+        safe to abandon run to completion (bounded by the SDK's own HTTP timeout).
+        """
+        timeout = deadline or settings.FIREBASE_ADMIN_TIMEOUT
+
+        async def call():
+            if finish_started:
+                return await firebase_admin_executor.run(fn, *args, start_timeout=timeout, **kwargs)
+            async with asyncio.timeout(timeout):
+                return await firebase_admin_executor.run(fn, *args, **kwargs)
+
+        try:
+            return await self.admin_breaker.call(call)
+        except ADMIN_FAILURES as e:
+            raise ServiceUnavailableException(f"Firebase Admin call failed: {self._describe(e)}")
+
+    async def _delete_unconfirmed(self, uids: list[str]):
+        try:
+            await self.delete_users(uids)
+        except (ServiceUnavailableException, FirebaseAuthException) as e:
+            logger.error("Could not delete %s possibly imported Firebase accounts: %s", len(uids), e.message)
+
+    @staticmethod
+    def _build_import_records(accounts: list[AccountCredentials]) -> list[firebase_auth.ImportUserRecord]:
+        """Assigns the UIDs and hashes the passwords (runs in the Admin executor)"""
+        rounds = settings.BULK_IMPORT_HASH_ROUNDS
+        records = []
+        for account in accounts:
+            salt = os.urandom(16)
+            records.append(firebase_auth.ImportUserRecord(
+                uid=uuid.uuid4().hex,
+                email=account.email,
+                display_name=account.display_name,
+                password_hash=hashlib.pbkdf2_hmac("sha256", account.password.encode(), salt, rounds),
+                password_salt=salt,
+            ))
+        return records
+
+    @staticmethod
+    def _build_breaker(name: str, failure_types: tuple) -> CircuitBreaker:
+        return CircuitBreaker(
+            name,
+            failure_types=failure_types,
+            failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            minimum_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            window_seconds=settings.CIRCUIT_BREAKER_WINDOW,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+        )
+
+    @staticmethod
+    def _describe(error: BaseException) -> str:
+        return "timed out" if isinstance(error, TimeoutError) else str(error) or type(error).__name__
@@ -1,11 +1,14 @@
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional, List, TypeVar
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import UserRepository
+from app.core.config import settings
 from app.infrastructure.database.models.user_model import UserModel
 from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.database.unit_of_work import current_unit_of_work
 from app.core.exceptions import (
     DatabaseConnectionException,
     InvalidUserDataException,
@@ -13,135 +16,350 @@ from app.core.exceptions import (
     UserNotFoundException
 )
 import logging
+import re
 
-from app.shared.enums import PianoLevel
+from app.shared.enums import PIANO_LEVELS_BY_VALUE, PianoLevel
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# ER_DUP_ENTRY, ER_DUP_ENTRY_WITH_KEY_NAME
+_DUPLICATE_ENTRY_ERRORS = (1062, 1586)
+# "Duplicate entry 'x' for key 'email'" (MySQL 8 prefixes the table: 'Student.email')
+_DUPLICATE_KEY_RE = re.compile(r"for key '(?:[^'.]+\.)?([^'.]+)'")
+_UPDATABLE_FIELDS = {"email", "name", "piano_level"}
+# Reads select plain columns and build User from the row tuples: no ORM identity map or model instances
+_USER_COLUMNS = (UserModel.uid, UserModel.email, UserModel.name, UserModel.piano_level)
+
 
 class MySQLUserRepository(UserRepository):
     """Concrete implementation of the user repository using MySQL"""
 
     async def create_user(self, user: User) -> User:
-        async with mysql_connection.get_async_session() as session:
+        async with self._session() as session:
+            # Insert first and let the unique constraints detect conflicts: one round trip
+            created = User(
+                uid=user.uid,
+                email=user.email.lower(),
+                name=user.name.strip(),
+                piano_level=user.piano_level
+            )
             try:
-                user_model = UserModel(
-                    uid=user.uid,
-                    email=user.email.lower(),
-                    name=user.name.strip(),
-                    piano_level=user.piano_level.value
-                )
-                session.add(user_model)
-                await session.commit()
-                await session.refresh(user_model)
-                return self._model_to_entity(user_model)
+                await session.execute(insert(UserModel).values(
+                    uid=created.uid,
+                    email=created.email,
+                    name=created.name,
+                    piano_level=created.piano_level.value
+                ))
+                await self._commit(session)
+                mysql_connection.mark_written(created.uid)
+                return created
 
             except IntegrityError as e:
-                await session.rollback()
-                if "uid" in str(e):
+                await self._rollback(session)
+                key = self._duplicate_key(e)
+                if key == "PRIMARY":
                     raise UserAlreadyExistsException(f"User with UID {user.uid} already exists")
-                elif "email" in str(e):
+                elif key == "email":
                     raise UserAlreadyExistsException(f"User with email {user.email} already exists")
                 else:
+                    logger.warning(f"Integrity error creating user {user.uid}: {e.orig}")
                     raise UserAlreadyExistsException("User already exists")
             except SQLAlchemyError as e:
-                await session.rollback()
+                await self._rollback(session)
                 logger.error(f"Database error creating user: {e}")
                 raise DatabaseConnectionException(f"Error creating user: {str(e)}")
 
-    async def get_user_by_uid(self, uid: str) -> Optional[User]:
+    async def create_users_bulk(self, users: list[User]) -> dict[str, str]:
+        if not users:
+            return {}
+
+        # Always its own transaction: callers commit each batch separately
         async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel).where(UserModel.uid == uid))
-                user_model = result.scalar_one_or_none()
-                return self._model_to_entity(user_model) if user_model else None
-            except SQLAlchemyError as e:
-                logger.error(f"Database error getting user by UID: {e}")
-                raise DatabaseConnectionException(f"Error getting user by UID: {str(e)}")
+            # A concurrent writer can slip in between the conflict check and the insert: check again once
+            for attempt in range(2):
+                try:
+                    rejected = await self._find_conflicts(session, users)
+                    rows = [
+                        {
+                            "uid": user.uid,
+                            "email": user.email.lower(),
+                            "name": user.name.strip(),
+                            "piano_level": user.piano_level.value,
+                        }
+                        for user in users if user.uid not in rejected
+                    ]
+                    if rows:
+                        await session.execute(insert(UserModel).values(rows))
+                    await session.commit()
+                    mysql_connection.mark_written(*(row["uid"] for row in rows))
+                    return rejected
+
+                except IntegrityError as e:
+                    await session.rollback()
+                    if attempt == 1:
+                        logger.warning(f"Bulk insert of {len(users)} users kept conflicting: {e.orig}")
+                        return {user.uid: "User already exists" for user in users}
+                except SQLAlchemyError as e:
+                    await session.rollback()
+                    logger.error(f"Database error creating users in bulk: {e}")
+                    raise DatabaseConnectionException(f"Error creating users in bulk: {str(e)}")
+
+    async def get_user_by_uid(self, uid: str) -> Optional[User]:
+        async def query(session: AsyncSession) -> Optional[User]:
+            result = await session.execute(select(*_USER_COLUMNS).where(UserModel.uid == uid))
+            row = result.first()
+            return self._row_to_entity(row) if row else None
+
+        return await self._run(query, "getting user by UID", lambda: mysql_connection.get_read_session(uid))
+
+    async def get_users_by_uids(self, uids: list[str]) -> dict[str, User]:
+        if not uids:
+            return {}
+
+        chunk_size = settings.BATCH_GET_CHUNK_SIZE
+
+        async def query(session: AsyncSession) -> dict[str, User]:
+            users = {}
+            for start in range(0, len(uids), chunk_size):
+                result = await session.execute(
+                    select(*_USER_COLUMNS).where(UserModel.uid.in_(uids[start:start + chunk_size]))
+                )
+                for row in result:
+                    users[row[0]] = self._row_to_entity(row)
+            return users
+
+        # Stays on the primary: the user cache fills from here and must not store a lagging replica's row
+        return await self._run(query, "getting users by UIDs")
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel).where(UserModel.email == email.lower()))
-                user_model = result.scalar_one_or_none()
-                return self._model_to_entity(user_model) if user_model else None
-            except SQLAlchemyError as e:
-                logger.error(f"Database error getting user by email: {e}")
-                raise DatabaseConnectionException(f"Error getting user by email: {str(e)}")
+        async def query(session: AsyncSession) -> Optional[User]:
+            result = await session.execute(select(*_USER_COLUMNS).where(UserModel.email == email.lower()))
+            row = result.first()
+            return self._row_to_entity(row) if row else None
+
+        return await self._run(query, "getting user by email")
 
     async def get_all_users(self) -> List[User]:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel))
-                users = result.scalars().all()
-                return [self._model_to_entity(u) for u in users]
-            except SQLAlchemyError as e:
-                logger.error(f"Database error getting all users: {e}")
-                raise DatabaseConnectionException(f"Error getting all users: {str(e)}")
+        async def query(session: AsyncSession) -> List[User]:
+            result = await session.execute(select(*_USER_COLUMNS))
+            return [self._row_to_entity(row) for row in result]
+
+        return await self._run(query, "getting all users", mysql_connection.get_read_session)
+
+    async def get_users_page(self, limit: int, after_uid: Optional[str] = None) -> List[User]:
+        # Keyset pagination: seek on the primary key instead of OFFSET
+        statement = select(*_USER_COLUMNS).order_by(UserModel.uid).limit(limit)
+        if after_uid is not None:
+            statement = statement.where(UserModel.uid > after_uid)
+
+        async def query(session: AsyncSession) -> List[User]:
+            result = await session.execute(statement)
+            return [self._row_to_entity(row) for row in result]
+
+        return await self._run(query, "getting users page", mysql_connection.get_read_session)
+
+    async def stream_users(self, batch_size: int) -> AsyncIterator[User]:
+        async with mysql_connection.export_slot():
+            async with mysql_connection.get_export_session() as session:
+                try:
+                    # Server-side cursor: rows are fetched `batch_size` at a time as the consumer iterates
+                    result = await session.stream(
+                        select(*_USER_COLUMNS)
+                        .order_by(UserModel.uid)
+                        .execution_options(yield_per=batch_size)
+                    )
+                    async for rows in result.partitions():
+                        for row in rows:
+                            yield self._row_to_entity(row)
+                except SQLAlchemyError as e:
+                    logger.error(f"Database error streaming users: {e}")
+                    raise DatabaseConnectionException(f"Error streaming users: {str(e)}")
 
     async def user_exists_by_uid(self, uid: str) -> bool:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel.uid).where(UserModel.uid == uid))
-                return result.scalar_one_or_none() is not None
-            except SQLAlchemyError as e:
-                logger.error(f"Database error checking user existence by UID: {e}")
-                raise DatabaseConnectionException(f"Error checking user existence by UID: {str(e)}")
+        async def query(session: AsyncSession) -> bool:
+            result = await session.execute(select(UserModel.uid).where(UserModel.uid == uid))
+            return result.scalar_one_or_none() is not None
+
+        return await self._run(
+            query, "checking user existence by UID", lambda: mysql_connection.get_read_session(uid)
+        )
 
     async def user_exists_by_email(self, email: str) -> bool:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel.email).where(UserModel.email == email.lower()))
-                return result.scalar_one_or_none() is not None
-            except SQLAlchemyError as e:
-                logger.error(f"Database error checking user existence by email: {e}")
-                raise DatabaseConnectionException(f"Error checking user existence by email: {str(e)}")
+        async def query(session: AsyncSession) -> bool:
+            result = await session.execute(select(UserModel.email).where(UserModel.email == email.lower()))
+            return result.scalar_one_or_none() is not None
+
+        return await self._run(query, "checking user existence by email", mysql_connection.get_read_session)
 
     async def update_user(self, user: User) -> User:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel).where(UserModel.uid == user.uid))
-                user_model = result.scalar_one_or_none()
-                if not user_model:
-                    raise UserNotFoundException(f"User with UID {user.uid} not found")
-
-                user_model.email = user.email.lower()
-                user_model.name = user.name.strip()
-                user_model.piano_level = user.piano_level.value
-
-                await session.commit()
-                await session.refresh(user_model)
-                return self._model_to_entity(user_model)
-            except SQLAlchemyError as e:
-                await session.rollback()
-                logger.error(f"Database error updating user: {e}")
-                raise DatabaseConnectionException(f"Error updating user: {str(e)}")
+        updated = User(
+            uid=user.uid,
+            email=user.email.lower(),
+            name=user.name.strip(),
+            piano_level=user.piano_level
+        )
+        found = await self.update_user_fields(user.uid, {
+            "email": updated.email,
+            "name": updated.name,
+            "piano_level": updated.piano_level,
+        })
+        if not found:
+            raise UserNotFoundException(f"User with UID {user.uid} not found")
+        return updated
+
+    async def update_user_fields(self, uid: str, fields: dict) -> bool:
+        statement = self._update_statement(uid, fields)
+
+        async def write(session: AsyncSession) -> bool:
+            result = await session.execute(statement)
+            await self._commit(session)
+            mysql_connection.mark_written(uid)
+            # The MySQL dialects enable CLIENT.FOUND_ROWS: rowcount is matched rows, not changed rows
+            return result.rowcount > 0
+
+        return await self._run(write, "updating user")
+
+    async def update_user_fields_returning(self, uid: str, fields: dict) -> Optional[User]:
+        statement = self._update_statement(uid, fields)
+
+        async def write(session: AsyncSession) -> Optional[User]:
+            result = await session.execute(statement)
+            if result.rowcount == 0:
+                # Nothing was written: closing the session ends the transaction, and a unit of work
+                # must keep the earlier writes of the request and their after-commit callbacks
+                return None
+
+            # MySQL has no RETURNING: re-read in the same transaction, the row is locked by the UPDATE
+            result = await session.execute(select(*_USER_COLUMNS).where(UserModel.uid == uid))
+            row = result.one()
+            await self._commit(session)
+            mysql_connection.mark_written(uid)
+            return self._row_to_entity(row)
+
+        return await self._run(write, "updating user")
 
     async def delete_user(self, uid: str) -> bool:
-        async with mysql_connection.get_async_session() as session:
-            try:
-                result = await session.execute(select(UserModel).where(UserModel.uid == uid))
-                user_model = result.scalar_one_or_none()
-                if not user_model:
-                    return False
-
-                await session.delete(user_model)
-                await session.commit()
-                return True
-            except SQLAlchemyError as e:
-                await session.rollback()
-                logger.error(f"Database error deleting user: {e}")
-                raise DatabaseConnectionException(f"Error deleting user: {str(e)}")
-
-    def _model_to_entity(self, user_model: UserModel) -> User:
-        try:
-            piano_level_enum = PianoLevel(user_model.piano_level)
-        except ValueError:
+        async def write(session: AsyncSession) -> bool:
+            result = await session.execute(delete(UserModel).where(UserModel.uid == uid))
+            await self._commit(session)
+            mysql_connection.mark_written(uid)
+            return result.rowcount > 0
+
+        return await self._run(write, "deleting user")
+
+    async def _run(
+        self,
+        operation: Callable[[AsyncSession], Awaitable[T]],
+        action: str,
+        open_session: Callable[[], AsyncSession] = mysql_connection.get_async_session,
+    ) -> T:
+        """Runs `operation` in a session, once more if its connection turned out to be dead.
+
+        Checkouts are not pinged, so a connection can fail on its first statement; the retry gets
+        a fresh one. Only for operations that are safe to repeat (not inserts), and never inside a
+        unit of work, whose earlier statements were lost with the connection.
+        """
+        retry = current_unit_of_work() is None
+        for attempt in range(2):
+            async with self._session(open_session) as session:
+                try:
+                    return await operation(session)
+                except DBAPIError as e:
+                    await self._rollback(session)
+                    if retry and attempt == 0 and e.connection_invalidated:
+                        mysql_connection.retried_queries += 1
+                        logger.info(f"Connection lost while {action}, retrying on a new connection")
+                        continue
+                    logger.error(f"Database error {action}: {e}")
+                    raise DatabaseConnectionException(f"Error {action}: {str(e)}")
+                except SQLAlchemyError as e:
+                    await self._rollback(session)
+                    logger.error(f"Database error {action}: {e}")
+                    raise DatabaseConnectionException(f"Error {action}: {str(e)}")
+
+    @staticmethod
+    @asynccontextmanager
+    async def _session(
+        open_session: Callable[[], AsyncSession] = mysql_connection.get_async_session,
+    ) -> AsyncIterator[AsyncSession]:
+        """The request's unit-of-work session if there is one, otherwise a new session closed on exit"""
+        work = current_unit_of_work()
+        if work is not None:
+            yield work.session()
+        else:
+            async with open_session() as session:
+                yield session
+
+    @staticmethod
+    async def _commit(session: AsyncSession):
+        # Inside a unit of work its owner commits once, at the end
+        if current_unit_of_work() is None:
+            await session.commit()
+
+    @staticmethod
+    async def _rollback(session: AsyncSession):
+        work = current_unit_of_work()
+        if work is not None:
+            await work.rollback()
+        else:
+            await session.rollback()
+
+    @staticmethod
+    def _update_statement(uid: str, fields: dict):
+        unknown = set(fields) - _UPDATABLE_FIELDS
+        if unknown:
+            raise InvalidUserDataException(f"Fields cannot be updated: {', '.join(sorted(unknown))}")
+        if not fields:
+            raise InvalidUserDataException("No fields to update")
+
+        values = {
+            name: value.value if isinstance(value, PianoLevel) else value
+            for name, value in fields.items()
+        }
+        return update(UserModel).where(UserModel.uid == uid).values(**values)
+
+    async def _find_conflicts(self, session: AsyncSession, users: list[User]) -> dict[str, str]:
+        """Returns {uid: error} for users that clash with existing rows or with an earlier user in the batch"""
+        uids = [user.uid for user in users]
+        emails = [user.email.lower() for user in users]
+        result = await session.execute(
+            select(UserModel.uid, UserModel.email).where(
+                or_(UserModel.uid.in_(uids), UserModel.email.in_(emails))
+            )
+        )
+        taken_uids, taken_emails = set(), set()
+        for uid, email in result.all():
+            taken_uids.add(uid)
+            taken_emails.add(email.lower())
+
+        rejected = {}
+        for user in users:
+            email = user.email.lower()
+            if user.uid in taken_uids:
+                rejected[user.uid] = f"User with UID {user.uid} already exists"
+            elif email in taken_emails:
+                rejected[user.uid] = f"User with email {user.email} already exists"
+            else:
+                taken_uids.add(user.uid)
+                taken_emails.add(email)
+        return rejected
+
+    @staticmethod
+    def _duplicate_key(error: IntegrityError) -> Optional[str]:
+        """Returns the index name of a MySQL duplicate-key error, None for any other integrity error"""
+        args = getattr(error.orig, "args", ())
+        if len(args) < 2 or args[0] not in _DUPLICATE_ENTRY_ERRORS:
+            return None
+        match = _DUPLICATE_KEY_RE.search(str(args[1]))
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _row_to_entity(row) -> User:
+        """Builds a User from a (uid, email, name, piano_level) row"""
+        uid, email, name, level = row
+        piano_level = PIANO_LEVELS_BY_VALUE.get(level)
+        if piano_level is None:
             raise InvalidUserDataException("Valid piano level is required")
-        
-        return User(
-            uid=user_model.uid,
-            email=user_model.email,
-            name=user_model.name,
-            piano_level=piano_level_enum
-    )
\ No newline at end of file
+        return User(uid=uid, email=email, name=name, piano_level=piano_level)
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
+import orjson
 import logging
 import sys
 import asyncio
@@ -15,11 +16,13 @@ from app.core.exceptions import (
     UserNotFoundException,
     DatabaseConnectionException,
     FirebaseAuthException,
-    ValidationException
+    ValidationException,
+    ServiceUnavailableException
 )
-from app.core.logging import configure_logging
+from app.core.logging import configure_logging, logging_stats
 from app.presentation.api.v1.users import router as users_router
 from app.presentation.api.v1.auth import router as auth_router
+from app.presentation.middleware.logging_middleware import LogSamplingMiddleware
 from app.presentation.middleware.exception_handler import (
     user_service_exception_handler,
     user_already_exists_exception_handler,
@@ -28,10 +31,21 @@ from app.presentation.middleware.exception_handler import (
     database_connection_exception_handler,
     firebase_auth_exception_handler,
     validation_exception_handler,
+    service_unavailable_exception_handler,
     request_validation_exception_handler,
     general_exception_handler
 )
+from app.presentation.api.responses import prebuilt_json_response
+from app.presentation.api.dependencies import (
+    close_user_repository,
+    get_auth_repository,
+    get_refresh_token_use_case,
+    get_user_repository_stats,
+)
 from app.infrastructure.database import mysql_connection
+from app.infrastructure.http.http_client import http_client
+from app.infrastructure.firebase.admin_executor import firebase_admin_executor
+from app.infrastructure.firebase.token_verifier import firebase_token_verifier
 
 
 # Configure logging 
@@ -70,12 +84,30 @@ async def lifespan(app: FastAPI):
     
     # ---------- DB Connections ----------
     await initialize_databases(retry_delay=5)
+    mysql_connection.mysql_connection.start_keeper()
+
+    # ---------- HTTP client (Firebase REST) ----------
+    http_client.init_session()
+
+    # ---------- Firebase Admin executor ----------
+    firebase_admin_executor.start()
+
+    # ---------- Google signing keys (ID token verification) ----------
+    await firebase_token_verifier.start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
-    # Close DBs
+    # Stop signing keys refresh
+    await firebase_token_verifier.stop()
+    # Close HTTP client
+    await http_client.close_session()
+    # Stop Firebase Admin executor
+    firebase_admin_executor.shutdown()
+    # Close user cache backend
+    await close_user_repository()
+    # Close DBs (stops the connection keeper too)
     await mysql_connection.mysql_connection.close_connections()
 
 
@@ -100,6 +132,9 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Per-request sampling of routine log lines
+    app.add_middleware(LogSamplingMiddleware)
+
     # Register exception handlers
     app.add_exception_handler(UserServiceException, user_service_exception_handler)
     app.add_exception_handler(UserAlreadyExistsException, user_already_exists_exception_handler)
@@ -108,6 +143,7 @@ def create_application() -> FastAPI:
     app.add_exception_handler(DatabaseConnectionException, database_connection_exception_handler)
     app.add_exception_handler(FirebaseAuthException, firebase_auth_exception_handler)
     app.add_exception_handler(ValidationException, validation_exception_handler)
+    app.add_exception_handler(ServiceUnavailableException, service_unavailable_exception_handler)
     app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
 
@@ -115,25 +151,44 @@ def create_application() -> FastAPI:
     app.include_router(users_router, prefix="/api/v1")
     app.include_router(auth_router, prefix="/api/v1")
 
+    # Constant payloads, encoded once
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": settings.ENVIRONMENT
+    })
+    root_body = orjson.dumps({
+        "message": f"Welcome to {settings.APP_NAME}",
+        "version": settings.APP_VERSION,
+        "docs_url": "/docs" if settings.DEBUG else "Documentation not available in production"
+    })
+
     # Health check endpoint
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
+        return prebuilt_json_response(health_body)
+    
+    # Metrics endpoint
+    @app.get("/metrics")
+    async def metrics():
+        """Runtime pool and client metrics"""
         return {
-            "status": "healthy",
-            "service": settings.APP_NAME,
-            "version": settings.APP_VERSION,
-            "environment": settings.ENVIRONMENT
+            "http_client": http_client.stats(),
+            "firebase_admin_executor": firebase_admin_executor.stats(),
+            "token_verifier": firebase_token_verifier.stats(),
+            "refresh_token": get_refresh_token_use_case().stats(),
+            "firebase_auth": get_auth_repository().stats(),
+            "user_repository": get_user_repository_stats(),
+            "database": mysql_connection.mysql_connection.stats(),
+            "logging": logging_stats(),
         }
     
     @app.get("/")
     async def root():
         """Root endpoint"""
-        return {
-            "message": f"Welcome to {settings.APP_NAME}",
-            "version": settings.APP_VERSION,
-            "docs_url": "/docs" if settings.DEBUG else "Documentation not available in production"
-        }
+        return prebuilt_json_response(root_body)
     
     return app
 
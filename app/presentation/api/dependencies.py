@@ -1,20 +1,85 @@
 from functools import lru_cache
+from typing import AsyncIterator, Optional
+from fastapi import Depends, Header
+from app.application.dto.auth_dto import VerifiedTokenDTO
+from app.core.exceptions import FirebaseAuthException
+from app.application.use_cases.bulk_register_students import BulkRegisterStudentsUseCase
+from app.application.use_cases.export_users import ExportUsersUseCase
 from app.application.use_cases.get_user import GetUserUseCase
+from app.application.use_cases.ingest_users import IngestUsersUseCase
 from app.application.use_cases.login_user import LoginUserUseCase
 from app.application.use_cases.refresh_token import RefreshTokenUseCase
 from app.application.use_cases.register_auth_user import RegisterAuthUserUseCase
 from app.application.use_cases.update_user_use_case import UpdateUserUseCase
+from app.application.use_cases.verify_token import VerifyTokenUseCase
 from app.domain.services.auth_service import AuthService
+from app.core.config import settings
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from app.infrastructure.database.unit_of_work import UnitOfWork, unit_of_work
+from app.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from app.infrastructure.repositories.coalescing_user_repository import CoalescingUserRepository
 from app.infrastructure.repositories.firebase_auth_repository import FirebaseAuthRepository
 from app.infrastructure.repositories.mysql_user_repository import MySQLUserRepository
 from app.domain.services.user_service import UserService
+from app.shared.cache import TTLCache
 from app.application.use_cases.register_user import RegisterUserUseCase
 
 # Repositories
 @lru_cache()
-def get_user_repository() -> MySQLUserRepository:
-    """Get user repository instance"""
-    return MySQLUserRepository()
+def get_user_repository() -> UserRepository:
+    """Get user repository instance (MySQL, optionally behind the cache and read coalescing)"""
+    repository: UserRepository = MySQLUserRepository()
+    if settings.USER_CACHE_ENABLED:
+        repository = _build_cached_user_repository(repository)
+    if settings.USER_READ_COALESCING_ENABLED:
+        repository = CoalescingUserRepository(repository)
+    return repository
+
+def get_user_repository_stats() -> dict:
+    """Get the metrics of the user repository decorators"""
+    stats = {"cache": None, "read_coalescing": None}
+    repository = get_user_repository()
+    while repository is not None:
+        if isinstance(repository, CachedUserRepository):
+            stats["cache"] = repository.stats()
+        elif isinstance(repository, CoalescingUserRepository):
+            stats["read_coalescing"] = repository.stats()
+        repository = getattr(repository, "inner", None)
+    return stats
+
+async def close_user_repository():
+    """Release the resources held by the user repository decorators"""
+    repository = get_user_repository()
+    while repository is not None:
+        if isinstance(repository, CachedUserRepository):
+            await repository.close()
+        repository = getattr(repository, "inner", None)
+
+def _build_cached_user_repository(repository: UserRepository) -> CachedUserRepository:
+    l1 = None
+    if settings.USER_CACHE_BACKEND == "redis":
+        # Only imported when configured
+        from app.infrastructure.cache.redis_cache_backend import RedisCacheBackend
+        backend = RedisCacheBackend(
+            settings.USER_CACHE_REDIS_URL,
+            key_prefix=settings.USER_CACHE_KEY_PREFIX,
+            timeout=settings.USER_CACHE_REDIS_TIMEOUT,
+            max_connections=settings.USER_CACHE_REDIS_MAX_CONNECTIONS,
+        )
+        if settings.USER_CACHE_L1_TTL > 0:
+            l1 = TTLCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_L1_TTL)
+    else:
+        backend = MemoryCacheBackend(max_size=settings.USER_CACHE_MAX_SIZE)
+
+    return CachedUserRepository(
+        repository,
+        backend,
+        ttl=settings.USER_CACHE_TTL,
+        negative_ttl=settings.USER_CACHE_NEGATIVE_TTL,
+        version_ttl=settings.USER_CACHE_VERSION_TTL,
+        l1=l1,
+    )
 
 @lru_cache()
 def get_auth_repository() -> FirebaseAuthRepository:
@@ -73,6 +138,31 @@ def get_update_user_use_case() -> UpdateUserUseCase:
     user_service = get_user_domain_service()
     return UpdateUserUseCase(user_service)
 
+@lru_cache()
+def get_verify_token_use_case() -> VerifyTokenUseCase:
+    """Get verify token use case instance"""
+    auth_service = get_auth_domain_service()
+    return VerifyTokenUseCase(auth_service)
+
+@lru_cache()
+def get_bulk_register_students_use_case() -> BulkRegisterStudentsUseCase:
+    """Get bulk register students use case instance"""
+    auth_service = get_auth_domain_service()
+    user_service = get_user_domain_service()
+    return BulkRegisterStudentsUseCase(auth_service, user_service)
+
+@lru_cache()
+def get_ingest_users_use_case() -> IngestUsersUseCase:
+    """Get ingest users use case instance"""
+    user_service = get_user_domain_service()
+    return IngestUsersUseCase(user_service)
+
+@lru_cache()
+def get_export_users_use_case() -> ExportUsersUseCase:
+    """Get export users use case instance"""
+    user_service = get_user_domain_service()
+    return ExportUsersUseCase(user_service)
+
 
 # Dependency functions for FastAPI
 
@@ -117,4 +207,41 @@ def refresh_token_use_case_dependency():
 
 def update_user_use_case_dependency():
     """Get update user use case instance"""
-    return get_update_user_use_case()
\ No newline at end of file
+    return get_update_user_use_case()
+
+def verify_token_use_case_dependency():
+    """Get verify token use case instance"""
+    return get_verify_token_use_case()
+
+def bulk_register_students_use_case_dependency():
+    """Get bulk register students use case instance"""
+    return get_bulk_register_students_use_case()
+
+def ingest_users_use_case_dependency():
+    """Get ingest users use case instance"""
+    return get_ingest_users_use_case()
+
+def export_users_use_case_dependency():
+    """Get export users use case instance"""
+    return get_export_users_use_case()
+
+# Unit of work
+async def unit_of_work_dependency() -> AsyncIterator[UnitOfWork]:
+    """Share one database session across every repository call of the request.
+
+    The route must `await unit_of_work.commit()` before building its response: this teardown
+    runs after the response is sent and only rolls back and releases what was not committed.
+    """
+    async with unit_of_work() as work:
+        yield work
+
+# Authentication
+async def verified_token_dependency(
+    authorization: Optional[str] = Header(None),
+    verify_token_use_case: VerifyTokenUseCase = Depends(verify_token_use_case_dependency)
+) -> VerifiedTokenDTO:
+    """Verify the Firebase ID token sent as `Authorization: Bearer <token>`"""
+    scheme, _, id_token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not id_token.strip():
+        raise FirebaseAuthException("Missing bearer token")
+    return await verify_token_use_case.execute(id_token.strip())
@@ -0,0 +1,59 @@
+from typing import Any, Mapping, Optional
+import orjson
+from fastapi.responses import Response, StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+from app.presentation.schemas.common_schema import envelope
+from app.shared.enums import ResponseCode
+
+
+class EnvelopeResponse(Response):
+    """StandardResponse envelope encoded straight to bytes with orjson.
+
+    `data` can be anything orjson serializes (the DTOs' to_dict() output, or the DTO dataclasses
+    themselves), so routes do not build StandardResponse or the response schema only to turn
+    them into dicts again. The status code defaults to the envelope code.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        data: Any = None,
+        message: str = "Success",
+        code: int = ResponseCode.SUCCESS,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        super().__init__(
+            content=envelope(data, message, code),
+            status_code=int(code) if status_code is None else status_code,
+            headers=headers,
+        )
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def prebuilt_json_response(body: bytes, status_code: int = 200) -> Response:
+    """Response for a JSON body encoded once up front (constant errors, health)"""
+    return Response(content=body, status_code=status_code, media_type=EnvelopeResponse.media_type)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse that can be sent while the request body is still being read.
+
+    On ASGI servers older than spec 2.4 (uvicorn included) StreamingResponse listens for
+    disconnects by reading `receive` itself, which would steal body chunks from a handler
+    that streams the request. Here the body iterator owns `receive`; a disconnect surfaces
+    as ClientDisconnect from `request.stream()` or as an OSError on send.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+        if self.background is not None:
+            await self.background()
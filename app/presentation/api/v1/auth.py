@@ -1,22 +1,28 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
 from app.application.dto.auth_dto import AuthDTO
 from app.presentation.schemas.auth_schema import (
     RegisterAuthRequest, 
     LoginRequest, 
     RefreshTokenRequest,
+    VerifyTokenRequest,
     AuthResponse,
     LoginResponse,
-    TokenResponse
+    TokenResponse,
+    VerifyTokenResponse
 )
 from app.presentation.schemas.common_schema import StandardResponse
+from app.presentation.api.request_body import json_body, json_body_openapi
+from app.presentation.api.responses import EnvelopeResponse
+from app.shared.enums import ResponseCode
 from app.application.use_cases.register_auth_user import RegisterAuthUserUseCase
 from app.application.use_cases.login_user import LoginUserUseCase
 from app.application.use_cases.refresh_token import RefreshTokenUseCase
+from app.application.use_cases.verify_token import VerifyTokenUseCase
 from app.presentation.api.dependencies import (
     register_auth_user_use_case_dependency,
     login_user_use_case_dependency,
-    refresh_token_use_case_dependency
+    refresh_token_use_case_dependency,
+    verify_token_use_case_dependency
 )
 import logging
 
@@ -36,28 +42,18 @@ async def register_auth_user(
     auth_request: RegisterAuthRequest,
     register_auth_use_case: RegisterAuthUserUseCase = Depends(register_auth_user_use_case_dependency)
 ):
-    logger.info(f"Registering user credentials for: {auth_request.email}")
-    
     # UseCase
     auth_dto_out: AuthDTO = await register_auth_use_case.execute(
         email=auth_request.email,
         password=auth_request.password
     )
 
-    # DTO -> Schema
-    auth_response = AuthResponse(
-        uid=auth_dto_out.uid,
-        email=auth_dto_out.email
-    )
-
-    logger.info(f"User credentials registered successfully: {auth_response.uid}")
-    
-    response = StandardResponse.created(
-        data=auth_response.dict(),
-        message="User credentials registered successfully"
+    # DTO -> wire (same fields as AuthResponse)
+    return EnvelopeResponse(
+        auth_dto_out,
+        "User credentials registered successfully",
+        code=ResponseCode.CREATED
     )
-    
-    return JSONResponse(status_code=status.HTTP_201_CREATED, content=response.dict())
 
 
 @router.post(
@@ -65,36 +61,21 @@ async def register_auth_user(
     response_model=StandardResponse[LoginResponse],
     status_code=status.HTTP_200_OK,
     summary="Login user",
-    description="Authenticate user and return access tokens"
+    description="Authenticate user and return access tokens",
+    openapi_extra=json_body_openapi(LoginRequest)
 )
 async def login_user(
-    login_request: LoginRequest,
+    login_request: LoginRequest = Depends(json_body(LoginRequest)),
     login_use_case: LoginUserUseCase = Depends(login_user_use_case_dependency)
 ):
-    logger.info(f"Logging in user: {login_request.email}")
-    
     # Execute use case
     login_dto = await login_use_case.execute(
         email=login_request.email,
         password=login_request.password
     )
     
-    # Map DTO -> Response Schema
-    login_response = LoginResponse(
-        uid=login_dto.uid,
-        email=login_dto.email,
-        id_token=login_dto.id_token,
-        refresh_token=login_dto.refresh_token
-    )
-    
-    logger.info(f"User logged in successfully: {login_response.uid}")
-    
-    response = StandardResponse.success(
-        data=login_response.dict(),
-        message="User logged in successfully"
-    )
-    
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response.dict())
+    # DTO -> wire (same fields as LoginResponse)
+    return EnvelopeResponse(login_dto, "User logged in successfully")
 
 
 @router.post(
@@ -102,30 +83,37 @@ async def login_user(
     response_model=StandardResponse[TokenResponse],
     status_code=status.HTTP_200_OK,
     summary="Refresh access token",
-    description="Refresh the user's access token using refresh token"
+    description="Refresh the user's access token using refresh token",
+    openapi_extra=json_body_openapi(RefreshTokenRequest)
 )
 async def refresh_token(
-    token_request: RefreshTokenRequest,
+    token_request: RefreshTokenRequest = Depends(json_body(RefreshTokenRequest)),
     refresh_token_use_case: RefreshTokenUseCase = Depends(refresh_token_use_case_dependency)
 ):
-    logger.info("Refreshing user token")
-    
     # Execute use case
     token_dto = await refresh_token_use_case.execute(
         refresh_token=token_request.refresh_token
     )
     
-    # Map DTO -> Response Schema
-    token_response = TokenResponse(
-        id_token=token_dto.id_token,
-        refresh_token=token_dto.refresh_token
-    )
-    
-    logger.info("Token refreshed successfully")
-    
-    response = StandardResponse.success(
-        data=token_response,
-        message="Token refreshed successfully"
+    # DTO -> wire (same fields as TokenResponse)
+    return EnvelopeResponse(token_dto, "Token refreshed successfully")
+
+
+@router.post(
+    "/verify",
+    response_model=StandardResponse[VerifyTokenResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Verify ID token",
+    description="Verify a Firebase ID token locally and return its claims"
+)
+async def verify_token(
+    verify_request: VerifyTokenRequest,
+    verify_token_use_case: VerifyTokenUseCase = Depends(verify_token_use_case_dependency)
+):
+    # Execute use case
+    verified_dto = await verify_token_use_case.execute(
+        id_token=verify_request.id_token
     )
-    
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response.dict())
\ No newline at end of file
+
+    # DTO -> wire (same fields as VerifyTokenResponse)
+    return EnvelopeResponse(verified_dto, "Token verified successfully")
\ No newline at end of file
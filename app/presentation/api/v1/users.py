@@ -1,36 +1,63 @@
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
+import orjson
+from typing import AsyncIterator, Literal, Optional
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from app.application.use_cases.bulk_register_students import BulkRegisterStudentsUseCase
+from app.application.use_cases.export_users import ExportUsersUseCase
+from app.application.use_cases.ingest_users import IngestUsersUseCase
 from app.application.use_cases.update_user_use_case import UpdateUserUseCase
-from app.presentation.schemas.user_schema import CreateUserRequest, UpdateUserRequest, UserResponse
+from app.presentation.schemas.user_schema import (
+    BatchGetUsersRequest,
+    BatchGetUsersResponse,
+    BulkRegisterRequest,
+    BulkRegisterResponse,
+    CreateUserRequest,
+    UpdateUserRequest,
+    UserPageResponse,
+    UserResponse
+)
 from app.presentation.schemas.common_schema import StandardResponse
 from app.application.use_cases.register_user import RegisterUserUseCase
 from app.application.use_cases.get_user import GetUserUseCase
 from app.presentation.api.dependencies import (
     register_user_use_case_dependency,
     get_user_use_case_dependency,
-    update_user_use_case_dependency
+    update_user_use_case_dependency,
+    bulk_register_students_use_case_dependency,
+    ingest_users_use_case_dependency,
+    export_users_use_case_dependency,
+    unit_of_work_dependency,
+    UnitOfWork
 )
-from app.application.dto.user_dto import CreateUserDTO, UpdateUserDTO
+from app.application.dto.user_dto import BulkStudentDTO, CreateUserDTO, IngestRowDTO, UpdateUserDTO
+from app.core.config import settings
+from app.presentation.api.request_body import json_body, json_body_openapi
+from app.presentation.api.responses import DuplexStreamingResponse, EnvelopeResponse
+from app.shared.enums import ResponseCode
+from app.shared.ndjson import iter_lines
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+_EXPORT_ROWS_PER_CHUNK = 100
+
 
 @router.post(
     "/",
-    response_model=StandardResponse,
+    response_model=StandardResponse[UserResponse],
     status_code=status.HTTP_201_CREATED,
     summary="Create a new user",
-    description="Create a new user account with the provided information"
+    description="Create a new user account with the provided information",
+    openapi_extra=json_body_openapi(CreateUserRequest)
 )
 async def create_user(
-    user_request: CreateUserRequest,
-    register_use_case: RegisterUserUseCase = Depends(register_user_use_case_dependency)
+    user_request: CreateUserRequest = Depends(json_body(CreateUserRequest)),
+    register_use_case: RegisterUserUseCase = Depends(register_user_use_case_dependency),
+    unit_of_work: UnitOfWork = Depends(unit_of_work_dependency)
 ):
-    logger.info(f"Creating user with UID: {user_request.uid}")
-
     # Convert request schema to DTO
     create_user_dto = CreateUserDTO(
         uid=user_request.uid,
@@ -41,29 +68,177 @@ async def create_user(
 
     # Execute use case
     user_response_dto = await register_use_case.execute(create_user_dto)
+    await unit_of_work.commit()
     
-    # DTO → Schema
-    user_response = UserResponse(
-        uid=user_response_dto.uid,
-        email=user_response_dto.email,
-        name=user_response_dto.name,
-        piano_level=user_response_dto.piano_level
-    )
-    
-    # Return standardized response
-    response = StandardResponse.created(
-        data=user_response.dict(),
-        message="User created successfully"
-    )
+    # DTO → wire (same fields as UserResponse)
+    return EnvelopeResponse(user_response_dto.to_dict(), "User created successfully", code=ResponseCode.CREATED)
 
-    logger.info(f"User created successfully: {user_request.uid}")
-    
-    return JSONResponse(status_code=status.HTTP_201_CREATED, content=response.dict())
+
+@router.post(
+    "/bulk",
+    response_model=StandardResponse[BulkRegisterResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Onboard a batch of students",
+    description="Create the Firebase accounts and user records of a batch of students, reporting the outcome of each row",
+    openapi_extra=json_body_openapi(BulkRegisterRequest)
+)
+async def bulk_create_users(
+    bulk_request: BulkRegisterRequest = Depends(json_body(BulkRegisterRequest)),
+    bulk_use_case: BulkRegisterStudentsUseCase = Depends(bulk_register_students_use_case_dependency)
+):
+    # Request → DTOs
+    students = [
+        BulkStudentDTO(
+            email=student.email,
+            password=student.password,
+            name=student.name,
+            piano_level=student.piano_level
+        ) for student in bulk_request.students
+    ]
+
+    result_dto = await bulk_use_case.execute(students)
+
+    # DTO → wire (same fields as BulkRegisterResponse)
+    return EnvelopeResponse(result_dto.to_dict(), f"{result_dto.succeeded} of {result_dto.total} students onboarded")
+
+
+@router.post(
+    "/ingest",
+    status_code=status.HTTP_200_OK,
+    summary="Stream user rows",
+    description=(
+        "Ingest an NDJSON body of users (one CreateUserRequest per line). "
+        "Rows are stored in batches and one NDJSON result per line is streamed back"
+    ),
+    response_class=DuplexStreamingResponse,
+    openapi_extra={
+        "requestBody": {"content": {"application/x-ndjson": {"schema": {"type": "string"}}}, "required": True}
+    }
+)
+async def ingest_users(
+    request: Request,
+    ingest_use_case: IngestUsersUseCase = Depends(ingest_users_use_case_dependency)
+):
+    logger.info("Starting user ingest stream")
+
+    async def results() -> AsyncIterator[bytes]:
+        async for result in ingest_use_case.execute(_parse_ingest_rows(request)):
+            yield orjson.dumps(result.to_dict()) + b"\n"
+
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+
+async def _parse_ingest_rows(request: Request) -> AsyncIterator[IngestRowDTO]:
+    """Parses the request body line by line into ingest rows"""
+    line_number = 0
+    async for line in iter_lines(request.stream(), settings.INGEST_MAX_LINE_BYTES):
+        line_number += 1
+        if line is None:
+            yield IngestRowDTO(line=line_number, error="Line too long")
+            continue
+        if not line.strip():
+            continue
+
+        try:
+            # Parsed and validated from the raw line in one pass
+            user_request = CreateUserRequest.model_validate_json(line)
+        except ValidationError as e:
+            yield IngestRowDTO(line=line_number, error=_format_line_errors(e))
+            continue
+
+        yield IngestRowDTO(
+            line=line_number,
+            user=CreateUserDTO(
+                uid=user_request.uid,
+                email=user_request.email,
+                name=user_request.name,
+                piano_level=user_request.piano_level
+            )
+        )
+
+
+def _format_line_errors(error: ValidationError) -> str:
+    messages = []
+    for err in error.errors(include_url=False):
+        if err["type"] == "model_type":
+            messages.append("Line must be a JSON object")
+        elif err["loc"]:
+            messages.append(f"{'.'.join(map(str, err['loc']))}: {err['msg']}")
+        else:
+            # Malformed JSON: the message already says so
+            messages.append(err["msg"])
+    return "; ".join(messages)
+
+
+@router.post(
+    "/batch-get",
+    response_model=StandardResponse[BatchGetUsersResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get several users by UID",
+    description="Retrieve up to BATCH_GET_MAX_UIDS users in one call, keyed by UID, listing the UIDs that do not exist"
+)
+async def batch_get_users(
+    batch_request: BatchGetUsersRequest,
+    get_user_use_case: GetUserUseCase = Depends(get_user_use_case_dependency)
+):
+    result_dto = await get_user_use_case.get_many(batch_request.uids)
+
+    # DTO → wire (same shape as StandardResponse[BatchGetUsersResponse])
+    return EnvelopeResponse(result_dto.to_dict(), "Users retrieved successfully")
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="Export all users",
+    description=(
+        "Stream every user ordered by UID, as NDJSON (default) or as a JSON array. "
+        "Rows are read from a server-side cursor on a dedicated connection"
+    ),
+    response_class=StreamingResponse
+)
+async def export_users(
+    format: Literal["ndjson", "json"] = Query("ndjson", description="Output format"),
+    export_use_case: ExportUsersUseCase = Depends(export_users_use_case_dependency)
+):
+    logger.info("Exporting users as %s", format)
+
+    rows = export_use_case.execute()
+    # Run the query before answering so that failures still get a proper status code
+    first = await anext(rows, None)
+
+    if format == "json":
+        return StreamingResponse(_serialize_export(first, rows, as_array=True), media_type="application/json")
+    return StreamingResponse(_serialize_export(first, rows, as_array=False), media_type="application/x-ndjson")
+
+
+async def _serialize_export(first: Optional[dict], rows: AsyncIterator[dict], as_array: bool) -> AsyncIterator[bytes]:
+    """Serializes rows as they arrive, sending them in chunks of _EXPORT_ROWS_PER_CHUNK"""
+    separator = b"," if as_array else b"\n"
+    if as_array:
+        yield b"["
+
+    if first is not None:
+        batch = [orjson.dumps(first)]
+        prefix = b""
+        async for row in rows:
+            batch.append(orjson.dumps(row))
+            if len(batch) >= _EXPORT_ROWS_PER_CHUNK:
+                yield prefix + separator.join(batch)
+                batch.clear()
+                prefix = separator
+        if batch:
+            yield prefix + separator.join(batch)
+        if not as_array:
+            yield b"\n"
+
+    if as_array:
+        yield b"]"
 
 
 @router.put(
     "/{uid}",
-    response_model=StandardResponse,
+    response_model=StandardResponse[UserResponse],
     status_code=status.HTTP_200_OK,
     summary="Update a user",
     description="Update an existing user by UID"
@@ -71,38 +246,24 @@ async def create_user(
 async def update_user(
     uid: str,
     update_request: UpdateUserRequest,
-    update_use_case: UpdateUserUseCase = Depends(update_user_use_case_dependency)
+    update_use_case: UpdateUserUseCase = Depends(update_user_use_case_dependency),
+    unit_of_work: UnitOfWork = Depends(unit_of_work_dependency)
 ):
-    logger.info(f"Request to update user with UID: {uid}")
-
     # Request → DTO
     update_dto = UpdateUserDTO(
         piano_level=update_request.piano_level
     )
 
     updated_user_dto = await update_use_case.execute(uid, update_dto)
+    await unit_of_work.commit()
 
-    # DTO → Schema
-    user_response = UserResponse(
-        uid=updated_user_dto.uid,
-        email=updated_user_dto.email,
-        name=updated_user_dto.name,
-        piano_level=updated_user_dto.piano_level
-    )
-
-    logger.info(f"User updated successfully: {uid}")
-
-    response = StandardResponse.success(
-        data=user_response.dict(),
-        message="User updated successfully"
-    )
-    
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response.dict())
+    # DTO → wire (same fields as UserResponse)
+    return EnvelopeResponse(updated_user_dto.to_dict(), "User updated successfully")
 
 
 @router.get(
     "/{uid}",
-    response_model=StandardResponse,
+    response_model=StandardResponse[UserResponse],
     status_code=status.HTTP_200_OK,
     summary="Get user by UID",
     description="Retrieve a single user by UID"
@@ -111,55 +272,25 @@ async def get_user_by_id(
     uid: str,
     get_user_use_case: GetUserUseCase = Depends(get_user_use_case_dependency)
 ):
-    logger.info(f"Fetching user with UID: {uid}")
-
     user_response_dto = await get_user_use_case.get_by_id(uid)
-    
-    # DTO → Schema
-    user_response = UserResponse(
-        uid=user_response_dto.uid,
-        email=user_response_dto.email,
-        name=user_response_dto.name,
-        piano_level=user_response_dto.piano_level
-    )
-    
-    logger.info(f"User fetched successfully: {uid}")
-    
-    response = StandardResponse.success(
-        data=user_response.dict(),
-        message="User retrieved successfully"
-    )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response.dict())
+
+    # DTO → wire (same shape as StandardResponse[UserResponse])
+    return EnvelopeResponse(user_response_dto.to_dict(), "User retrieved successfully")
    
 
 @router.get(
     "/",
-    response_model=StandardResponse,
+    response_model=StandardResponse[UserPageResponse],
     status_code=status.HTTP_200_OK,
-    summary="Get all users",
-    description="Retrieve all users in the system"
+    summary="List users",
+    description="Retrieve a page of users ordered by UID. Pass `next_cursor` back as `cursor` to get the next page"
 )
 async def get_all_users(
+    limit: int = Query(settings.USERS_PAGE_DEFAULT_LIMIT, ge=1, le=settings.USERS_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned by the previous page"),
     get_user_use_case: GetUserUseCase = Depends(get_user_use_case_dependency)
 ):
-    logger.info("Fetching all users")
-
-    users_response_dto = await get_user_use_case.get_all()
-
-    # DTOs → Schemas
-    users_response = [
-        UserResponse(
-            uid=user.uid,
-            email=user.email,
-            name=user.name,
-            piano_level=user.piano_level
-        ) for user in users_response_dto
-    ]
-    
-    logger.info(f"Retrieved {len(users_response_dto)} users successfully")
-    
-    response = StandardResponse.success(
-        data=[user.dict() for user in users_response],
-        message="All users retrieved successfully"
-    )
-    return JSONResponse(status_code=status.HTTP_200_OK, content=response.dict())
\ No newline at end of file
+    page_dto = await get_user_use_case.get_page(limit, cursor)
+
+    # DTO → wire (same shape as StandardResponse[UserPageResponse])
+    return EnvelopeResponse(page_dto.to_dict(), "Users retrieved successfully")
@@ -1,5 +1,5 @@
+import orjson
 from fastapi import Request
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from app.core.exceptions import (
     UserServiceException,
@@ -8,60 +8,63 @@ from app.core.exceptions import (
     UserNotFoundException,
     DatabaseConnectionException,
     FirebaseAuthException,
-    ValidationException
+    ValidationException,
+    ServiceUnavailableException
 )
-from app.presentation.schemas.common_schema import StandardResponse
+from app.presentation.api.responses import EnvelopeResponse, prebuilt_json_response
+from app.presentation.schemas.common_schema import envelope
+from app.shared.enums import ResponseCode
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Constant bodies are encoded once
+_UNEXPECTED_ERROR_BODY = orjson.dumps(
+    envelope(message="An unexpected error occurred", code=ResponseCode.INTERNAL_SERVER_ERROR)
+)
+
 async def user_service_exception_handler(request: Request, exc: UserServiceException):
-    logger.error(f"UserServiceException: {exc.message} - Code: {exc.code}")
-    response = StandardResponse.error(message=exc.message, code=exc.code)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.error("UserServiceException: %s - Code: %s", exc.message, exc.code)
+    return EnvelopeResponse(message=exc.message, code=exc.code)
 
 async def user_already_exists_exception_handler(request: Request, exc: UserAlreadyExistsException):
-    logger.warning(f"User already exists: {exc.message}")
-    response = StandardResponse.conflict(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.warning("User already exists: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.CONFLICT, status_code=int(exc.code))
 
 async def invalid_user_data_exception_handler(request: Request, exc: InvalidUserDataException):
-    logger.warning(f"Invalid user data: {exc.message}")
-    response = StandardResponse.validation_error(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.warning("Invalid user data: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.BAD_REQUEST, status_code=int(exc.code))
 
 async def user_not_found_exception_handler(request: Request, exc: UserNotFoundException):
-    logger.warning(f"User not found: {exc.message}")
-    response = StandardResponse.not_found(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.warning("User not found: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.NOT_FOUND, status_code=int(exc.code))
 
 async def database_connection_exception_handler(request: Request, exc: DatabaseConnectionException):
-    logger.error(f"Database connection error: {exc.message}")
-    response = StandardResponse.internal_error(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.error("Database connection error: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.INTERNAL_SERVER_ERROR, status_code=int(exc.code))
 
 async def firebase_auth_exception_handler(request: Request, exc: FirebaseAuthException):
-    logger.error(f"Firebase auth error: {exc.message}")
-    response = StandardResponse.unauthorized(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.error("Firebase auth error: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.UNAUTHORIZED, status_code=int(exc.code))
 
 async def validation_exception_handler(request: Request, exc: ValidationException):
-    logger.warning(f"Validation error: {exc.message}")
-    response = StandardResponse.validation_error(exc.message)
-    return JSONResponse(status_code=int(exc.code), content=response.dict())
+    logger.warning("Validation error: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.BAD_REQUEST, status_code=int(exc.code))
+
+async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableException):
+    logger.warning("Service unavailable: %s", exc.message)
+    return EnvelopeResponse(message=exc.message, code=ResponseCode.SERVICE_UNAVAILABLE, status_code=int(exc.code))
 
 async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
-    logger.warning(f"Request validation error: {exc.errors()}")
+    logger.warning("Request validation error: %s", exc.errors())
     error_messages = []
     for error in exc.errors():
         field = " -> ".join(str(loc) for loc in error["loc"])
         message = error["msg"]
         error_messages.append(f"{field}: {message}")
     formatted_message = "Validation errors: " + "; ".join(error_messages)
-    response = StandardResponse.validation_error(formatted_message)
-    return JSONResponse(status_code=422, content=response.dict())
+    return EnvelopeResponse(message=formatted_message, code=ResponseCode.BAD_REQUEST, status_code=422)
 
 async def general_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {type(exc).__name__}: {str(exc)}", exc_info=True)
-    response = StandardResponse.internal_error("An unexpected error occurred")
-    return JSONResponse(status_code=500, content=response.dict())
\ No newline at end of file
+    logger.error("Unhandled exception: %s: %s", type(exc).__name__, exc, exc_info=True)
+    return prebuilt_json_response(_UNEXPECTED_ERROR_BODY, status_code=500)
\ No newline at end of file
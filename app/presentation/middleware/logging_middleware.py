@@ -0,0 +1,23 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.logging import end_request_sampling, start_request_sampling
+
+
+class LogSamplingMiddleware:
+    """Gives each HTTP request its own log sampling decision (see app.core.logging.RequestSampling).
+
+    Plain ASGI middleware, so the handlers run in the same context and see the decision.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_request_sampling(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_request_sampling(token)
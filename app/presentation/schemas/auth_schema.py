@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field, EmailStr
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class RegisterAuthRequest(BaseModel):
@@ -6,13 +7,14 @@ class RegisterAuthRequest(BaseModel):
     email: EmailStr = Field(..., description="Email del usuario")
     password: str = Field(..., min_length=6, description="Contraseña del usuario")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "usuario@example.com",
                 "password": "strongpassword123"
             }
         }
+    )
 
 
 class LoginRequest(BaseModel):
@@ -20,25 +22,40 @@ class LoginRequest(BaseModel):
     email: EmailStr = Field(..., description="Email del usuario")
     password: str = Field(..., min_length=6, description="Contraseña del usuario")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "usuario@example.com",
                 "password": "strongpassword123"
             }
         }
+    )
 
 
 class RefreshTokenRequest(BaseModel):
     """Schema for refreshing token"""
     refresh_token: str = Field(..., description="Refresh token del usuario")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "refresh_token": "REFRESH_TOKEN_VALUE"
             }
         }
+    )
+
+
+class VerifyTokenRequest(BaseModel):
+    """Schema for verifying an ID token"""
+    id_token: str = Field(..., min_length=1, description="ID token de Firebase")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id_token": "ID_TOKEN_VALUE"
+            }
+        }
+    )
 
 
 class AuthResponse(BaseModel):
@@ -56,3 +73,10 @@ class LoginResponse(BaseModel):
 class TokenResponse(BaseModel):
     id_token: str
     refresh_token: str
+
+
+class VerifyTokenResponse(BaseModel):
+    uid: str
+    email: Optional[str] = None
+    expires_at: int
+    claims: dict
@@ -1,10 +1,16 @@
-from pydantic.generics import GenericModel
+from pydantic import BaseModel
 from typing import Optional, TypeVar, Generic
 from app.shared.enums import ResponseCode
 
 T = TypeVar("T")
 
-class StandardResponse(GenericModel, Generic[T]):
+
+def envelope(data=None, message: str = "Success", code: int = ResponseCode.SUCCESS) -> dict:
+    """StandardResponse as a plain dict, for routes that already hold their data as dicts"""
+    return {"code": int(code), "message": message, "data": data}
+
+
+class StandardResponse(BaseModel, Generic[T]):
     """Standard schema for all API responses"""
     code: int
     message: str
@@ -41,3 +47,7 @@ class StandardResponse(GenericModel, Generic[T]):
     @classmethod
     def internal_error(cls, message: str = "Internal server error"):
         return cls(code=int(ResponseCode.INTERNAL_SERVER_ERROR), message=message, data=None)
+
+    @classmethod
+    def service_unavailable(cls, message: str = "Service temporarily unavailable"):
+        return cls(code=int(ResponseCode.SERVICE_UNAVAILABLE), message=message, data=None)
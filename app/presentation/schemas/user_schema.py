@@ -1,5 +1,6 @@
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from app.core.config import settings
 from app.shared.enums import PianoLevel
 
 
@@ -10,37 +11,41 @@ class CreateUserRequest(BaseModel):
     name: str = Field(..., min_length=2, max_length=100, description="Full name ")
     piano_level: PianoLevel = Field(..., description="Piano level ")
 
-    @validator('email')
-    def validate_email(cls, v):
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "uid": "firebase_uid_123",
+                "email": "usuario@example.com",
+                "name": "Juan Pérez",
+                "piano_level": "teclado II"
+            }
+        }
+    )
+
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
         v = v.strip().lower()
         if '@' not in v or '.' not in v.split('@')[1]:
             raise ValueError('Invalid email format')
         return v
-    
-    @validator('name')
-    def validate_name(cls, v):
+
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
         v = v.strip()
         if not v:
             raise ValueError('Name cannot be empty')
         return v
-    
-    @validator('uid')
-    def validate_uid(cls, v):
+
+    @field_validator('uid')
+    @classmethod
+    def validate_uid(cls, v: str) -> str:
         v = v.strip()
         if not v:
             raise ValueError('UID cannot be empty')
         return v
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "uid": "firebase_uid_123",
-                "email": "usuario@example.com",
-                "name": "Juan Pérez",
-                "piano_level": "teclado II"
-            }
-        }
-
 class UserResponse(BaseModel):
     """Schema for user response"""
     uid: str
@@ -48,16 +53,108 @@ class UserResponse(BaseModel):
     name: str
     piano_level: str
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "uid": "firebase_uid_123",
                 "email": "usuario@example.com",
                 "name": "Juan Pérez",
-                "piano_level": "beginner"
+                "piano_level": "teclado II"
+            }
+        }
+    )
+
+
+class BatchGetUsersRequest(BaseModel):
+    """Schema for looking up several users by UID"""
+    uids: List[str] = Field(..., min_length=1, max_length=settings.BATCH_GET_MAX_UIDS, description="Firebase UIDs ")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "uids": ["firebase_uid_123", "firebase_uid_456"]
             }
         }
+    )
+
+
+class BatchGetUsersResponse(BaseModel):
+    """Schema for a batch lookup of users"""
+    users: Dict[str, UserResponse]
+    missing: List[str]
+
+
+class UserPageResponse(BaseModel):
+    """Schema for a page of users"""
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+
         
 class UpdateUserRequest(BaseModel):
     """Schema for updating a user"""
-    piano_level: Optional[PianoLevel] = Field(None, description="New piano level")
\ No newline at end of file
+    piano_level: Optional[PianoLevel] = Field(None, description="New piano level")
+
+
+class BulkStudentRequest(BaseModel):
+    """Schema for one student of a bulk onboarding"""
+    email: str = Field(..., min_length=5, max_length=255, description="Email ")
+    password: str = Field(..., min_length=6, description="Password ")
+    name: str = Field(..., min_length=2, max_length=100, description="Full name ")
+    piano_level: PianoLevel = Field(..., description="Piano level ")
+
+    @field_validator('email')
+    @classmethod
+    def validate_email(cls, v: str) -> str:
+        v = v.strip().lower()
+        if '@' not in v or '.' not in v.split('@')[1]:
+            raise ValueError('Invalid email format')
+        return v
+
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError('Name cannot be empty')
+        return v
+
+
+class BulkRegisterRequest(BaseModel):
+    """Schema for onboarding a batch of students"""
+    students: List[BulkStudentRequest] = Field(
+        ..., min_length=1, max_length=settings.BULK_IMPORT_MAX_ROWS, description="Students to onboard "
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "students": [
+                    {
+                        "email": "usuario@example.com",
+                        "password": "secret123",
+                        "name": "Juan Pérez",
+                        "piano_level": "teclado II"
+                    }
+                ]
+            }
+        }
+    )
+
+
+class BulkRowResult(BaseModel):
+    """Schema for the outcome of one row of a bulk onboarding"""
+    index: int
+    email: str
+    uid: Optional[str] = None
+    success: bool
+    error: Optional[str] = None
+
+
+class BulkRegisterResponse(BaseModel):
+    """Schema for the outcome of a bulk onboarding"""
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_seconds: float
+    rows_per_second: float
+    results: List[BulkRowResult]
\ No newline at end of file
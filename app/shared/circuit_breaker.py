@@ -0,0 +1,139 @@
+import time
+import logging
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+from app.core.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """Fails fast once the error rate of an upstream crosses a threshold.
+
+    closed -> open when the failure rate over the rolling window reaches the threshold,
+    open -> half_open after `open_seconds`, half_open -> closed on a successful probe
+    (or back to open on a failed one). Only exceptions in `failure_types` count as failures;
+    anything else (e.g. invalid credentials) means the upstream answered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_types: tuple[type[BaseException], ...],
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        window_seconds: float = 30.0,
+        open_seconds: float = 15.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_types = failure_types
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self._window: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+        # Metrics
+        self.rejected = 0
+        self.transitions: dict[str, int] = {}
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self._before_call()
+        try:
+            result = await fn()
+        except self.failure_types:
+            self._record(failed=True)
+            raise
+        except Exception:
+            self._record(failed=False)
+            raise
+        except BaseException:
+            # Cancelled: the upstream did not get a chance to answer
+            self._release_probe()
+            raise
+        self._record(failed=False)
+        return result
+
+    def stats(self) -> dict:
+        self._prune(time.monotonic())
+        calls = len(self._window)
+        failures = sum(1 for _, failed in self._window if failed)
+        return {
+            "state": self.state,
+            "calls_in_window": calls,
+            "failures_in_window": failures,
+            "failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "rejected": self.rejected,
+            "transitions": dict(self.transitions),
+        }
+
+    def _before_call(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                raise ServiceUnavailableException(f"{self.name} is unavailable, try again later")
+            self._transition(self.HALF_OPEN)
+
+        if self.state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                raise ServiceUnavailableException(f"{self.name} is unavailable, try again later")
+            self._half_open_calls += 1
+
+    def _record(self, failed: bool):
+        now = time.monotonic()
+
+        if self.state == self.HALF_OPEN:
+            self._release_probe()
+            if failed:
+                self._open(now)
+            else:
+                self._window.clear()
+                self._transition(self.CLOSED)
+            return
+
+        self._window.append((now, failed))
+        self._prune(now)
+        if failed and self.state == self.CLOSED and len(self._window) >= self.minimum_calls:
+            failures = sum(1 for _, f in self._window if f)
+            rate = failures / len(self._window)
+            if rate >= self.failure_rate_threshold:
+                logger.warning(
+                    f"Circuit breaker '{self.name}' tripped: failure rate {rate:.2f} "
+                    f"over {len(self._window)} calls"
+                )
+                self._open(now)
+
+    def _open(self, now: float):
+        self._opened_at = now
+        self._half_open_calls = 0
+        self._transition(self.OPEN)
+
+    def _release_probe(self):
+        if self.state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _prune(self, now: float):
+        while self._window and now - self._window[0][0] > self.window_seconds:
+            self._window.popleft()
+
+    def _transition(self, state: str):
+        if state == self.state:
+            return
+        key = f"{self.state}->{state}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        log = logger.warning if state == self.OPEN else logger.info
+        log(f"Circuit breaker '{self.name}' state changed: {key}")
+        self.state = state
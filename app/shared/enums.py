@@ -6,6 +6,9 @@ class PianoLevel(str, Enum):
     III = "teclado III"
     IV = "teclado IV"
 
+# Value -> member without going through the Enum constructor (hot read paths)
+PIANO_LEVELS_BY_VALUE = {level.value: level for level in PianoLevel}
+
 class ResponseCode(int, Enum):
     # 2xx Success codes
     SUCCESS = 200
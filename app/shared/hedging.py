@@ -0,0 +1,81 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class HedgedCall:
+    """Sends a backup copy of a slow call and keeps whichever answers first.
+
+    A hedge is only sent after `delay` seconds and only while the budget allows it:
+    every call earns `budget_ratio` tokens (capped at `max_tokens`) and every hedge
+    spends one, so hedges never exceed roughly `budget_ratio` extra upstream calls.
+    """
+
+    def __init__(self, delay: float, budget_ratio: float, max_tokens: float = 10.0):
+        self.delay = delay
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self._tokens = 0.0
+        self._latencies: deque[float] = deque(maxlen=1000)
+
+        # Metrics
+        self.calls = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        self._tokens = min(self._tokens + self.budget_ratio, self.max_tokens)
+        started_at = time.perf_counter()
+
+        primary = asyncio.ensure_future(fn())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay)
+            if not done:
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.hedges_sent += 1
+                    tasks.append(asyncio.ensure_future(fn()))
+                else:
+                    self.hedges_denied += 1
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedges_won += 1
+                        self._latencies.append(time.perf_counter() - started_at)
+                        return task.result()
+            # Every copy failed: surface the primary's error
+            raise primary.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 3)
+
+        return {
+            "delay_ms": round(self.delay * 1000, 3),
+            "budget_ratio": self.budget_ratio,
+            "calls": self.calls,
+            "hedges_sent": self.hedges_sent,
+            "hedges_won": self.hedges_won,
+            "hedges_denied": self.hedges_denied,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p95_ms": percentile(0.95),
+            "latency_p99_ms": percentile(0.99),
+        }
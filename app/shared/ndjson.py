@@ -0,0 +1,35 @@
+from typing import AsyncIterator, Optional
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Optional[bytes]]:
+    """Splits a byte stream into lines without buffering more than one line.
+
+    Yields None in place of a line longer than `max_line_bytes`; the rest of that line is discarded.
+    """
+    buffer = bytearray()
+    oversized = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        oversized = True
+                        buffer.clear()
+                break
+
+            if oversized:
+                yield None
+            else:
+                buffer += chunk[start:end]
+                yield None if len(buffer) > max_line_bytes else bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+
+    if oversized:
+        yield None
+    elif buffer:
+        yield bytes(buffer)
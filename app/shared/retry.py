@@ -0,0 +1,30 @@
+import asyncio
+import random
+import logging
+from typing import Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def retry_with_backoff(
+    fn: Callable[[], Awaitable[T]],
+    retry_on: tuple[type[BaseException], ...],
+    attempts: int = 3,
+    base_delay: float = 0.1,
+    max_delay: float = 1.0,
+) -> T:
+    """Calls `fn` up to `attempts` times, sleeping with full-jitter exponential backoff between tries.
+
+    Only use for idempotent operations.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await fn()
+        except retry_on as e:
+            if attempt == attempts:
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+            logger.info(f"Attempt {attempt}/{attempts} failed ({type(e).__name__}), retrying in {delay:.3f}s")
+            await asyncio.sleep(delay)
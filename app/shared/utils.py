@@ -1,9 +1,9 @@
 from app.core.exceptions import InvalidUserDataException
-from app.shared.enums import PianoLevel
+from app.shared.enums import PIANO_LEVELS_BY_VALUE
 
-# Convert string to enum, raises ValueError if invalid
+# Convert string to enum value, raises InvalidUserDataException if invalid
 def parse_piano_level(level_str: str) -> str:
-    try:
-        return PianoLevel(level_str).value
-    except ValueError:
+    level = PIANO_LEVELS_BY_VALUE.get(level_str)
+    if level is None:
         raise InvalidUserDataException("Valid piano level is required")
+    return level.value
@@ -0,0 +1,74 @@
+"""Benchmark of one POST /users/batch-get against N GET /users/{uid}, on a local MySQL.
+
+Requests go through the ASGI app in-process, so the numbers include routing, validation and
+serialization but no network. Uses the MYSQL_* environment variables of the service and creates
+(then removes) rows with a `bench-` UID prefix.
+
+    python -m benchmarks.batch_get --roster 40 --roster 200 --rounds 20
+"""
+import argparse
+import asyncio
+import time
+import httpx
+from sqlalchemy import delete, insert
+from app.infrastructure.database.models.user_model import UserModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.main import app
+from app.shared.enums import PianoLevel
+
+
+async def seed(prefix: str, count: int) -> list[str]:
+    uids = [f"{prefix}-{i}" for i in range(count)]
+    async with mysql_connection.get_async_session() as session:
+        await session.execute(insert(UserModel).values([
+            {"uid": uid, "email": f"{uid}@bench.local", "name": "Bench", "piano_level": PianoLevel.I.value}
+            for uid in uids
+        ]))
+        await session.commit()
+    return uids
+
+
+async def individual_gets(client: httpx.AsyncClient, uids: list[str]):
+    for uid in uids:
+        response = await client.get(f"/api/v1/users/{uid}")
+        response.raise_for_status()
+
+
+async def batch_get(client: httpx.AsyncClient, uids: list[str]):
+    response = await client.post("/api/v1/users/batch-get", json={"uids": uids})
+    response.raise_for_status()
+
+
+async def timed(label: str, rounds: int, operation) -> float:
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        await operation()
+    per_round = (time.perf_counter() - started_at) / rounds
+    print(f"{label:<32} {per_round * 1000:>9.2f} ms/roster")
+    return per_round
+
+
+async def main(rosters: list[int], rounds: int):
+    prefix = f"bench-{int(time.time())}"
+    try:
+        uids = await seed(prefix, max(rosters))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for size in rosters:
+                roster = uids[:size]
+                individual = await timed(f"{size} x GET /users/{{uid}}", rounds, lambda: individual_gets(client, roster))
+                batched = await timed(f"1 x POST /users/batch-get ({size})", rounds, lambda: batch_get(client, roster))
+                print(f"{'speedup':<32} {individual / batched:>9.1f}x\n")
+    finally:
+        async with mysql_connection.get_async_session() as session:
+            await session.execute(delete(UserModel).where(UserModel.uid.like(f"{prefix}-%")))
+            await session.commit()
+        await mysql_connection.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roster", type=int, action="append", help="Roster size (repeatable)")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.roster or [40, 200], args.rounds))
@@ -0,0 +1,110 @@
+"""Requests per second of GET /users/{uid} and GET /users with the previous and the current response encoding.
+
+Needs no database: the user use case reads from an in-memory repository, so the numbers cover
+routing, mapping and JSON encoding only. "legacy" routes rebuild the previous chain (response
+schema -> .dict() -> StandardResponse -> .dict() -> JSONResponse with the stdlib json) next to
+the real routes, which encode the DTOs with EnvelopeResponse. Requests go through the ASGI app
+in-process with httpx (in requirements.txt), so there is no network either.
+
+    python -m benchmarks.json_responses --requests 2000 --page-size 100
+"""
+import argparse
+import asyncio
+import logging
+import time
+import warnings
+import httpx
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+from app.application.use_cases.get_user import GetUserUseCase
+from app.domain.entities.user import User
+from app.domain.services.user_service import UserService
+from app.main import app
+from app.presentation.api.dependencies import get_user_use_case_dependency
+from app.presentation.schemas.common_schema import StandardResponse
+from app.presentation.schemas.user_schema import UserPageResponse, UserResponse
+from app.shared.enums import PianoLevel
+
+LEVELS = list(PianoLevel)
+
+# The previous chain relies on the pydantic v1 style .dict()
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+class InMemoryUserRepository:
+    """The two reads the benchmarked routes need, served from a sorted list"""
+
+    def __init__(self, count: int):
+        self.users = [
+            User(uid=f"bench-{i:06d}", email=f"bench-{i}@bench.local", name="Bench", piano_level=LEVELS[i % len(LEVELS)])
+            for i in range(count)
+        ]
+        self.by_uid = {user.uid: user for user in self.users}
+
+    async def get_user_by_uid(self, uid: str):
+        return self.by_uid.get(uid)
+
+    async def get_users_page(self, limit: int, after_uid=None):
+        start = 0 if after_uid is None else next(i for i, user in enumerate(self.users) if user.uid > after_uid)
+        return self.users[start:start + limit]
+
+
+legacy = APIRouter(prefix="/legacy/users")
+
+
+@legacy.get("/{uid}")
+async def legacy_get_user(uid: str, use_case: GetUserUseCase = Depends(get_user_use_case_dependency)):
+    dto = await use_case.get_by_id(uid)
+    user_response = UserResponse(uid=dto.uid, email=dto.email, name=dto.name, piano_level=dto.piano_level)
+    response = StandardResponse.success(data=user_response.dict(), message="User retrieved successfully")
+    return JSONResponse(status_code=200, content=response.dict())
+
+
+@legacy.get("/")
+async def legacy_get_users(limit: int = Query(20), use_case: GetUserUseCase = Depends(get_user_use_case_dependency)):
+    page = await use_case.get_page(limit)
+    page_response = UserPageResponse(
+        items=[
+            UserResponse(uid=user.uid, email=user.email, name=user.name, piano_level=user.piano_level)
+            for user in page.items
+        ],
+        next_cursor=page.next_cursor,
+    )
+    response = StandardResponse.success(data=page_response.dict(), message="Users retrieved successfully")
+    return JSONResponse(status_code=200, content=response.dict())
+
+
+async def timed(client: httpx.AsyncClient, label: str, url: str, requests: int):
+    expected = (await client.get(url)).json()  # warm up
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(url)
+        response.raise_for_status()
+    elapsed = time.perf_counter() - started_at
+    assert response.json() == expected
+    print(f"{label:<24} {requests / elapsed:>10.1f} req/s  {elapsed / requests * 1000:>7.3f} ms/req")
+
+
+async def main(requests: int, page_size: int):
+    repository = InMemoryUserRepository(max(page_size, 1) * 2)
+    use_case = GetUserUseCase(UserService(repository))
+    app.dependency_overrides[get_user_use_case_dependency] = lambda: use_case
+    app.include_router(legacy, prefix="/api/v1")
+
+    uid = repository.users[0].uid
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, prefix in (("legacy", "legacy/users"), ("current", "users")):
+            await timed(client, f"{label} GET /users/{{uid}}", f"/api/v1/{prefix}/{uid}", requests)
+        for label, prefix in (("legacy", "legacy/users"), ("current", "users")):
+            await timed(client, f"{label} GET /users", f"/api/v1/{prefix}/?limit={page_size}", requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+    # Per-request INFO logs would dominate the timings
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.requests, args.page_size))
@@ -0,0 +1,118 @@
+"""Log overhead per request of GET /users/{uid}, synchronous stdout handler versus the queued pipeline.
+
+Needs no database (same in-memory repository as benchmarks.json_responses). Log lines go to a
+sink that sleeps `--sink-delay-ms` per write, standing in for a slow log collector. Modes:
+
+- off: logging disabled, the baseline
+- sync: the previous setup, a StreamHandler with the text format writing from the event loop
+- queued: the current setup, DroppingQueueHandler + QueueListener + JSON + per-route sampling
+- unsampled: the current setup keeping every line
+
+    python -m benchmarks.logging_overhead --requests 2000 --sink-delay-ms 1
+"""
+import argparse
+import asyncio
+import logging
+import queue
+import time
+from logging.handlers import QueueListener
+import httpx
+from app.application.use_cases.get_user import GetUserUseCase
+from app.core.config import settings
+from app.core.logging import DroppingQueueHandler, JsonFormatter, RequestSamplingFilter
+from app.domain.services.user_service import UserService
+from app.main import app
+from app.presentation.api.dependencies import get_user_use_case_dependency
+from benchmarks.json_responses import InMemoryUserRepository
+
+
+class SlowSink:
+    """File-like object whose writes take `delay` seconds"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str):
+        self.writes += 1
+        time.sleep(self.delay)
+
+    def flush(self):
+        pass
+
+
+async def run(client: httpx.AsyncClient, url: str, requests: int) -> float:
+    await client.get(url)  # warm up
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(url)
+        response.raise_for_status()
+    return (time.perf_counter() - started_at) / requests
+
+
+async def queued(
+    client: httpx.AsyncClient, url: str, requests: int, sink_delay: float, baseline: float, label: str, note: str
+):
+    sink = SlowSink(sink_delay)
+    stream_handler = logging.StreamHandler(sink)
+    stream_handler.setFormatter(JsonFormatter())
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    sampling_filter = RequestSamplingFilter()
+    queue_handler.addFilter(sampling_filter)
+    listener = QueueListener(queue_handler.queue, stream_handler)
+    listener.start()
+    logging.getLogger().handlers = [queue_handler]
+    elapsed = await run(client, url, requests)
+    listener.stop()
+    print(
+        f"{label:<10} {elapsed * 1000:>8.3f} ms/req  +{(elapsed - baseline) * 1000:.3f} ms  "
+        f"{sink.writes} lines written, {sampling_filter.sampled_out} sampled out ({note}), "
+        f"{queue_handler.dropped} dropped"
+    )
+
+
+async def main(requests: int, sink_delay: float):
+    repository = InMemoryUserRepository(10)
+    use_case = GetUserUseCase(UserService(repository))
+    app.dependency_overrides[get_user_use_case_dependency] = lambda: use_case
+    url = f"/api/v1/users/{repository.users[0].uid}"
+    rate = settings.LOG_ROUTE_SAMPLE_RATES.get("GET /api/v1/users/{uid}", settings.LOG_SAMPLE_RATE)
+
+    root = logging.getLogger()
+    previous_handlers = root.handlers[:]
+    root.setLevel(logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        logging.disable(logging.CRITICAL)
+        baseline = await run(client, url, requests)
+        logging.disable(logging.NOTSET)
+        print(f"{'off':<10} {baseline * 1000:>8.3f} ms/req")
+
+        sink = SlowSink(sink_delay)
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+        root.handlers = [handler]
+        elapsed = await run(client, url, requests)
+        print(f"{'sync':<10} {elapsed * 1000:>8.3f} ms/req  +{(elapsed - baseline) * 1000:.3f} ms  {sink.writes} lines written")
+
+        await queued(client, url, requests, sink_delay, baseline, "queued", f"rate {rate}")
+
+        # Same pipeline with every line kept: the cost of the queue alone
+        route_rates, settings.LOG_ROUTE_SAMPLE_RATES = settings.LOG_ROUTE_SAMPLE_RATES, {}
+        sample_rate, settings.LOG_SAMPLE_RATE = settings.LOG_SAMPLE_RATE, 1.0
+        try:
+            await queued(client, url, requests, sink_delay, baseline, "unsampled", "rate 1.0")
+        finally:
+            settings.LOG_ROUTE_SAMPLE_RATES, settings.LOG_SAMPLE_RATE = route_rates, sample_rate
+
+    root.handlers = previous_handlers
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sink-delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.sink_delay_ms / 1000))
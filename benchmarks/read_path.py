@@ -0,0 +1,85 @@
+"""Per-row cost of the ORM read path versus the Core column read path against a local MySQL.
+
+Uses the MYSQL_* environment variables of the service and creates (then removes) rows with a
+`bench-` UID prefix. Each iteration reads the seeded rows in one query; the report divides the
+total time by the rows read.
+
+    python -m benchmarks.read_path --rows 1000 --iterations 50
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import delete, insert, select
+from app.domain.entities.user import User
+from app.infrastructure.database.models.user_model import UserModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.repositories.mysql_user_repository import MySQLUserRepository
+from app.shared.enums import PianoLevel
+
+LEVELS = list(PianoLevel)
+
+
+async def orm_read(prefix: str) -> list[User]:
+    """Previous path: hydrate UserModel instances, then copy them into User re-parsing PianoLevel"""
+    async with mysql_connection.get_async_session() as session:
+        result = await session.execute(select(UserModel).where(UserModel.uid.like(f"{prefix}-%")))
+        return [
+            User(uid=m.uid, email=m.email, name=m.name, piano_level=PianoLevel(m.piano_level))
+            for m in result.scalars()
+        ]
+
+
+async def core_read(prefix: str) -> list[User]:
+    """Current path: select the columns and build User from the row tuples"""
+    async with mysql_connection.get_async_session() as session:
+        result = await session.execute(
+            select(UserModel.uid, UserModel.email, UserModel.name, UserModel.piano_level)
+            .where(UserModel.uid.like(f"{prefix}-%"))
+        )
+        return [MySQLUserRepository._row_to_entity(row) for row in result]
+
+
+async def seed(prefix: str, count: int):
+    async with mysql_connection.get_async_session() as session:
+        await session.execute(insert(UserModel).values([
+            {
+                "uid": f"{prefix}-{i}",
+                "email": f"{prefix}-{i}@bench.local",
+                "name": "Bench",
+                "piano_level": LEVELS[i % len(LEVELS)].value,
+            }
+            for i in range(count)
+        ]))
+        await session.commit()
+
+
+async def timed(label: str, iterations: int, rows: int, read) -> None:
+    await read()  # warm up the pool and the statement cache
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        users = await read()
+        assert len(users) == rows
+    elapsed = time.perf_counter() - started_at
+    per_row = elapsed / (iterations * rows)
+    print(f"{label:<8} {iterations * rows / elapsed:>12.1f} rows/s  {per_row * 1_000_000:>8.2f} us/row")
+
+
+async def main(rows: int, iterations: int):
+    prefix = f"bench-{int(time.time())}"
+    try:
+        await seed(prefix, rows)
+        await timed("orm", iterations, rows, lambda: orm_read(prefix))
+        await timed("core", iterations, rows, lambda: core_read(prefix))
+    finally:
+        async with mysql_connection.get_async_session() as session:
+            await session.execute(delete(UserModel).where(UserModel.uid.like(f"{prefix}-%")))
+            await session.commit()
+        await mysql_connection.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.iterations))
@@ -0,0 +1,115 @@
+"""Validation cost per request body, previous schemas and path versus the current ones.
+
+Needs no database. "legacy" decodes the body with the stdlib json and validates the resulting
+dict (what FastAPI does for a body parameter) against copies of the previous schemas, which used
+pydantic v1 `@validator`s. "current" validates the raw bytes with the TypeAdapter that the
+`json_body` dependency uses. Bulk bodies carry `--students` rows.
+
+    python -m benchmarks.request_validation --iterations 20000 --students 100
+"""
+import argparse
+import json
+import time
+import warnings
+from typing import List
+from pydantic import BaseModel, Field, TypeAdapter, validator
+from app.presentation.schemas.auth_schema import LoginRequest, RefreshTokenRequest
+from app.presentation.schemas.user_schema import BulkRegisterRequest, CreateUserRequest
+from app.shared.enums import PianoLevel
+
+# The legacy schemas use the pydantic v1 style @validator
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+def _validate_email(v):
+    v = v.strip().lower()
+    if '@' not in v or '.' not in v.split('@')[1]:
+        raise ValueError('Invalid email format')
+    return v
+
+
+def _validate_not_empty(v):
+    v = v.strip()
+    if not v:
+        raise ValueError('Cannot be empty')
+    return v
+
+
+class LegacyCreateUserRequest(BaseModel):
+    uid: str = Field(..., min_length=1)
+    email: str = Field(..., min_length=5, max_length=255)
+    name: str = Field(..., min_length=2, max_length=100)
+    piano_level: PianoLevel
+
+    _email = validator('email', allow_reuse=True)(_validate_email)
+    _name = validator('name', allow_reuse=True)(_validate_not_empty)
+    _uid = validator('uid', allow_reuse=True)(_validate_not_empty)
+
+
+class LegacyBulkStudentRequest(BaseModel):
+    email: str = Field(..., min_length=5, max_length=255)
+    password: str = Field(..., min_length=6)
+    name: str = Field(..., min_length=2, max_length=100)
+    piano_level: PianoLevel
+
+    _email = validator('email', allow_reuse=True)(_validate_email)
+    _name = validator('name', allow_reuse=True)(_validate_not_empty)
+
+
+class LegacyBulkRegisterRequest(BaseModel):
+    students: List[LegacyBulkStudentRequest] = Field(..., min_length=1)
+
+
+def bodies(students: int) -> dict[str, tuple[bytes, type, type]]:
+    """name -> (body, legacy schema, current schema)"""
+    student = {"email": "Usuario@Example.com", "password": "secret123", "name": " Juan Pérez ", "piano_level": "teclado II"}
+    return {
+        "login": (
+            json.dumps({"email": "usuario@example.com", "password": "strongpassword123"}).encode(),
+            LoginRequest,
+            LoginRequest,
+        ),
+        "refresh-token": (
+            json.dumps({"refresh_token": "r" * 300}).encode(),
+            RefreshTokenRequest,
+            RefreshTokenRequest,
+        ),
+        "create user": (
+            json.dumps({"uid": "firebase_uid_123", **{k: v for k, v in student.items() if k != "password"}}).encode(),
+            LegacyCreateUserRequest,
+            CreateUserRequest,
+        ),
+        f"bulk ({students} rows)": (
+            json.dumps({"students": [student] * students}).encode(),
+            LegacyBulkRegisterRequest,
+            BulkRegisterRequest,
+        ),
+    }
+
+
+def timed(validate, body: bytes, iterations: int) -> float:
+    validate(body)  # warm up
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        validate(body)
+    return (time.perf_counter() - started_at) / iterations
+
+
+def main(iterations: int, students: int):
+    for name, (body, legacy_schema, current_schema) in bodies(students).items():
+        legacy_adapter = TypeAdapter(legacy_schema)
+        current_adapter = TypeAdapter(current_schema)
+        assert legacy_adapter.validate_python(json.loads(body)).model_dump() == current_adapter.validate_json(body).model_dump()
+
+        runs = max(iterations // (students if name.startswith("bulk") else 1), 1)
+        legacy = timed(lambda b: legacy_adapter.validate_python(json.loads(b)), body, runs)
+        current = timed(current_adapter.validate_json, body, runs)
+        print(f"{name:<18} legacy {legacy * 1_000_000:>9.2f} us  current {current * 1_000_000:>9.2f} us  x{legacy / current:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--students", type=int, default=100)
+    args = parser.parse_args()
+    main(args.iterations, args.students)
@@ -0,0 +1,102 @@
+"""Cost of mapping a page of User entities to the response body, previous chain versus current one.
+
+Needs no database: both chains start from the same list of User entities and stop at the encoded
+response body. Time is the best of `--iterations` runs; memory is the tracemalloc peak
+while one page is mapped and its result is alive.
+
+    python -m benchmarks.response_mapping --rows 1000 --iterations 50
+"""
+import argparse
+import json
+import time
+import tracemalloc
+import warnings
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from app.application.dto.user_dto import UserPageDTO, UserResponseDTO
+from app.domain.entities.user import User
+from app.presentation.api.responses import EnvelopeResponse
+from app.presentation.schemas.common_schema import StandardResponse
+from app.presentation.schemas.user_schema import UserPageResponse, UserResponse
+from app.shared.enums import PianoLevel
+from app.shared.utils import parse_piano_level
+
+LEVELS = list(PianoLevel)
+
+# The previous chain relies on the pydantic v1 style .dict()
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+class LegacyUserResponseDTO(BaseModel):
+    """The pydantic UserResponseDTO the previous chain went through"""
+    uid: str
+    email: str
+    name: str
+    piano_level: str
+
+
+def legacy_chain(users: list[User]) -> bytes:
+    """Previous path: pydantic DTO -> UserResponse -> .dict() -> StandardResponse -> .dict() -> JSONResponse"""
+    dtos = [
+        LegacyUserResponseDTO(
+            uid=user.uid,
+            email=user.email,
+            name=user.name,
+            piano_level=parse_piano_level(user.piano_level),
+        )
+        for user in users
+    ]
+    page_response = UserPageResponse(
+        items=[
+            UserResponse(uid=dto.uid, email=dto.email, name=dto.name, piano_level=dto.piano_level)
+            for dto in dtos
+        ],
+        next_cursor=None,
+    )
+    response = StandardResponse.success(data=page_response.dict(), message="Users retrieved successfully")
+    return JSONResponse(content=response.dict()).body
+
+
+def current_chain(users: list[User]) -> bytes:
+    """Current path: slotted DTO -> to_dict() -> EnvelopeResponse"""
+    page = UserPageDTO(items=[UserResponseDTO.from_entity(user) for user in users], next_cursor=None)
+    return EnvelopeResponse(page.to_dict(), "Users retrieved successfully").body
+
+
+def measure(label: str, chain, users: list[User], iterations: int):
+    assert json.loads(chain(users)) == json.loads(legacy_chain(users))
+
+    best = float("inf")
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        chain(users)
+        best = min(best, time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    body = chain(users)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del body
+
+    rows = len(users)
+    print(
+        f"{label:<8} {rows / best:>12.1f} rows/s  {best / rows * 1_000_000:>8.2f} us/row  "
+        f"{peak / rows:>8.1f} B/row peak"
+    )
+
+
+def main(rows: int, iterations: int):
+    users = [
+        User(uid=f"bench-{i}", email=f"bench-{i}@bench.local", name="Bench", piano_level=LEVELS[i % len(LEVELS)])
+        for i in range(rows)
+    ]
+    measure("legacy", legacy_chain, users, iterations)
+    measure("current", current_chain, users, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    main(args.rows, args.iterations)
@@ -0,0 +1,90 @@
+"""Before/after benchmark of the user update and delete paths against a local MySQL.
+
+Uses the MYSQL_* environment variables of the service and creates (then removes) rows with a
+`bench-` UID prefix.
+
+    python -m benchmarks.update_delete --iterations 500
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import delete, insert, select
+from app.infrastructure.database.models.user_model import UserModel
+from app.infrastructure.database.mysql_connection import mysql_connection
+from app.infrastructure.repositories.mysql_user_repository import MySQLUserRepository
+from app.shared.enums import PianoLevel
+
+LEVELS = list(PianoLevel)
+
+
+async def legacy_update(uid: str, level: PianoLevel):
+    """Previous path: service read, repository select, commit and refresh (three sessions)"""
+    async with mysql_connection.get_async_session() as session:
+        result = await session.execute(select(UserModel).where(UserModel.uid == uid))
+        result.scalar_one()
+    async with mysql_connection.get_async_session() as session:
+        result = await session.execute(select(UserModel).where(UserModel.uid == uid))
+        user_model = result.scalar_one()
+        user_model.piano_level = level.value
+        await session.commit()
+        await session.refresh(user_model)
+
+
+async def legacy_delete(uid: str):
+    """Previous path: select the row, then delete it through the ORM"""
+    async with mysql_connection.get_async_session() as session:
+        result = await session.execute(select(UserModel).where(UserModel.uid == uid))
+        user_model = result.scalar_one_or_none()
+        if user_model:
+            await session.delete(user_model)
+            await session.commit()
+
+
+async def seed(prefix: str, count: int) -> list[str]:
+    uids = [f"{prefix}-{i}" for i in range(count)]
+    async with mysql_connection.get_async_session() as session:
+        await session.execute(insert(UserModel).values([
+            {"uid": uid, "email": f"{uid}@bench.local", "name": "Bench", "piano_level": LEVELS[0].value}
+            for uid in uids
+        ]))
+        await session.commit()
+    return uids
+
+
+async def timed(label: str, uids: list[str], operation) -> None:
+    started_at = time.perf_counter()
+    for i, uid in enumerate(uids):
+        await operation(uid, i)
+    elapsed = time.perf_counter() - started_at
+    print(f"{label:<28} {len(uids) / elapsed:>10.1f} ops/s  {elapsed / len(uids) * 1000:>8.3f} ms/op")
+
+
+async def main(iterations: int):
+    repository = MySQLUserRepository()
+    prefix = f"bench-{int(time.time())}"
+    try:
+        uids = await seed(prefix, iterations)
+
+        await timed("update (select+refresh)", uids, lambda uid, i: legacy_update(uid, LEVELS[i % len(LEVELS)]))
+        await timed("update (single UPDATE)", uids, lambda uid, i: repository.update_user_fields(
+            uid, {"piano_level": LEVELS[i % len(LEVELS)]}
+        ))
+        await timed("update (UPDATE + re-read)", uids, lambda uid, i: repository.update_user_fields_returning(
+            uid, {"piano_level": LEVELS[i % len(LEVELS)]}
+        ))
+
+        half = len(uids) // 2
+        await timed("delete (select+delete)", uids[:half], lambda uid, i: legacy_delete(uid))
+        await timed("delete (single DELETE)", uids[half:], lambda uid, i: repository.delete_user(uid))
+    finally:
+        async with mysql_connection.get_async_session() as session:
+            await session.execute(delete(UserModel).where(UserModel.uid.like(f"{prefix}-%")))
+            await session.commit()
+        await mysql_connection.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
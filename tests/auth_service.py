@@ -1,13 +1,15 @@
 from app.domain.entities.auth import Auth
 from app.domain.entities.login import Login
 from app.domain.entities.token import Token
+from app.domain.entities.verified_token import VerifiedToken
 import pytest
 from unittest.mock import AsyncMock
 from app.core.exceptions import (
     UserAlreadyExistsException,
     InvalidUserDataException,
     UserNotFoundException,
-    FirebaseAuthException
+    FirebaseAuthException,
+    ServiceUnavailableException
 )
 from app.domain.services.auth_service import AuthService
 from app.domain.repositories.auth_repository import AuthRepository
@@ -154,6 +156,31 @@ class TestRegisterUser:
         mock_auth_repository.register_user.assert_not_awaited()
 
 
+    @pytest.mark.asyncio
+    async def test_register_user_when_firebase_is_saturated(
+        self,
+        auth_service,
+        mock_auth_repository
+    ):
+        """
+        Descripción: Registrar usuario cuando la cola del Admin SDK está llena
+        Condiciones: El repositorio rechaza la llamada por falta de capacidad
+        Resultado esperado: Excepción de servicio no disponible (no se convierte en error de autenticación)
+        """
+        # Arrange
+        email = "user@example.com"
+        password = "password123"
+        mock_auth_repository.register_user.side_effect = ServiceUnavailableException(
+            "Firebase Admin queue is full, try again later"
+        )
+
+        # Act & Assert
+        with pytest.raises(ServiceUnavailableException):
+            await auth_service.register_user(email, password)
+
+        mock_auth_repository.register_user.assert_awaited_once_with(email, password)
+
+
 class TestLogin:
     """Suite de pruebas para iniciar sesión"""
 
@@ -373,6 +400,79 @@ class TestRefreshToken:
         mock_auth_repository.refresh_token.assert_awaited_once_with(invalid_token)
 
 
+class TestVerifyIdToken:
+    """Suite de pruebas para verificar ID token"""
+
+    @pytest.mark.asyncio
+    async def test_verify_id_token_successfully(
+        self,
+        auth_service,
+        mock_auth_repository
+    ):
+        """
+        Descripción: Verificar ID token exitosamente
+        Condiciones: El token es válido y fue emitido por Firebase
+        Resultado esperado: Se retornan uid, correo y claims del token
+        """
+        # Arrange
+        id_token = "valid-id-token"
+        verified = VerifiedToken(
+            uid="test-uid-123",
+            email="test@example.com",
+            expires_at=1900000000,
+            claims={"sub": "test-uid-123"}
+        )
+        mock_auth_repository.verify_id_token.return_value = verified
+
+        # Act
+        result = await auth_service.verify_id_token(id_token)
+
+        # Assert
+        mock_auth_repository.verify_id_token.assert_awaited_once_with(id_token)
+        assert result.uid == verified.uid
+        assert result.email == verified.email
+
+
+    @pytest.mark.asyncio
+    async def test_verify_id_token_with_empty_token(
+        self,
+        auth_service,
+        mock_auth_repository
+    ):
+        """
+        Descripción: Verificar ID token vacío
+        Condiciones: El token no fue enviado o solo contiene espacios
+        Resultado esperado: Excepción de datos de usuario inválidos
+        """
+        # Act & Assert
+        with pytest.raises(InvalidUserDataException) as exc_info:
+            await auth_service.verify_id_token("   ")
+
+        assert "ID token is required" in str(exc_info.value)
+        mock_auth_repository.verify_id_token.assert_not_awaited()
+
+
+    @pytest.mark.asyncio
+    async def test_verify_id_token_with_invalid_token(
+        self,
+        auth_service,
+        mock_auth_repository
+    ):
+        """
+        Descripción: Verificar ID token inválido
+        Condiciones: El token expiró o su firma no corresponde a las llaves de Google
+        Resultado esperado: Excepción de autenticación de Firebase
+        """
+        # Arrange
+        mock_auth_repository.verify_id_token.side_effect = Exception("ID token has expired")
+
+        # Act & Assert
+        with pytest.raises(FirebaseAuthException) as exc_info:
+            await auth_service.verify_id_token("expired-token")
+
+        assert "ID token has expired" in str(exc_info.value)
+
+
 class TestValidateCredentials:
     """Suite de pruebas para validación de credenciales"""
 
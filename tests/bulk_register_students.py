@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.application.dto.user_dto import BulkStudentDTO
+from app.application.use_cases.bulk_register_students import BulkRegisterStudentsUseCase
+from app.domain.entities.bulk_import import BulkImportResult
+from app.domain.services.auth_service import AuthService
+from app.domain.services.user_service import UserService
+from app.shared.enums import PianoLevel
+
+
+class TestBulkRegisterStudents:
+    """Suite de pruebas para el alta masiva de estudiantes"""
+
+    @pytest.mark.asyncio
+    async def test_deletes_imported_accounts_on_unexpected_error(self):
+        """
+        Descripción: Falla inesperada al guardar las filas de Student
+        Condiciones: Firebase importa las cuentas y create_users_bulk lanza un error que no es UserServiceException
+        Resultado esperado: Las cuentas importadas se borran y sus filas se marcan como fallidas
+        """
+        auth_service = AsyncMock(spec=AuthService)
+        auth_service.import_users.return_value = [
+            BulkImportResult(index=0, email="a@example.com", uid="uid-a"),
+            BulkImportResult(index=1, email="b@example.com", error="Email already exists"),
+        ]
+        user_service = AsyncMock(spec=UserService)
+        user_service.create_users_bulk.side_effect = RuntimeError("Lost connection to MySQL server")
+        students = [
+            BulkStudentDTO(email=email, password="secret123", name="John Doe", piano_level=PianoLevel.I)
+            for email in ("a@example.com", "b@example.com")
+        ]
+
+        result = await BulkRegisterStudentsUseCase(auth_service, user_service).execute(students)
+
+        auth_service.delete_users.assert_awaited_once_with(["uid-a"])
+        assert result.succeeded == 0
+        assert [row.error for row in result.results] == ["Unexpected error", "Email already exists"]
@@ -0,0 +1,169 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from app.core.exceptions import ServiceUnavailableException
+from app.shared import circuit_breaker as circuit_breaker_module
+from app.shared.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UpstreamDown(Exception):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fixture que sustituye el reloj del circuit breaker"""
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker_module, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    """Fixture que proporciona un circuit breaker: abre con 50% de fallos sobre 4 llamadas"""
+    return CircuitBreaker(
+        "upstream",
+        failure_types=(UpstreamDown,),
+        failure_rate_threshold=0.5,
+        minimum_calls=4,
+        window_seconds=30.0,
+        open_seconds=15.0,
+    )
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise UpstreamDown()
+
+
+async def trip(breaker: CircuitBreaker):
+    for fn in (succeed, succeed, fail, fail):
+        try:
+            await breaker.call(fn)
+        except UpstreamDown:
+            pass
+
+
+class TestCircuitBreaker:
+    """Suite de pruebas para el circuit breaker"""
+
+    @pytest.mark.asyncio
+    async def test_opens_at_failure_rate_threshold(self, breaker):
+        """
+        Descripción: La tasa de fallos alcanza el umbral
+        Condiciones: 2 fallos de 4 llamadas, umbral 0.5 y mínimo 4 llamadas
+        Resultado esperado: Pasa a open y las llamadas siguientes se rechazan sin ejecutarse
+        """
+        await breaker.call(succeed)
+        with pytest.raises(UpstreamDown):
+            await breaker.call(fail)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        await trip(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(ServiceUnavailableException):
+            await breaker.call(succeed)
+        assert breaker.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_do_not_count_as_failures(self, breaker):
+        """
+        Descripción: El upstream responde con un error que no es de disponibilidad
+        Condiciones: Cuatro llamadas lanzan ValueError
+        Resultado esperado: El circuito sigue cerrado
+        """
+        async def rejected():
+            raise ValueError("invalid credentials")
+
+        for _ in range(4):
+            with pytest.raises(ValueError):
+                await breaker.call(rejected)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_after_open_seconds_and_closes_on_success(self, breaker, clock):
+        """
+        Descripción: Pasa open_seconds con el circuito abierto
+        Condiciones: La llamada de prueba tiene éxito
+        Resultado esperado: open -> half_open -> closed
+        """
+        await trip(breaker)
+        clock.now += 15.0
+
+        assert await breaker.call(succeed) == "ok"
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.transitions == {"closed->open": 1, "open->half_open": 1, "half_open->closed": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_opens_again(self, breaker, clock):
+        """
+        Descripción: La llamada de prueba en half_open falla
+        Condiciones: Ha pasado open_seconds
+        Resultado esperado: Vuelve a open y rechaza hasta el siguiente open_seconds
+        """
+        await trip(breaker)
+        clock.now += 15.0
+
+        with pytest.raises(UpstreamDown):
+            await breaker.call(fail)
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(ServiceUnavailableException):
+            await breaker.call(succeed)
+
+    @pytest.mark.asyncio
+    async def test_half_open_allows_one_probe(self, breaker, clock):
+        """
+        Descripción: Dos llamadas concurrentes en half_open
+        Condiciones: half_open_max_calls = 1 y la prueba sigue en curso
+        Resultado esperado: La segunda llamada se rechaza
+        """
+        await trip(breaker)
+        clock.now += 15.0
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "ok"
+
+        probe = asyncio.ensure_future(breaker.call(slow))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceUnavailableException):
+            await breaker.call(succeed)
+
+        release.set()
+        assert await probe == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_released(self, breaker, clock):
+        """
+        Descripción: Se cancela la llamada de prueba en half_open
+        Condiciones: La prueba no llegó a obtener respuesta
+        Resultado esperado: El circuito sigue en half_open y acepta una nueva prueba
+        """
+        await trip(breaker)
+        clock.now += 15.0
+
+        probe = asyncio.ensure_future(breaker.call(asyncio.Event().wait))
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+import time
+import pytest
+from app.infrastructure.firebase.admin_executor import FirebaseAdminExecutor
+
+
+@pytest.fixture
+def executor():
+    """Fixture que proporciona un executor de un solo hilo"""
+    executor = FirebaseAdminExecutor()
+    executor.max_workers = 1
+    yield executor
+    executor.shutdown()
+
+
+class TestFirebaseAdminExecutor:
+    """Suite de pruebas para el executor del Admin SDK"""
+
+    @pytest.mark.asyncio
+    async def test_started_call_finishes_past_start_timeout(self, executor):
+        """
+        Descripción: Una llamada ya iniciada supera start_timeout
+        Condiciones: La llamada tarda 0.3s y start_timeout es 0.05s
+        Resultado esperado: Se espera a la llamada y se devuelve su resultado
+        """
+        def create_user():
+            time.sleep(0.3)
+            return "uid-1"
+
+        assert await executor.run(create_user, start_timeout=0.05) == "uid-1"
+
+    @pytest.mark.asyncio
+    async def test_queued_call_is_abandoned_at_start_timeout(self, executor):
+        """
+        Descripción: Una llamada no llega a salir de la cola antes de start_timeout
+        Condiciones: El único hilo está ocupado
+        Resultado esperado: TimeoutError y la llamada nunca se ejecuta
+        """
+        release = threading.Event()
+        ran = []
+
+        blocker = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(TimeoutError):
+            await executor.run(ran.append, "queued", start_timeout=0.05)
+
+        release.set()
+        await blocker
+        executor.shutdown()
+        assert ran == []
+        assert executor.queued == 0
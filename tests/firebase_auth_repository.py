@@ -0,0 +1,80 @@
+import time
+import pytest
+from types import SimpleNamespace
+import firebase_admin.auth as firebase_auth
+from firebase_admin import exceptions as firebase_exceptions
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+from app.domain.entities.bulk_import import AccountCredentials
+from app.infrastructure.repositories.firebase_auth_repository import FirebaseAuthRepository
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Fixture que proporciona el repositorio con un hash barato y borrados registrados"""
+    monkeypatch.setattr(settings, "BULK_IMPORT_HASH_ROUNDS", 1)
+    deleted = []
+
+    def delete_users(uids):
+        deleted.extend(uids)
+        return SimpleNamespace(failure_count=0, errors=[])
+
+    monkeypatch.setattr(firebase_auth, "delete_users", delete_users)
+    repository = FirebaseAuthRepository()
+    repository.deleted = deleted
+    return repository
+
+
+@pytest.fixture
+def accounts():
+    """Fixture que proporciona dos cuentas a importar"""
+    return [
+        AccountCredentials(email="a@example.com", password="secret123", display_name="Ana"),
+        AccountCredentials(email="b@example.com", password="secret123", display_name="Beto"),
+    ]
+
+
+class TestImportUsers:
+    """Suite de pruebas para la importación masiva en Firebase"""
+
+    @pytest.mark.asyncio
+    async def test_unavailable_import_deletes_generated_uids(self, repository, accounts, monkeypatch):
+        """
+        Descripción: Firebase responde 503 a la importación
+        Condiciones: No se sabe qué cuentas llegaron a crearse
+        Resultado esperado: Se borran todos los UIDs generados y se propaga ServiceUnavailableException
+        """
+        imported = []
+
+        def import_users(records, hash_alg):
+            imported.extend(record.uid for record in records)
+            raise firebase_exceptions.UnavailableError("Service unavailable")
+
+        monkeypatch.setattr(firebase_auth, "import_users", import_users)
+
+        with pytest.raises(ServiceUnavailableException):
+            await repository.import_users(accounts)
+
+        assert len(imported) == 2
+        assert repository.deleted == imported
+
+    @pytest.mark.asyncio
+    async def test_started_import_past_deadline_returns_uids(self, repository, accounts, monkeypatch):
+        """
+        Descripción: La importación supera FIREBASE_IMPORT_TIMEOUT después de empezar
+        Condiciones: Deadline de 0.2s y una importación de 0.5s
+        Resultado esperado: Se devuelven los UIDs creados para que el llamador guarde o borre las cuentas
+        """
+        monkeypatch.setattr(settings, "FIREBASE_IMPORT_TIMEOUT", 0.2)
+
+        def import_users(records, hash_alg):
+            time.sleep(0.5)
+            return SimpleNamespace(errors=[SimpleNamespace(index=1, reason="EMAIL_EXISTS")])
+
+        monkeypatch.setattr(firebase_auth, "import_users", import_users)
+
+        results = await repository.import_users(accounts)
+
+        assert results[0].success and results[0].uid
+        assert results[1].error == "EMAIL_EXISTS" and results[1].uid is None
+        assert repository.deleted == []
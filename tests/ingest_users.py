@@ -0,0 +1,94 @@
+import asyncio
+import time
+import pytest
+from app.application.dto.user_dto import CreateUserDTO, IngestRowDTO
+from app.application.use_cases.ingest_users import IngestUsersUseCase
+from app.core.config import settings
+from app.shared.enums import PianoLevel
+
+
+class FakeUserService:
+    """Records the size of each flushed batch and when it was stored"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def create_users_bulk(self, users):
+        self.batches.append((len(users), time.monotonic()))
+        return {}
+
+
+def _row(line: int, uid: str) -> IngestRowDTO:
+    user = CreateUserDTO(uid=uid, email=f"{uid}@example.com", name="John Doe", piano_level=PianoLevel.I)
+    return IngestRowDTO(line=line, user=user)
+
+
+@pytest.fixture
+def flush_settings(monkeypatch):
+    monkeypatch.setattr(settings, "INGEST_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "INGEST_FLUSH_INTERVAL", 0.05)
+
+
+class TestIngestUsers:
+    """Suite de pruebas para la ingesta por lotes"""
+
+    @pytest.mark.asyncio
+    async def test_flushes_batch_when_upstream_pauses(self, flush_settings):
+        """
+        Descripción: El productor envía dos filas y se detiene
+        Condiciones: El lote no está lleno y no llegan más filas durante INGEST_FLUSH_INTERVAL
+        Resultado esperado: El lote se guarda y sus resultados se emiten sin esperar la siguiente fila
+        """
+        service = FakeUserService()
+        resume = asyncio.Event()
+
+        async def rows():
+            yield _row(1, "uid-1")
+            yield _row(2, "uid-2")
+            await resume.wait()
+            yield _row(3, "uid-3")
+
+        results = IngestUsersUseCase(service).execute(rows())
+        started_at = time.monotonic()
+        first = await asyncio.wait_for(anext(results), timeout=1)
+        second = await anext(results)
+
+        assert (first.line, second.line) == (1, 2)
+        assert [size for size, _ in service.batches] == [2]
+        assert service.batches[0][1] - started_at < 0.5
+
+        resume.set()
+        rest = [result async for result in results]
+        assert [result.line for result in rest] == [3]
+        assert [size for size, _ in service.batches] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_caps_batch_on_rejected_rows(self, flush_settings):
+        """
+        Descripción: Filas inválidas y duplicadas cuentan para el tamaño del lote
+        Condiciones: Llegan siete filas, la mayoría rechazadas antes del INSERT
+        Resultado esperado: Ningún lote supera INGEST_BATCH_SIZE filas
+        """
+        service = FakeUserService()
+        flushed = []
+        use_case = IngestUsersUseCase(service)
+        original_flush = use_case._flush
+
+        def recording_flush(batch):
+            flushed.append(len(batch))
+            return original_flush(batch)
+
+        use_case._flush = recording_flush
+
+        async def rows():
+            yield _row(1, "uid-1")
+            for line in range(2, 6):
+                yield IngestRowDTO(line=line, error="Invalid JSON")
+            yield _row(6, "uid-1")
+            yield _row(7, "uid-2")
+
+        results = [result async for result in use_case.execute(rows())]
+
+        assert [result.line for result in results] == list(range(1, 8))
+        assert all(size <= settings.INGEST_BATCH_SIZE for size in flushed)
+        assert sum(flushed) == 7
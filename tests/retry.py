@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import AsyncMock
+from app.shared.retry import retry_with_backoff
+
+
+class Transient(Exception):
+    pass
+
+
+class TestRetryWithBackoff:
+    """Suite de pruebas para los reintentos con backoff"""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """
+        Descripción: La operación falla dos veces y luego responde
+        Condiciones: 3 intentos, error reintentable
+        Resultado esperado: Se devuelve el resultado tras 3 llamadas
+        """
+        fn = AsyncMock(side_effect=[Transient(), Transient(), "ok"])
+
+        result = await retry_with_backoff(fn, retry_on=(Transient,), attempts=3, base_delay=0)
+
+        assert result == "ok"
+        assert fn.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_attempts(self):
+        """
+        Descripción: La operación falla siempre
+        Condiciones: 3 intentos, error reintentable
+        Resultado esperado: Exactamente 3 llamadas y se propaga el último error
+        """
+        fn = AsyncMock(side_effect=Transient())
+
+        with pytest.raises(Transient):
+            await retry_with_backoff(fn, retry_on=(Transient,), attempts=3, base_delay=0)
+
+        assert fn.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self):
+        """
+        Descripción: La operación lanza un error no reintentable
+        Condiciones: ValueError fuera de retry_on
+        Resultado esperado: Una sola llamada
+        """
+        fn = AsyncMock(side_effect=ValueError())
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(fn, retry_on=(Transient,), attempts=3, base_delay=0)
+
+        assert fn.await_count == 1
@@ -0,0 +1,182 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import OperationalError
+from app.core.exceptions import DatabaseConnectionException
+from app.infrastructure.database import unit_of_work as unit_of_work_module
+from app.infrastructure.database.unit_of_work import UnitOfWork, current_unit_of_work, unit_of_work
+from app.infrastructure.repositories.mysql_user_repository import MySQLUserRepository
+
+
+@pytest.fixture
+def session():
+    """Fixture que proporciona una sesión falsa"""
+    return AsyncMock()
+
+
+@pytest.fixture
+def session_factory(session):
+    """Fixture que proporciona una fábrica de sesiones que cuenta las aperturas"""
+    return MagicMock(return_value=session)
+
+
+@pytest.fixture
+def work(session_factory):
+    """Fixture que proporciona una unidad de trabajo"""
+    return UnitOfWork(session_factory)
+
+
+class TestUnitOfWork:
+    """Suite de pruebas para la unidad de trabajo"""
+
+    @pytest.mark.asyncio
+    async def test_session_is_opened_once_and_lazily(self, work, session_factory, session):
+        """
+        Descripción: La sesión se abre con la primera llamada y se reutiliza
+        Condiciones: Se pide la sesión dos veces
+        Resultado esperado: Una única apertura y la misma sesión
+        """
+        session_factory.assert_not_called()
+
+        assert work.session() is session
+        assert work.session() is session
+        session_factory.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_commit_runs_callbacks_in_order(self, work, session):
+        """
+        Descripción: Confirmar ejecuta los callbacks posteriores al commit
+        Condiciones: Dos callbacks registrados, el primero falla
+        Resultado esperado: Commit de la sesión, ambos callbacks ejecutados una vez y en orden
+        """
+        calls = []
+
+        async def failing():
+            calls.append("failing")
+            raise RuntimeError("cache down")
+
+        async def invalidate():
+            calls.append("invalidate")
+
+        work.session()
+        work.after_commit(failing)
+        work.after_commit(invalidate)
+        await work.commit()
+        await work.commit()
+
+        session.commit.assert_awaited()
+        assert calls == ["failing", "invalidate"]
+
+    @pytest.mark.asyncio
+    async def test_commit_without_session_runs_callbacks(self, work, session_factory):
+        """
+        Descripción: Confirmar sin haber abierto la sesión
+        Condiciones: Ninguna llamada al repositorio, un callback registrado
+        Resultado esperado: No se abre sesión y el callback se ejecuta
+        """
+        callback = AsyncMock()
+        work.after_commit(callback)
+
+        await work.commit()
+
+        session_factory.assert_not_called()
+        callback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_rolls_back_and_drops_callbacks(self, work, session):
+        """
+        Descripción: El commit falla en la base de datos
+        Condiciones: session.commit lanza un error de SQLAlchemy
+        Resultado esperado: Rollback, DatabaseConnectionException y ningún callback ejecutado
+        """
+        session.commit.side_effect = OperationalError("COMMIT", {}, Exception("gone away"))
+        callback = AsyncMock()
+        work.session()
+        work.after_commit(callback)
+
+        with pytest.raises(DatabaseConnectionException):
+            await work.commit()
+
+        session.rollback.assert_awaited_once()
+        session.commit.side_effect = None
+        await work.commit()
+        callback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rollback_drops_callbacks(self, work, session):
+        """
+        Descripción: Deshacer la unidad de trabajo
+        Condiciones: Un callback registrado antes del rollback
+        Resultado esperado: Rollback de la sesión y el callback no se ejecuta en el commit siguiente
+        """
+        callback = AsyncMock()
+        work.session()
+        work.after_commit(callback)
+
+        await work.rollback()
+        await work.commit()
+
+        session.rollback.assert_awaited_once()
+        callback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_session_once(self, work, session):
+        """
+        Descripción: Cerrar la unidad de trabajo
+        Condiciones: Sesión abierta y un callback sin confirmar
+        Resultado esperado: La sesión se cierra una vez y el callback se descarta
+        """
+        callback = AsyncMock()
+        work.session()
+        work.after_commit(callback)
+
+        await work.close()
+        await work.close()
+        await work.commit()
+
+        session.close.assert_awaited_once()
+        callback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_context_sets_current_and_closes(self, monkeypatch, session):
+        """
+        Descripción: El contexto unit_of_work() hace actual una unidad de trabajo
+        Condiciones: Se usa la sesión dentro del contexto
+        Resultado esperado: current_unit_of_work() la devuelve dentro, None fuera, y la sesión se cierra
+        """
+        monkeypatch.setattr(
+            unit_of_work_module, "mysql_connection", SimpleNamespace(get_async_session=lambda: session)
+        )
+
+        async with unit_of_work() as work:
+            assert current_unit_of_work() is work
+            work.session()
+
+        assert current_unit_of_work() is None
+        session.close.assert_awaited_once()
+
+
+class TestUpdateReturningInUnitOfWork:
+    """Suite de pruebas para update_user_fields_returning dentro de una unidad de trabajo"""
+
+    @pytest.mark.asyncio
+    async def test_not_found_keeps_earlier_writes(self, monkeypatch, session):
+        """
+        Descripción: Actualizar un usuario inexistente dentro de una unidad de trabajo
+        Condiciones: Una escritura anterior registró un callback; el UPDATE no encuentra filas
+        Resultado esperado: Devuelve None sin rollback y el callback se ejecuta al confirmar
+        """
+        monkeypatch.setattr(
+            unit_of_work_module, "mysql_connection", SimpleNamespace(get_async_session=lambda: session)
+        )
+        session.execute.return_value = SimpleNamespace(rowcount=0)
+        callback = AsyncMock()
+
+        async with unit_of_work() as work:
+            work.after_commit(callback)
+            result = await MySQLUserRepository().update_user_fields_returning("missing-uid", {"name": "Jane"})
+            await work.commit()
+
+        assert result is None
+        session.rollback.assert_not_awaited()
+        callback.assert_awaited_once()
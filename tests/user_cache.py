@@ -0,0 +1,284 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from app.domain.entities.user import User
+from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from app.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from app.shared import cache as cache_module
+from app.shared.cache import MISSING, TTLCache
+from app.shared.enums import PianoLevel
+from app.shared.single_flight import SingleFlight
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fixture que sustituye el reloj de TTLCache"""
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def valid_user():
+    """Fixture que proporciona un usuario válido"""
+    return User(uid="test-uid-123", email="test@example.com", name="John Doe", piano_level=PianoLevel.I)
+
+
+@pytest.fixture
+def inner():
+    """Fixture que proporciona el repositorio interno mock"""
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def repository(inner, clock):
+    """Fixture que proporciona el repositorio con cache en memoria"""
+    return CachedUserRepository(
+        inner, MemoryCacheBackend(max_size=100), ttl=30.0, negative_ttl=5.0, version_ttl=86400.0
+    )
+
+
+class TestCachedUserRepository:
+    """Suite de pruebas para la cache de perfiles"""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache(self, repository, inner, valid_user):
+        """
+        Descripción: Leer dos veces el mismo usuario
+        Condiciones: El usuario existe en el repositorio interno
+        Resultado esperado: Una sola carga, un fallo y un acierto
+        """
+        inner.get_users_by_uids.return_value = {valid_user.uid: valid_user}
+
+        assert await repository.get_user_by_uid(valid_user.uid) == valid_user
+        assert await repository.get_user_by_uid(valid_user.uid) == valid_user
+
+        inner.get_users_by_uids.assert_awaited_once()
+        assert (repository.hits, repository.misses, repository.negative_hits) == (1, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_for_negative_ttl(self, repository, inner, clock):
+        """
+        Descripción: Leer un UID inexistente
+        Condiciones: El repositorio interno no lo encuentra
+        Resultado esperado: La primera lectura es un fallo, no un acierto negativo; la segunda sí lo es
+        y la entrada caduca con negative_ttl
+        """
+        inner.get_users_by_uids.return_value = {}
+
+        assert await repository.get_user_by_uid("missing") is None
+        assert (repository.misses, repository.negative_hits) == (1, 0)
+
+        assert await repository.get_user_by_uid("missing") is None
+        assert (repository.hits, repository.negative_hits) == (1, 1)
+        inner.get_users_by_uids.assert_awaited_once()
+
+        clock.now += 5.0
+        assert await repository.get_user_by_uid("missing") is None
+        assert repository.misses == 2
+        assert inner.get_users_by_uids.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_profile(self, repository, inner, valid_user):
+        """
+        Descripción: Actualizar un usuario cacheado
+        Condiciones: El perfil está en cache
+        Resultado esperado: La siguiente lectura vuelve al repositorio interno y ve el cambio
+        """
+        inner.get_users_by_uids.return_value = {valid_user.uid: valid_user}
+        await repository.get_user_by_uid(valid_user.uid)
+
+        renamed = User(uid=valid_user.uid, email=valid_user.email, name="Jane Doe", piano_level=valid_user.piano_level)
+        inner.update_user.return_value = renamed
+        await repository.update_user(renamed)
+        inner.get_users_by_uids.return_value = {renamed.uid: renamed}
+
+        assert (await repository.get_user_by_uid(valid_user.uid)).name == "Jane Doe"
+        assert inner.get_users_by_uids.await_count == 2
+        assert repository.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_load_overlapping_write_is_not_served(self, repository, inner, valid_user):
+        """
+        Descripción: Una escritura ocurre mientras se carga el perfil
+        Condiciones: La invalidación llega entre la lectura de la versión y el guardado de la carga
+        Resultado esperado: La carga queda bajo la versión anterior y la lectura siguiente la descarta
+        """
+        async def load_during_write(uids):
+            await repository.update_user_fields(valid_user.uid, {"name": "Jane Doe"})
+            return {valid_user.uid: valid_user}
+
+        inner.get_users_by_uids.side_effect = load_during_write
+        await repository.get_user_by_uid(valid_user.uid)
+
+        inner.get_users_by_uids.side_effect = None
+        inner.get_users_by_uids.return_value = {valid_user.uid: valid_user}
+        await repository.get_user_by_uid(valid_user.uid)
+
+        assert repository.stale_versions == 1
+        assert inner.get_users_by_uids.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_keeps_not_found_for_negative_ttl(self, inner, clock):
+        """
+        Descripción: Un UID inexistente llega a la cache en proceso (L1)
+        Condiciones: TTL de L1 mayor que negative_ttl
+        Resultado esperado: La entrada negativa de L1 caduca con negative_ttl
+        """
+        l1 = TTLCache(max_size=100, ttl=60.0)
+        backend = MemoryCacheBackend(max_size=100)
+        await backend.set_many({"u:missing": {"v": 0, "u": None}}, ttl=5.0)
+        repository = CachedUserRepository(inner, backend, ttl=30.0, negative_ttl=5.0, version_ttl=86400.0, l1=l1)
+
+        assert await repository.get_user_by_uid("missing") is None
+        assert l1.get("missing") is None
+
+        clock.now += 5.0
+        assert l1.get("missing") is MISSING
+
+
+class TestTTLCache:
+    """Suite de pruebas para la cache en proceso"""
+
+    def test_entries_expire_and_are_counted(self, clock):
+        """
+        Descripción: Una entrada supera su TTL
+        Condiciones: TTL por defecto y TTL propio por entrada
+        Resultado esperado: Caducan a su tiempo y se cuentan aciertos, fallos y caducidades
+        """
+        cache = TTLCache(max_size=10, ttl=10.0)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=1.0)
+
+        clock.now += 1.0
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+
+        clock.now += 9.0
+        assert cache.get("a") is MISSING
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["expirations"] == 2
+
+    def test_least_recently_used_is_evicted(self, clock):
+        """
+        Descripción: La cache supera max_size
+        Condiciones: Se lee "a" antes de insertar "c"
+        Resultado esperado: Se expulsa "b", la menos usada
+        """
+        cache = TTLCache(max_size=2, ttl=10.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestMemoryCacheBackend:
+    """Suite de pruebas para el backend de cache en memoria"""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_bumps_version_and_drops_data(self, clock):
+        """
+        Descripción: Invalidar una clave versionada
+        Condiciones: Versión y datos guardados
+        Resultado esperado: La versión sube en uno y los datos desaparecen
+        """
+        backend = MemoryCacheBackend(max_size=10)
+        await backend.set_many({"v:a": 3, "u:a": {"v": 3, "u": None}}, ttl=10.0)
+
+        await backend.invalidate(version_keys=["v:a"], data_keys=["u:a"], version_ttl=100.0)
+
+        assert await backend.get_many(["v:a", "u:a"]) == [4, None]
+
+
+class TestSingleFlight:
+    """Suite de pruebas para la agrupación de llamadas concurrentes"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_flight(self):
+        """
+        Descripción: Varias llamadas concurrentes con la misma clave
+        Condiciones: La primera llamada sigue en curso
+        Resultado esperado: Una sola ejecución, el mismo resultado para todos y contadores correctos
+        """
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "value"
+
+        waiters = [asyncio.ensure_future(flights.do("key", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["value"] * 3
+        assert calls == 1
+        assert flights.stats() == {"in_flight": 0, "calls": 1, "coalesced": 2}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """
+        Descripción: Se cancela la llamada que inició la ejecución
+        Condiciones: Otra llamada espera el mismo resultado
+        Resultado esperado: La segunda recibe el resultado
+        """
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "value"
+
+        first = asyncio.ensure_future(flights.do("key", load))
+        second = asyncio.ensure_future(flights.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_forget_starts_a_new_flight(self):
+        """
+        Descripción: Olvidar una clave en curso
+        Condiciones: Una llamada sigue en curso al llamar forget
+        Resultado esperado: La siguiente llamada ejecuta de nuevo
+        """
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+
+        first = asyncio.ensure_future(flights.do("key", load))
+        await asyncio.sleep(0)
+        flights.forget("key")
+        second = asyncio.ensure_future(flights.do("key", load))
+        await asyncio.sleep(0)
+        release.set()
+
+        await asyncio.gather(first, second)
+        assert calls == 2
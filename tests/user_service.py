@@ -51,16 +51,14 @@ class TestCreateUser:
         Resultado esperado: Usuario correctamente guardado, se retornan uid, correo, nombre y nivel de teclado
         """
         # Arrange
-        mock_user_repository.user_exists_by_uid.return_value = False
-        mock_user_repository.user_exists_by_email.return_value = False
         mock_user_repository.create_user.return_value = valid_user
 
         # Act
         result = await user_service.create_user(valid_user)
 
         # Assert
-        mock_user_repository.user_exists_by_uid.assert_awaited_once_with(valid_user.uid)
-        mock_user_repository.user_exists_by_email.assert_awaited_once_with(valid_user.email)
+        mock_user_repository.user_exists_by_uid.assert_not_awaited()
+        mock_user_repository.user_exists_by_email.assert_not_awaited()
         mock_user_repository.create_user.assert_awaited_once()
         
         assert result.uid == valid_user.uid
@@ -82,15 +80,16 @@ class TestCreateUser:
         Resultado esperado: Excepción de usuario existente
         """
         # Arrange
-        mock_user_repository.user_exists_by_uid.return_value = True
+        mock_user_repository.create_user.side_effect = UserAlreadyExistsException(
+            f"User with UID {valid_user.uid} already exists"
+        )
 
         # Act & Assert
         with pytest.raises(UserAlreadyExistsException) as exc_info:
             await user_service.create_user(valid_user)
 
         assert f"User with UID {valid_user.uid} already exists" in str(exc_info.value)
-        mock_user_repository.user_exists_by_uid.assert_awaited_once()
-        mock_user_repository.create_user.assert_not_awaited()
+        mock_user_repository.create_user.assert_awaited_once()
 
 
     @pytest.mark.asyncio
@@ -106,16 +105,47 @@ class TestCreateUser:
         Resultado esperado: Excepción de usuario existente
         """
         # Arrange
-        mock_user_repository.user_exists_by_uid.return_value = False
-        mock_user_repository.user_exists_by_email.return_value = True
+        mock_user_repository.create_user.side_effect = UserAlreadyExistsException(
+            f"User with email {valid_user.email} already exists"
+        )
 
         # Act & Assert
         with pytest.raises(UserAlreadyExistsException) as exc_info:
             await user_service.create_user(valid_user)
 
         assert f"User with email {valid_user.email} already exists" in str(exc_info.value)
-        mock_user_repository.user_exists_by_email.assert_awaited_once()
-        mock_user_repository.create_user.assert_not_awaited()
+        mock_user_repository.create_user.assert_awaited_once()
+
+
+class TestCreateUsersBulk:
+    """Suite de pruebas para crear usuarios en lote"""
+
+    @pytest.mark.asyncio
+    async def test_create_users_bulk_normalizes_and_returns_rejected(
+        self,
+        user_service,
+        mock_user_repository
+    ):
+        """
+        Descripción: Crear usuarios en lote
+        Condiciones: Uno de los usuarios ya existe en la base de datos
+        Resultado esperado: Datos normalizados y se retorna el usuario rechazado con su error
+        """
+        # Arrange
+        users = [
+            User(uid="uid-1", email=" One@Example.com ", name=" Ana ", piano_level=PianoLevel.I),
+            User(uid="uid-2", email="two@example.com", name="Luis", piano_level=PianoLevel.I),
+        ]
+        mock_user_repository.create_users_bulk.return_value = {"uid-2": "User with email two@example.com already exists"}
+
+        # Act
+        result = await user_service.create_users_bulk(users)
+
+        # Assert
+        saved = mock_user_repository.create_users_bulk.await_args.args[0]
+        assert saved[0].email == "one@example.com"
+        assert saved[0].name == "Ana"
+        assert result == {"uid-2": "User with email two@example.com already exists"}
 
 
 class TestUpdateUser:
@@ -142,15 +172,16 @@ class TestUpdateUser:
             piano_level=PianoLevel.III
         )
         
-        mock_user_repository.get_user_by_uid.return_value = valid_user
-        mock_user_repository.update_user.return_value = updated_user
+        mock_user_repository.update_user_fields_returning.return_value = updated_user
 
         # Act
         result = await user_service.update_user(valid_user.uid, update_dto)
 
         # Assert
-        mock_user_repository.get_user_by_uid.assert_awaited_once_with(valid_user.uid)
-        mock_user_repository.update_user.assert_awaited_once()
+        mock_user_repository.get_user_by_uid.assert_not_awaited()
+        mock_user_repository.update_user_fields_returning.assert_awaited_once_with(
+            valid_user.uid, {"piano_level": PianoLevel.III}
+        )
         
         assert result.uid == valid_user.uid
         assert result.piano_level == PianoLevel.III
@@ -170,14 +201,14 @@ class TestUpdateUser:
         # Arrange
         uid = "nonexistent-uid"
         update_dto = UpdateUserDTO(piano_level=PianoLevel.II)
-        mock_user_repository.get_user_by_uid.return_value = None
+        mock_user_repository.update_user_fields_returning.return_value = None
 
         # Act & Assert
         with pytest.raises(InvalidUserDataException) as exc_info:
             await user_service.update_user(uid, update_dto)
 
         assert f"User with UID {uid} not found" in str(exc_info.value)
-        mock_user_repository.update_user.assert_not_awaited()
+        mock_user_repository.update_user_fields_returning.assert_awaited_once()
 
 
 class TestGetUserByUid:
@@ -231,6 +262,33 @@ class TestGetUserByUid:
         assert f"User with UID {uid} not found" in str(exc_info.value)
 
 
+class TestGetUsersByUids:
+    """Suite de pruebas para obtener varios usuarios por UID"""
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_uids_with_missing(
+        self,
+        user_service,
+        mock_user_repository,
+        valid_user
+    ):
+        """
+        Descripción: Obtener varios usuarios por uid
+        Condiciones: Uno de los uids existe, otro no existe y hay uids repetidos
+        Resultado esperado: Se consulta cada uid una sola vez, se retorna el usuario existente y el uid faltante
+        """
+        # Arrange
+        mock_user_repository.get_users_by_uids.return_value = {valid_user.uid: valid_user}
+
+        # Act
+        users, missing = await user_service.get_users_by_uids([valid_user.uid, "missing-uid", valid_user.uid])
+
+        # Assert
+        mock_user_repository.get_users_by_uids.assert_awaited_once_with([valid_user.uid, "missing-uid"])
+        assert users == {valid_user.uid: valid_user}
+        assert missing == ["missing-uid"]
+
+
 class TestGetAllUsers:
     """Suite de pruebas para obtener todos los usuarios"""
 
@@ -288,6 +346,59 @@ class TestGetAllUsers:
         assert len(result) == 0
 
 
+class TestGetUsersPage:
+    """Suite de pruebas para obtener usuarios paginados"""
+
+    @pytest.mark.asyncio
+    async def test_get_users_page_with_next_page(
+        self,
+        user_service,
+        mock_user_repository
+    ):
+        """
+        Descripción: Obtener una página de usuarios
+        Condiciones: Hay más usuarios que el tamaño de página
+        Resultado esperado: Se retornan `limit` usuarios y el uid del último para continuar
+        """
+        # Arrange
+        users = [
+            User(uid=f"uid{i}", email=f"user{i}@example.com", name=f"User {i}", piano_level=PianoLevel.I)
+            for i in range(3)
+        ]
+        mock_user_repository.get_users_page.return_value = users
+
+        # Act
+        result, next_uid = await user_service.get_users_page(2, "uid")
+
+        # Assert
+        mock_user_repository.get_users_page.assert_awaited_once_with(3, "uid")
+        assert [user.uid for user in result] == ["uid0", "uid1"]
+        assert next_uid == "uid1"
+
+
+    @pytest.mark.asyncio
+    async def test_get_users_page_last_page(
+        self,
+        user_service,
+        mock_user_repository
+    ):
+        """
+        Descripción: Obtener la última página de usuarios
+        Condiciones: Quedan menos usuarios que el tamaño de página
+        Resultado esperado: Se retornan los usuarios restantes y ningún uid para continuar
+        """
+        # Arrange
+        users = [User(uid="uid1", email="user1@example.com", name="User 1", piano_level=PianoLevel.I)]
+        mock_user_repository.get_users_page.return_value = users
+
+        # Act
+        result, next_uid = await user_service.get_users_page(2)
+
+        # Assert
+        assert len(result) == 1
+        assert next_uid is None
+
+
 class TestUserExists:
     """Suite de pruebas para verificar existencia de usuario"""
 